@@ -0,0 +1,107 @@
+import os
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from Model.model import Model
+from Model.solver import Solver
+from Model.solver_budget import SolverBudget
+from Model.solver_result import SolverResult
+from Model.solver_status import SolverStatus
+from Persistence.proof_cache import ProofCache
+
+
+class BatchSolver:
+    """
+    Solves many tasks without the GUI. The tasks are read from JSONL lines, one JSON object per line:
+    {"formula_set": [...], "consequence": "..."}, an optional "id" is copied to the result. The results are JSON
+    objects as well, in the order of the tasks.
+
+    The time limit of the tasks is best-effort: the Solver checks its budget between the steps, so a long single step
+    (for example the substitution of many variables into an axiom) can exceed it, and a solving process is never
+    killed.
+    """
+
+    @staticmethod
+    def solve_task(line: str, time_limit: float = None, backward: bool = False, cache_path: str = None) -> dict:
+        """
+        Solves one task of a JSONL line. An invalid task, or an error of the solving results in an INVALID result
+        with the error message, so one task can't stop the solving of the others.
+
+        Args:
+            line: JSON object of the task
+            time_limit: seconds the solving of the task may take (best-effort), None means no limit
+            backward: if True, the backward search is tried first
+            cache_path: path of the proof cache's database, None means no cache
+
+        Returns:
+            dictionary of the result: id, success flag, status, proof, number of steps, length of the proof, time
+            of the solving in seconds, the exhausted budget, statistics, whether the proof was cached, and the error
+            message of an invalid task
+        """
+        start = time.perf_counter()
+        task_id = None
+        error = ''
+        try:
+            task = json.loads(line)
+            if not isinstance(task, dict):
+                raise ValueError('The task must be a JSON object')
+            task_id = task.get('id')
+            model = Model(task['formula_set'], task['consequence'])
+            cache = None if cache_path is None else ProofCache(cache_path)
+            result = Solver.run(model, backward=backward, budget=SolverBudget(time_limit=time_limit), cache=cache,
+                                closure=False)
+        except (ValueError, KeyError, TypeError, OSError) as exception:
+            error = str(exception) or type(exception).__name__
+            result = SolverResult(SolverStatus.INVALID)
+        except Exception as exception:
+            error = type(exception).__name__ + ': ' + str(exception)
+            result = SolverResult(SolverStatus.INVALID)
+
+        return {
+            'id': task_id,
+            'success': result.proved,
+            'status': result.status.name,
+            'proof': result.proof,
+            'number_of_steps': result.number_of_steps,
+            'proof_length': len(result.proof),
+            'time': round(time.perf_counter() - start, 6),
+            'exhausted_budget': result.exhausted_budget,
+            'statistics': result.statistics.to_dict(),
+            'cached': result.cached,
+            'error': error,
+        }
+
+    @staticmethod
+    def solve_lines(lines, workers: int = 1, time_limit: float = None, backward: bool = False, cache_path: str = None):
+        """
+        Solves the tasks of the lines. The lines are read lazily, and at most twice as many tasks are solved at the
+        same time as the number of the workers, so the results can be streamed back in the order of the tasks.
+        The empty lines are skipped.
+
+        Args:
+            lines: iterable of JSONL lines, for example an opened file
+            workers: number of the processes, 1 means no parallel processes, None means the number of CPUs
+            time_limit: seconds the solving of one task may take (best-effort), None means no limit
+            backward: if True, the backward search is tried first
+            cache_path: path of the proof cache's database, None means no cache
+
+        Returns:
+            generator of the result dictionaries (see solve_task)
+        """
+        tasks = (line for line in lines if line.strip())
+        if workers is not None and workers <= 1:
+            for line in tasks:
+                yield BatchSolver.solve_task(line, time_limit, backward, cache_path)
+            return
+
+        window = 2 * (workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for line in tasks:
+                pending.append(executor.submit(BatchSolver.solve_task, line, time_limit, backward, cache_path))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
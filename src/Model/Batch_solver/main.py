@@ -0,0 +1,61 @@
+import argparse
+import json
+import logging
+import sys
+
+from Model.Batch_solver.batch_solver import BatchSolver
+
+
+def main() -> None:
+    """
+    Calls the BatchSolver.solve_lines function on the input lines, and writes it's results as JSONL lines
+    """
+    args = parse_args()
+    if args.log:
+        logging.basicConfig(stream=sys.stderr, level=logging.DEBUG, format='%(asctime)s %(name)s %(message)s')
+    input_file = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for result in BatchSolver.solve_lines(input_file, args.workers, args.timeout, args.backward,
+                                              args.cache):
+            output_file.write(json.dumps(result) + '\n')
+            output_file.flush()
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+def parse_args() -> argparse.ArgumentParser.parse_args:
+    """
+    Define argument specification and parse arguments for Batch solver tool
+
+    Returns:
+        Argument namespace
+    """
+    parser = argparse.ArgumentParser(
+        prog='Logic - Batch solver',
+        description='This tool solves logical tasks of a JSONL file, one {"formula_set": [...], "consequence": "..."} '
+                    'object per line, and writes the results as JSONL.'
+    )
+
+    parser.add_argument('-i', '--input', default='-',
+                        help='The JSONL file of the tasks, - means the standard input.')
+    parser.add_argument('-o', '--output', default='-',
+                        help='The results are written to this JSONL file, - means the standard output.')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='The tasks are solved by this number of processes.')
+    parser.add_argument('-t', '--timeout', type=float, default=None,
+                        help='The solving of one task may take this many seconds (best-effort).')
+    parser.add_argument('-b', '--backward', action='store_true',
+                        help='The backward search is tried first.')
+    parser.add_argument('-c', '--cache', default=None,
+                        help='The proofs are cached in this SQLite database file, and the cached proofs are reused.')
+    parser.add_argument('-l', '--log', action='store_true',
+                        help='The statistics of every solving are logged to the standard error.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+import sys
+import time
+import random
+import platform
+
+from Model.model import Model
+from Model.solver import Solver
+from Model.actions import Actions
+from Model.solver_budget import SolverBudget
+from Model.solver_status import SolverStatus
+from Model.formula import Formula
+from Model.formula_reader import FormulaReader
+from Model.Utils.utils import Utils
+from Model.Utils.formula_parser import FormulaParser
+from Model.Task_generator.task_generator import TaskGenerator
+from Model.Rules.modus_ponens import ModusPonens
+from Model.Rules.modus_tollens import ModusTollens
+from Model.Rules.modus_tollendo_ponens import ModusTollendoPonens
+from Model.Rules.modus_ponendo_tollens import ModusPonendoTollens
+from Model.Rules.conditional_syllogism import ConditionalSyllogism
+from Model.formula_in_steps_exception import FormulaInStepsException
+
+
+class Benchmark:
+    """
+    Performance benchmark of the Utils, the Rules, the Model and the Solver. The tasks are generated by the
+    TaskGenerator with a fixed seed, so the corpora are the same in every run. The size of a corpus is given by the
+    number of the hypotheses, the number of the variables and the depth of the formulas. The results are
+    dictionaries, that can be written to JSON, and compared between releases.
+    """
+
+    SIZES = [(1, 2, 0), (2, 2, 0), (2, 3, 0), (3, 3, 0), (4, 4, 0), (1, 2, 1), (2, 2, 1), (2, 2, 2)]
+    CONNECTIVES = ('~',) + Formula.BINARY_CONNECTIVES
+    VARIABLES = 'ABCDFGHJKLMWRTZU'
+    RULES = {'MP': ModusPonens(), 'MT': ModusTollens(), 'MTP': ModusTollendoPonens(), 'MPT': ModusPonendoTollens(),
+             'CS': ConditionalSyllogism()}
+
+    @staticmethod
+    def run(seed: int = 0,
+            number_of_tasks: int = 10,
+            sizes: list = None,
+            time_limit: float = 5.0,
+            repeat: int = 3) -> dict:
+        """
+        Runs the benchmark on the corpora of all sizes.
+
+        Args:
+            seed: seed of the task generation
+            number_of_tasks: number of the tasks in a corpus
+            sizes: list of (number of hypotheses, number of variables, depth) tuples, the default is SIZES, the
+                depth can be omitted, then it is 0
+            time_limit: seconds the solving of one task may take
+            repeat: the quick operations are measured this many times, the best time is reported
+
+        Returns:
+            dictionary of the environment, the parameters and the results of the corpora
+        """
+        if sizes is None:
+            sizes = Benchmark.SIZES
+        results = []
+        for size in sizes:
+            number_of_hypotheses, number_of_variables, depth = (tuple(size) + (0,))[:3]
+            tasks = Benchmark.generate_corpus(seed, number_of_tasks, number_of_hypotheses, number_of_variables, depth)
+            result = Benchmark.measure_corpus(tasks, time_limit, repeat)
+            result['hypotheses'] = number_of_hypotheses
+            result['variables'] = number_of_variables
+            result['depth'] = depth
+            results.append(result)
+        return {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'seed': seed,
+            'tasks': number_of_tasks,
+            'time_limit': time_limit,
+            'repeat': repeat,
+            'corpora': results,
+        }
+
+    @staticmethod
+    def generate_corpus(seed: int,
+                        number_of_tasks: int,
+                        number_of_hypotheses: int,
+                        number_of_variables: int,
+                        depth: int = 0) -> list:
+        """
+        Generates provable tasks with the TaskGenerator. The random generator is seeded with the seed and the size,
+        so a corpus does not depend on the other corpora. The formulas are bracketed, as the Model requires.
+        If the depth is positive, a random formula of that depth is substituted into every variable of a task, the
+        same formula into every occurrence, so the task stays provable.
+
+        Args:
+            seed: seed of the task generation
+            number_of_tasks: number of the tasks
+            number_of_hypotheses: number of the formulas in the formula sets
+            number_of_variables: number of the variables in the tasks
+            depth: depth of the formulas substituted into the variables, 0 means no substitution
+
+        Returns:
+            list of (formula set, consequence formula) tuples
+        """
+        state = random.getstate()
+        random.seed(str(seed) + '-' + str(number_of_hypotheses) + '-' + str(number_of_variables)
+                    + ('-' + str(depth) if depth > 0 else ''))
+        try:
+            variables = list(Benchmark.VARIABLES[:number_of_variables])
+            tasks = []
+            for _ in range(number_of_tasks):
+                formula_set, consequence_formula = TaskGenerator.generate_task(number_of_hypotheses, variables)
+                binding = {}
+                if depth > 0:
+                    binding = {variable: Benchmark.__generate_formula(variables, depth) for variable in variables}
+                formula_set = sorted({str(FormulaParser.parse(formula)[0].substitute(binding))
+                                      for formula in formula_set})
+                tasks.append((formula_set, str(FormulaParser.parse(consequence_formula)[0].substitute(binding))))
+            return tasks
+        finally:
+            random.setstate(state)
+
+    @staticmethod
+    def __generate_formula(variables: list, depth: int) -> Formula:
+        """
+        Generates a random formula of the variables. One of the members of a binary formula has the depth below the
+        formula's depth, the other one can be shallower.
+
+        Args:
+            variables: list of the variables
+            depth: depth of the formula, 0 means a variable
+
+        Returns:
+            the generated formula
+        """
+        if depth <= 0:
+            return Formula.variable(random.choice(variables))
+        connective = random.choice(Benchmark.CONNECTIVES)
+        deep = Benchmark.__generate_formula(variables, depth - 1)
+        if connective == '~':
+            return Formula.negation(deep)
+        shallow = Benchmark.__generate_formula(variables, random.randrange(depth))
+        if random.random() < 0.5:
+            return Formula.binary(connective, deep, shallow)
+        return Formula.binary(connective, shallow, deep)
+
+    @staticmethod
+    def measure_corpus(tasks: list, time_limit: float, repeat: int) -> dict:
+        """
+        Measures the operations on the tasks of a corpus.
+
+        Args:
+            tasks: list of (formula set, consequence formula) tuples
+            time_limit: seconds the solving of one task may take
+            repeat: the quick operations are measured this many times, the best time is reported
+
+        Returns:
+            dictionary of the operations' timings and the solver's results
+        """
+        formulas = [formula for formula_set, consequence in tasks for formula in formula_set + [consequence]]
+        pairs = [(first, second) for formula_set, consequence in tasks
+                 for first in formula_set + [consequence] for second in formula_set + [consequence]]
+
+        operations = {
+            'Utils.is_valid_formula': Benchmark.__measure(
+                lambda: [Utils.is_valid_formula(formula) for formula in formulas], len(formulas), repeat),
+            'FormulaReader.is_tautology': Benchmark.__measure(
+                lambda: [FormulaReader().is_tautology(formula) for formula in formulas], len(formulas), repeat),
+        }
+        for name, rule in Benchmark.RULES.items():
+            operations['Rule.rule.' + name] = Benchmark.__measure(
+                lambda: [rule.rule(first, second) for first, second in pairs], len(pairs), repeat)
+
+        models = [Model(formula_set, consequence) for formula_set, consequence in tasks]
+        number_of_steps = sum(len(model.formula_set) for model in models)
+        operations['Model.add_step'] = Benchmark.__measure(
+            lambda: [Benchmark.__add_hypotheses(model) for model in models], number_of_steps, 1)
+        operations['Model.get_hint'] = Benchmark.__measure(
+            lambda: [model.get_hint() for model in models], len(models), 1)
+
+        statuses = {}
+        solved = []
+        start = time.perf_counter()
+        for formula_set, consequence in tasks:
+            result = Solver.run(Model(formula_set, consequence), budget=SolverBudget(time_limit=time_limit),
+                                closure=False)
+            statuses[result.status.name] = statuses.get(result.status.name, 0) + 1
+            solved.append(result.number_of_steps)
+        elapsed = time.perf_counter() - start
+        operations['Solver.solve'] = Benchmark.__timing(elapsed, elapsed, len(tasks))
+
+        return {
+            'operations': operations,
+            'solver': {
+                'statuses': statuses,
+                'proved': statuses.get(SolverStatus.PROVED.name, 0),
+                'steps': sum(solved),
+            },
+        }
+
+    @staticmethod
+    def __add_hypotheses(model: Model) -> None:
+        """
+        Adds the hypotheses of the model to its steps, the steps added before are deleted first.
+        """
+        if len(model.steps) > 0:
+            model.delete_steps(0)
+        for formula in model.formula_set:
+            try:
+                model.add_step(formula, Actions.HYP)
+            except FormulaInStepsException:
+                pass
+
+    @staticmethod
+    def __measure(function, number_of_calls: int, repeat: int) -> dict:
+        """
+        Measures the function, the caches of the parsing and the truth tables are cleared before every
+        measurement, so the results of a measurement don't depend on the earlier ones.
+
+        Args:
+            function: function without params, that makes the calls
+            number_of_calls: number of the calls, that the function makes
+            repeat: number of the measurements
+
+        Returns:
+            dictionary of the timing (see __timing)
+        """
+        times = []
+        for _ in range(max(repeat, 1)):
+            FormulaParser.parse.cache_clear()
+            FormulaReader.truth_table.cache_clear()
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        return Benchmark.__timing(min(times), sum(times) / len(times), number_of_calls)
+
+    @staticmethod
+    def __timing(best: float, mean: float, number_of_calls: int) -> dict:
+        """
+        Returns:
+            dictionary of the number of the calls, the best and the mean total time in seconds, and the best time
+            of one call in microseconds
+        """
+        return {
+            'calls': number_of_calls,
+            'best_seconds': round(best, 6),
+            'mean_seconds': round(mean, 6),
+            'microseconds_per_call': round(best / number_of_calls * 1e6, 3) if number_of_calls else 0.0,
+        }
@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+
+from Model.Benchmark.benchmark import Benchmark
+
+
+def main() -> None:
+    """
+    Calls the Benchmark.run function, and writes it's results as JSON
+    """
+    args = parse_args()
+    sizes = None
+    if args.sizes:
+        sizes = [tuple(int(number) for number in size.split('x')) for size in args.sizes]
+    results = Benchmark.run(args.seed, args.tasks, sizes, args.timeout, args.repeat)
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        json.dump(results, output_file, indent=2)
+        output_file.write('\n')
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+def parse_args() -> argparse.ArgumentParser.parse_args:
+    """
+    Define argument specification and parse arguments for Benchmark tool
+
+    Returns:
+        Argument namespace
+    """
+    parser = argparse.ArgumentParser(
+        prog='Logic - Benchmark',
+        description='This tool measures the formula checking, the rules, the model and the solver on generated tasks, '
+                    'and writes the results as JSON.'
+    )
+
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='The tasks are generated with this seed, the same seed gives the same tasks.')
+    parser.add_argument('-n', '--tasks', type=int, default=10,
+                        help='Number of the tasks of one size.')
+    parser.add_argument('-z', '--sizes', nargs='+', default=None,
+                        help='Sizes of the tasks as HYPOTHESESxVARIABLES or HYPOTHESESxVARIABLESxDEPTH, '
+                             'for example: 1x2 2x3 2x2x1')
+    parser.add_argument('-t', '--timeout', type=float, default=5.0,
+                        help='The solving of one task may take this many seconds.')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='The quick operations are measured this many times, the best time is reported.')
+    parser.add_argument('-o', '--output', default='-',
+                        help='The results are written to this JSON file, - means the standard output.')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from Model.Rules.rule import Rule
+from Model.formula import Formula
 
 
 class ModusPonendoTollens(Rule):
@@ -21,35 +22,23 @@ class ModusPonendoTollens(Rule):
             result_formula is the resulting formula after applying modus ponendo tollens,
             or an empty string if unsuccessful.
         """
-        if not self._input_checker(implication_formula, formula_to_be_detached):
-            return False, ''
-        if not self._is_implication(implication_formula):
-            return False, ''
+        return self._rule_on_strings(implication_formula, formula_to_be_detached)
 
-        implication_formula = implication_formula.strip()
-        implication_formula = implication_formula.replace(' ', '')
-        implication_formula = implication_formula[1:-1]
-        reversed_implication_formula = implication_formula[::-1]
-
-        formula_to_be_detached = formula_to_be_detached.strip()
-        formula_to_be_detached = formula_to_be_detached.replace(' ', '')
-        reversed_formula_to_be_detached = formula_to_be_detached[::-1]
-
-        modus_ponendo_tollensed_formula = ''
-        for i in range(0, len(reversed_formula_to_be_detached)):
-            if reversed_formula_to_be_detached[i] == reversed_implication_formula[i]:
-                modus_ponendo_tollensed_formula += reversed_implication_formula[i]
-            else:
-                return False, ''
+    def apply(self, implication_formula: Formula, formula_to_be_detached: Formula) -> Formula | None:
+        """
+        Executes the Modus Ponendo Tollens rule on the structure of the formulas: both members of the implication
+        must be negations, and the formula to be detached must be the body of the consequent.
 
-        implication_position = reversed_implication_formula.find(modus_ponendo_tollensed_formula)
-        return_formula = reversed_implication_formula[implication_position + len(reversed_formula_to_be_detached):]
-        if return_formula[0] == '~' and return_formula[1] == '>' and return_formula[2] == '>':
-            return_formula = return_formula[3:]
-            return_formula = return_formula[::-1]
-            if return_formula[0] == '~':
-                return True, return_formula[1:]
-            else:
-                return False, ''
-        else:
-            return False, ''
+        Args:
+            implication_formula: the implication formula
+            formula_to_be_detached: the formula that will be detached
+        Returns:
+            The body of the implication's antecedent, or None if the rule is not applicable.
+        """
+        if implication_formula.connective != '>>':
+            return None
+        if implication_formula.left.connective != '~' or implication_formula.right.connective != '~':
+            return None
+        if implication_formula.right.left is not formula_to_be_detached:
+            return None
+        return implication_formula.left.left
@@ -1,4 +1,5 @@
 from Model.Rules.rule import Rule
+from Model.formula import Formula
 
 
 class ModusPonens(Rule):
@@ -20,29 +21,21 @@ class ModusPonens(Rule):
             success_flag is a boolean indicating whether the modus ponens was successful.
             result_formula is the resulting formula after applying modus ponens, or an empty string if unsuccessful.
         """
-        if not self._input_checker(implication_formula, formula_to_be_detached):
-            return False, ''
-        if not self._is_implication(implication_formula):
-            return False, ''
+        return self._rule_on_strings(implication_formula, formula_to_be_detached)
 
-        implication_formula = implication_formula.strip()
-        implication_formula = implication_formula.replace(' ', '')
-        implication_formula = implication_formula[1:-1]
-
-        formula_to_be_detached = formula_to_be_detached.strip()
-        formula_to_be_detached = formula_to_be_detached.replace(' ', '')
-
-        modus_ponensed_formula = ''
-        for i in range(0, len(formula_to_be_detached)):
-            if formula_to_be_detached[i] == implication_formula[i]:
-                modus_ponensed_formula += implication_formula[i]
-            else:
-                return False, ''
+    def apply(self, implication_formula: Formula, formula_to_be_detached: Formula) -> Formula | None:
+        """
+        Executes the Modus Ponens rule on the structure of the formulas: the implication's antecedent must be the
+        formula to be detached.
 
-        implication_position = implication_formula.find(modus_ponensed_formula)
-        return_formula = implication_formula[implication_position + len(formula_to_be_detached):]
-        if return_formula[0] == '>' and return_formula[1] == '>':
-            return_formula = return_formula[2:]
-            return True, return_formula
-        else:
-            return False, ''
+        Args:
+            implication_formula: the implication formula
+            formula_to_be_detached: the formula that will be detached
+        Returns:
+            The consequent of the implication, or None if the rule is not applicable.
+        """
+        if implication_formula.connective != '>>':
+            return None
+        if implication_formula.left is not formula_to_be_detached:
+            return None
+        return implication_formula.right
@@ -1,4 +1,5 @@
 from Model.Rules.rule import Rule
+from Model.formula import Formula
 
 
 class ModusTollendoPonens(Rule):
@@ -10,6 +11,7 @@ class ModusTollendoPonens(Rule):
 
     Methods:
         rule: execute Modus Tollendo Ponens rule if it's feasible
+        apply: execute Modus Tollendo Ponens rule on Formula objects
     """
     def rule(self, disjunction_formula: str, formula_to_be_detached: str) -> (bool, str):
         """
@@ -24,32 +26,21 @@ class ModusTollendoPonens(Rule):
             result_formula is the resulting formula after applying modus tollendo ponens, or an empty string if
              unsuccessful.
         """
-        if not self._input_checker(disjunction_formula, formula_to_be_detached):
-            return False, ''
-        if not self._contains_disjunction(disjunction_formula):
-            return False, ''
-        if not Rule.is_negation(formula_to_be_detached):
-            return False, ''
+        return self._rule_on_strings(disjunction_formula, formula_to_be_detached)
 
-        disjunction_formula = disjunction_formula.strip()
-        disjunction_formula = disjunction_formula.replace(' ', '')
-        disjunction_formula = disjunction_formula[1:-1]
-
-        formula_to_be_detached = formula_to_be_detached.strip()
-        formula_to_be_detached = formula_to_be_detached.replace(' ', '')
-        formula_to_be_detached = formula_to_be_detached[1:]
-
-        modus_ponendo_tollensed_formula = ''
-        for i in range(0, len(formula_to_be_detached)):
-            if formula_to_be_detached[i] == disjunction_formula[i]:
-                modus_ponendo_tollensed_formula += disjunction_formula[i]
-            else:
-                return False, ''
+    def apply(self, disjunction_formula: Formula, formula_to_be_detached: Formula) -> Formula | None:
+        """
+        Executes the Modus Tollendo Ponens rule on the structure of the formulas: the formula to be detached must be
+        the negation of the disjunction's first member.
 
-        implication_position = disjunction_formula.find(modus_ponendo_tollensed_formula)
-        return_formula = disjunction_formula[implication_position + len(formula_to_be_detached):]
-        if return_formula[0] == '|':
-            return_formula = return_formula[1:]
-            return True, return_formula
-        else:
-            return False, ''
+        Args:
+            disjunction_formula: the disjunction formula
+            formula_to_be_detached: the negated formula that will be detached
+        Returns:
+            The second member of the disjunction, or None if the rule is not applicable.
+        """
+        if disjunction_formula.connective != '|' or formula_to_be_detached.connective != '~':
+            return None
+        if disjunction_formula.left is not formula_to_be_detached.left:
+            return None
+        return disjunction_formula.right
@@ -1,4 +1,5 @@
 from Model.Rules.rule import Rule
+from Model.formula import Formula
 
 
 class ModusTollens(Rule):
@@ -20,34 +21,21 @@ class ModusTollens(Rule):
             success_flag is a boolean indicating whether the modus tollens was successful.
             result_formula is the resulting formula after applying modus ponens, or an empty string if unsuccessful.
         """
-        if not self._input_checker(implication_formula, formula_to_be_detached):
-            return False, ''
-        if not self.is_negation(formula_to_be_detached):
-            return False, ''
-        if not self._is_implication(implication_formula):
-            return False, ''
+        return self._rule_on_strings(implication_formula, formula_to_be_detached)
 
-        implication_formula = implication_formula.strip()
-        implication_formula = implication_formula.replace(' ', '')
-        implication_formula = implication_formula[1:-1]
-        reversed_implication_formula = implication_formula[::-1]
-
-        formula_to_be_detached = formula_to_be_detached.strip()
-        formula_to_be_detached = formula_to_be_detached.replace(' ', '')
-        formula_to_be_detached = formula_to_be_detached[1:]
-        reversed_formula_to_be_detached = formula_to_be_detached[::-1]
-
-        modus_tollens_formula = ''
-        for i in range(0, len(reversed_formula_to_be_detached)):
-            if reversed_implication_formula[i] == reversed_formula_to_be_detached[i]:
-                modus_tollens_formula += reversed_implication_formula[i]
-            else:
-                return False, ''
+    def apply(self, implication_formula: Formula, formula_to_be_detached: Formula) -> Formula | None:
+        """
+        Executes the Modus Tollens rule on the structure of the formulas: the formula to be detached must be the
+        negation of the implication's consequent.
 
-        implication_position = reversed_implication_formula.find(modus_tollens_formula)
-        return_formula = reversed_implication_formula[implication_position + len(reversed_formula_to_be_detached):]
-        if return_formula[0] == '>' and return_formula[1] == '>':
-            return_formula = return_formula[2:]
-            return True, '~' + (return_formula[::-1])
-        else:
-            return False, ''
+        Args:
+            implication_formula: the implication formula
+            formula_to_be_detached: the negated formula that will be detached
+        Returns:
+            The negation of the implication's antecedent, or None if the rule is not applicable.
+        """
+        if implication_formula.connective != '>>' or formula_to_be_detached.connective != '~':
+            return None
+        if implication_formula.right is not formula_to_be_detached.left:
+            return None
+        return Formula.negation(implication_formula.left)
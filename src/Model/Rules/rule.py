@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
 
 from Model.Utils.utils import Utils
+from Model.formula import Formula
 
 
 class Rule(ABC):
     """
     Abstract class contains abstract method rule. Contains other functions for syntax rules, that inherited from this
     class.
+    The syntax rules are executed on the structure of the formulas (Formula): the rules match the main connectives,
+    and compare the members of the formulas by identity, because the Formula objects are unique.
 
     """
 
@@ -106,6 +109,48 @@ class Rule(ABC):
                 return False
         return True
 
+    def _rule_on_strings(self,
+                         first_formula: str,
+                         second_formula: str,
+                         conditional_syllogism: bool = False) -> (bool, str):
+        """
+        Checks the input strings, parses them, and executes the apply function of the current rule.
+
+        Args:
+            first_formula: first logical formula of the rule
+            second_formula: second logical formula of the rule
+            conditional_syllogism: the input check is for the conditional syllogism rule
+
+        Returns:
+            Tuple of (success_flag, result_formula).
+            success_flag is a boolean indicating whether the current rule using was successful.
+            result_formula is the resulting formula without spaces, or an empty string if unsuccessful.
+        """
+        if not self._input_checker(first_formula, second_formula, conditional_syllogism=conditional_syllogism):
+            return False, ''
+        try:
+            result = self.apply(Formula.parse(first_formula), Formula.parse(second_formula))
+        except ValueError:
+            return False, ''
+        if result is None:
+            return False, ''
+        return True, result.compact()
+
+    @abstractmethod
+    def apply(self, first_formula: Formula, second_formula: Formula) -> Formula | None:
+        """
+        Function that will be overwritten, in the children classes. Executes the current rule on the structure of the
+        formulas.
+
+        Args:
+            first_formula: first formula of the rule (implication, or disjunction formula)
+            second_formula: second formula of the rule
+
+        Returns:
+            The resulting formula, or None if the rule is not applicable.
+        """
+        return None
+
     @staticmethod
     @abstractmethod
     def rule(implication_formula: str, formula_to_be_detached: str) -> (bool, str):
@@ -1,6 +1,6 @@
 import random
 
-from Model.formula_reader import FormulaReader
+from Model.sat_solver import SatSolver
 
 
 class TaskGenerator:
@@ -67,9 +67,8 @@ class TaskGenerator:
     @staticmethod
     def __task_is_provable(formula_set: list, consequence_formula: str) -> bool:
         """
-        Creates a conjunction chain of the formulas in formula set, and the negated consequence formula.
-        If this formula is negated, and the negated formula is tautology, according to logic, the consequence is
-        provable.
+        Decides whether the consequence formula follows from the formulas in formula set, with SatSolver: the task is
+        provable if there is no counter model.
 
         Returns:
             True if the task is provable
@@ -77,15 +76,8 @@ class TaskGenerator:
         """
         if not formula_set:
             return True
-        task = ''
-        for formula in formula_set:
-            task = task + formula
-            task = task + ' & '
 
-        task = '~(' + task + '(~' + consequence_formula + '))'
-
-        formula_reader = FormulaReader()
-        if formula_reader.is_tautology(task):
-            return True
-        else:
+        try:
+            return SatSolver.find_counter_model(formula_set, consequence_formula) is None
+        except ValueError:
             return False
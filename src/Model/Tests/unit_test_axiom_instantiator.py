@@ -0,0 +1,34 @@
+import unittest
+from Model.formula import Formula
+from Model.axiom_instantiator import AxiomInstantiator
+
+
+class UnitTestAxiomInstantiator(unittest.TestCase):
+    """
+    Unit testing Model.axiom_instantiator.py
+    """
+
+    def test_instantiate(self) -> None:
+        schemas = [Formula.parse('(A >> (B >> A))'), Formula.parse('((A & B) >> B)')]
+        substitutions = [Formula.parse('A'), Formula.parse('B'), Formula.parse('(A & B)')]
+        goal = Formula.parse('B')
+        context = (schemas, substitutions, {Formula.parse('(A & B)')}, {goal, Formula.negation(goal)}, False, False)
+        instances, generated, pruned = AxiomInstantiator.instantiate((0, 1, context))
+        self.assertEqual(generated, 3)
+        self.assertEqual(pruned, 0)
+        self.assertEqual(instances, [((1, 0), True), ((1, 1), True), ((1, 2), True)])
+
+        context = (schemas, substitutions, {Formula.parse('(A & B)')}, {goal, Formula.negation(goal)}, True, False)
+        instances, generated, pruned = AxiomInstantiator.instantiate((1, 0, context))
+        self.assertEqual(generated, 3)
+        self.assertEqual(instances, [((0, 1), True)])
+        self.assertEqual(pruned, 2)
+
+        context = (schemas, substitutions, {Formula.parse('(A & B)')}, {goal, Formula.negation(goal)}, True, True)
+        instances, generated, pruned = AxiomInstantiator.instantiate((1, 0, context))
+        self.assertEqual(instances, [((0, 0), False), ((0, 1), True), ((0, 2), False)])
+        self.assertEqual(pruned, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from Model.model import Model
+from Model.actions import Actions
+from Model.backward_chainer import BackwardChainer
+
+
+class UnitTestBackwardChainer(unittest.TestCase):
+    """
+    Unit test for Model.backward_chainer.BackwardChainer class
+    """
+
+    @staticmethod
+    def __model_with_hypotheses(formula_set: list, consequence_formula: str) -> Model:
+        model = Model(formula_set, consequence_formula)
+        for formula in model.formula_set:
+            model.add_step(formula, Actions.HYP)
+        return model
+
+    def test_prove(self) -> None:
+        """
+        Testing the backward search with the syntax rules and the axioms
+        """
+        model = self.__model_with_hypotheses(['(A >> B)', '(B >> C)', '(C >> D)', 'A'], 'D')
+        self.assertTrue(BackwardChainer.prove(model))
+        self.assertTrue(model.end)
+        self.assertEqual(model.steps[len(model.steps) - 1].formula, 'D')
+
+        model = self.__model_with_hypotheses(['(F >> K)', '(K >> A)', '~A'], '~F')
+        self.assertTrue(BackwardChainer.prove(model))
+        self.assertEqual(model.steps[len(model.steps) - 1].formula, '~F')
+        self.assertEqual(model.steps[len(model.steps) - 1].action, Actions.MT)
+
+        model = self.__model_with_hypotheses(['(A | B)', '~A'], 'B')
+        self.assertTrue(BackwardChainer.prove(model))
+        self.assertEqual(model.get_steps_string()[2], '3. B [MTP(1,2)]')
+
+        model = self.__model_with_hypotheses(['(A >> B)', '(B >> C)'], '(A >> C)')
+        self.assertTrue(BackwardChainer.prove(model))
+        self.assertEqual(model.get_steps_string()[2], '3. (A >> C) [CS(1,2)]')
+
+        model = self.__model_with_hypotheses(['A', 'B'], '(A & B)')
+        self.assertTrue(BackwardChainer.prove(model))
+        self.assertEqual(model.steps[len(model.steps) - 1].formula, '(A & B)')
+
+        model = self.__model_with_hypotheses(['(A & B)'], '(B & A)')
+        self.assertTrue(BackwardChainer.prove(model))
+        self.assertEqual(model.steps[len(model.steps) - 1].formula, '(B & A)')
+
+    def test_prove_fails(self) -> None:
+        """
+        Testing the backward search stops, when the consequence can't be proved
+        """
+        model = self.__model_with_hypotheses(['(A >> B)'], 'B')
+        self.assertFalse(BackwardChainer.prove(model))
+        self.assertFalse(model.end)
+        self.assertFalse(BackwardChainer.prove(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import unittest
+from unittest import mock
+from Model.solver import Solver
+from Model.Batch_solver.batch_solver import BatchSolver
+
+
+class UnitTestBatchSolver(unittest.TestCase):
+    """
+    Unit testing Model.Batch_solver.batch_solver.py
+    """
+
+    def test_solve_task(self) -> None:
+        result = BatchSolver.solve_task('{"id": "a", "formula_set": ["(A >> B)", "A"], "consequence": "B"}')
+        self.assertEqual(result['id'], 'a')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['status'], 'PROVED')
+        self.assertEqual(result['proof'], ['1. (A >> B) [HYP]', '2. A [HYP]', '3. B [MP(1,2)]'])
+        self.assertEqual(result['number_of_steps'], 3)
+        self.assertEqual(result['proof_length'], 3)
+        self.assertEqual(result['error'], '')
+        json.dumps(result)
+
+        result = BatchSolver.solve_task('{"formula_set": ["(A >> B)"], "consequence": "B"}')
+        self.assertFalse(result['success'])
+        self.assertEqual(result['status'], 'UNPROVABLE')
+
+        result = BatchSolver.solve_task('{"formula_set": ["(A & B)"], "consequence": "B"}', time_limit=0)
+        self.assertEqual(result['status'], 'BUDGET_EXHAUSTED')
+        self.assertEqual(result['exhausted_budget'], 'time')
+
+        for line in ('not json', '[]', '{"formula_set": ["A"]}', '{"formula_set": ["A >>"], "consequence": "A"}'):
+            result = BatchSolver.solve_task(line)
+            self.assertEqual(result['status'], 'INVALID')
+            self.assertNotEqual(result['error'], '')
+
+        with mock.patch.object(Solver, 'run', side_effect=IndexError('list index out of range')):
+            result = BatchSolver.solve_task('{"id": "b", "formula_set": ["A"], "consequence": "A"}')
+        self.assertEqual(result['id'], 'b')
+        self.assertEqual(result['status'], 'INVALID')
+        self.assertEqual(result['error'], 'IndexError: list index out of range')
+
+    def test_solve_lines(self) -> None:
+        lines = ['{"id": ' + str(index) + ', "formula_set": ["(A >> B)", "A"], "consequence": "B"}\n'
+                 for index in range(5)]
+        lines.insert(2, '\n')
+        for workers in (1, 2):
+            results = list(BatchSolver.solve_lines(lines, workers=workers))
+            self.assertEqual([result['id'] for result in results], [0, 1, 2, 3, 4])
+            self.assertTrue(all(result['success'] for result in results))
+
+        lines.insert(3, '{"id": "hypothesis", "formula_set": ["A"], "consequence": "A"}')
+        lines.insert(4, '{"id": "invalid", "formula_set": ["A >>"], "consequence": "A"}')
+        for workers in (1, 2):
+            results = list(BatchSolver.solve_lines(lines, workers=workers))
+            self.assertEqual([result['id'] for result in results], [0, 1, 'hypothesis', 'invalid', 2, 3, 4])
+            self.assertEqual([result['status'] for result in results], ['PROVED'] * 3 + ['INVALID'] + ['PROVED'] * 3)
+            self.assertEqual(results[2]['proof'], ['1. A [HYP]'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import random
+import unittest
+from Model.model import Model
+from Model.formula import Formula
+from Model.formula_reader import FormulaReader
+from Model.Benchmark.benchmark import Benchmark
+
+
+class UnitTestBenchmark(unittest.TestCase):
+    """
+    Unit testing Model.Benchmark.benchmark.py
+    """
+
+    def test_generate_corpus(self) -> None:
+        state = random.getstate()
+        tasks = Benchmark.generate_corpus(1, 3, 2, 3)
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(tasks, Benchmark.generate_corpus(1, 3, 2, 3))
+        self.assertEqual(len(tasks), 3)
+        for formula_set, consequence in tasks:
+            Model(formula_set, consequence)
+            for formula in formula_set + [consequence]:
+                self.assertTrue(set(formula) <= set('ABC()~&|> '))
+        self.assertEqual(Benchmark.generate_corpus(1, 3, 2, 3, 0), tasks)
+
+        deep_tasks = Benchmark.generate_corpus(1, 3, 2, 3, 2)
+        self.assertEqual(random.getstate(), state)
+        self.assertEqual(deep_tasks, Benchmark.generate_corpus(1, 3, 2, 3, 2))
+        for formula_set, consequence in deep_tasks:
+            Model(formula_set, consequence)
+            self.assertGreaterEqual(UnitTestBenchmark.__depth(Formula.parse(consequence)), 2)
+            premise = formula_set[0]
+            for formula in formula_set[1:]:
+                premise = '(' + premise + ' & ' + formula + ')'
+            self.assertTrue(FormulaReader().is_tautology('(' + premise + ' >> ' + consequence + ')'))
+
+    @staticmethod
+    def __depth(formula: Formula) -> int:
+        if formula.connective == '':
+            return 0
+        if formula.connective == '~':
+            return UnitTestBenchmark.__depth(formula.left) + 1
+        return max(UnitTestBenchmark.__depth(formula.left), UnitTestBenchmark.__depth(formula.right)) + 1
+
+    def test_run(self) -> None:
+        results = Benchmark.run(seed=2, number_of_tasks=2, sizes=[(1, 2), (1, 2, 1)], time_limit=1, repeat=1)
+        self.assertEqual(results['seed'], 2)
+        self.assertEqual(len(results['corpora']), 2)
+        self.assertEqual((results['corpora'][1]['hypotheses'], results['corpora'][1]['variables'],
+                          results['corpora'][1]['depth']), (1, 2, 1))
+        corpus = results['corpora'][0]
+        self.assertEqual((corpus['hypotheses'], corpus['variables'], corpus['depth']), (1, 2, 0))
+        for operation in ('Utils.is_valid_formula', 'FormulaReader.is_tautology', 'Rule.rule.MP', 'Rule.rule.MT',
+                          'Rule.rule.MTP', 'Rule.rule.MPT', 'Rule.rule.CS', 'Model.add_step', 'Model.get_hint',
+                          'Solver.solve'):
+            self.assertIn(operation, corpus['operations'])
+            self.assertGreaterEqual(corpus['operations'][operation]['best_seconds'], 0)
+        self.assertEqual(corpus['operations']['Solver.solve']['calls'], 2)
+        self.assertEqual(sum(corpus['solver']['statuses'].values()), 2)
+        json.dumps(results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from Model.formula import Formula
+from Model.Rules.modus_ponens import ModusPonens
+from Model.Rules.conditional_syllogism import ConditionalSyllogism
+
+
+class UnitTestFormula(unittest.TestCase):
+    """
+    Unit test for Model.formula.Formula class
+    """
+
+    def test_parse(self) -> None:
+        """
+        Testing parsing, the string representations and the structure of the formulas
+        """
+        formula = Formula.parse('((A >> B) >> ~(A | B))')
+        self.assertEqual(str(formula), '((A >> B) >> ~(A | B))')
+        self.assertEqual(formula.compact(), '((A>>B)>>~(A|B))')
+        self.assertEqual(formula.connective, '>>')
+        self.assertTrue(formula.is_implication())
+        self.assertTrue(formula.right.is_negation())
+        self.assertTrue(formula.right.left.is_disjunction())
+        self.assertEqual(formula.variables, ('A', 'B'))
+        self.assertEqual(str(Formula.parse('(A&(B|~C))')), '(A & (B | ~C))')
+
+        with self.assertRaises(ValueError):
+            Formula.parse('')
+        with self.assertRaises(ValueError):
+            Formula.parse('A >> B')
+        with self.assertRaises(ValueError):
+            Formula.parse('((A >> B))')
+        with self.assertRaises(ValueError):
+            Formula.parse('(A >> B')
+        with self.assertRaises(ValueError):
+            Formula.parse('(a >> b)')
+        with self.assertRaises(ValueError):
+            Formula.parse(1)
+
+    def test_interning(self) -> None:
+        """
+        Testing that every distinct formula has exactly one instance, and the instances are immutable
+        """
+        formula = Formula.parse('((A >> B) >> ~(A | B))')
+        self.assertIs(formula, Formula.parse('((A>>B)>>~(A|B))'))
+        self.assertIs(formula.left, Formula.parse('(A >> B)'))
+        self.assertIs(formula.left, Formula.binary('>>', Formula.variable('A'), Formula.variable('B')))
+        self.assertIs(formula.right, Formula.negation(Formula.parse('(A | B)')))
+        self.assertIsNot(Formula.parse('(A >> B)'), Formula.parse('(B >> A)'))
+        with self.assertRaises(AttributeError):
+            formula.left = None
+
+    def test_subformulas(self) -> None:
+        """
+        Testing collecting the subformulas
+        """
+        formula = Formula.parse('((A >> B) >> ~(A >> B))')
+        self.assertEqual([str(subformula) for subformula in formula.subformulas()],
+                         ['A', 'B', '(A >> B)', '~(A >> B)', '((A >> B) >> ~(A >> B))'])
+
+    def test_match(self) -> None:
+        """
+        Testing matching formulas to a schema
+        """
+        schema = Formula.parse('(A >> (B >> A))')
+        binding = {}
+        self.assertTrue(schema.match(Formula.parse('(~C >> ((A | B) >> ~C))'), binding))
+        self.assertIs(binding['A'], Formula.parse('~C'))
+        self.assertIs(binding['B'], Formula.parse('(A | B)'))
+        self.assertFalse(schema.match(Formula.parse('(~C >> ((A | B) >> C))'), {}))
+        self.assertFalse(schema.match(Formula.parse('(~C & ((A | B) >> ~C))'), {}))
+
+    def test_apply_rules(self) -> None:
+        """
+        Testing the structural rule functions with Formula objects
+        """
+        self.assertIs(ModusPonens().apply(Formula.parse('((A | B) >> C)'), Formula.parse('(A | B)')),
+                      Formula.parse('C'))
+        self.assertIsNone(ModusPonens().apply(Formula.parse('((A | B) >> C)'), Formula.parse('(B | A)')))
+        self.assertIs(ConditionalSyllogism().apply(Formula.parse('(A >> ~B)'), Formula.parse('(~B >> C)')),
+                      Formula.parse('(A >> C)'))
+        self.assertIsNone(ConditionalSyllogism().apply(Formula.parse('(~B >> C)'), Formula.parse('(A >> ~B)')))
+
+
+if __name__ == "__main__":
+    unittest.main()
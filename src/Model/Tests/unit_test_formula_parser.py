@@ -0,0 +1,43 @@
+import unittest
+from Model.formula import Formula
+from Model.Utils.formula_parser import FormulaParser
+
+
+class UnitTestFormulaParser(unittest.TestCase):
+    """
+    Unit test for Model.Utils.formula_parser.FormulaParser class
+    """
+
+    def test_parse(self) -> None:
+        """
+        Testing the parsed formulas and the precedence of the connectives
+        """
+        self.assertEqual(FormulaParser.parse('((A >> B) >> ~(A | B))'), (Formula.parse('((A >> B) >> ~(A | B))'), True))
+        self.assertEqual(FormulaParser.parse('~A'), (Formula.negation(Formula.variable('A')), True))
+        self.assertEqual(FormulaParser.parse('A >> B >> C'), (Formula.parse('((A >> B) >> C)'), False))
+        self.assertEqual(FormulaParser.parse('A | B & C'), (Formula.parse('(A | (B & C))'), False))
+        self.assertEqual(FormulaParser.parse('~A >> B'), (Formula.parse('(~A >> B)'), False))
+        self.assertEqual(FormulaParser.parse('A & B >> C'), (Formula.parse('(A & (B >> C))'), False))
+
+        for formula in ['', ' ', 'A B', 'A ~ B', 'A << B', 'A & & B', 'A > B', 'A > > B', '(A >> B', 'A >> B)',
+                        '()', 'a', 'A v B', None]:
+            with self.assertRaises(ValueError):
+                FormulaParser.parse(formula)
+
+    def test_brackets(self) -> None:
+        """
+        Testing the checking of the brackets
+        """
+        self.assertTrue(FormulaParser.parse('(A>>(B>>A))')[1])
+        self.assertTrue(FormulaParser.parse('(~~(A >> B) >> A)')[1])
+        self.assertTrue(FormulaParser.parse('~(A | B)')[1])
+        self.assertFalse(FormulaParser.parse('A >> B')[1])
+        self.assertFalse(FormulaParser.parse('(A)')[1])
+        self.assertFalse(FormulaParser.parse('((A >> B))')[1])
+        self.assertFalse(FormulaParser.parse('(A >> B >> C)')[1])
+        self.assertFalse(FormulaParser.parse('(A >> B) >> (C)')[1])
+        self.assertFalse(FormulaParser.parse('(~(~(A >> B)) >> A)')[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import Model
+from Model.formula import Formula
 from Model.formula_reader import FormulaReader
 
 
@@ -44,6 +45,22 @@ class UnitTestAxiomReader(unittest.TestCase):
         self.assertFalse(formula_reader.is_tautology("~(B >> (A | B))"))
         self.assertFalse(formula_reader.is_tautology(""))
 
+    def test_truth_table(self) -> None:
+        """
+        Tests the bit-parallel truth table of the formulas. The i-th bit is the formula's value in the i-th
+        interpretation, where the j-th variable's value is the j-th bit of i.
+        """
+        self.assertEqual(FormulaReader.truth_table(Formula.parse('A')), 0b10)
+        self.assertEqual(FormulaReader.truth_table(Formula.parse('~A')), 0b01)
+        self.assertEqual(FormulaReader.truth_table(Formula.parse('(A & B)')), 0b1000)
+        self.assertEqual(FormulaReader.truth_table(Formula.parse('(A | B)')), 0b1110)
+        self.assertEqual(FormulaReader.truth_table(Formula.parse('(A >> B)')), 0b1101)
+        self.assertEqual(FormulaReader.truth_table(Formula.parse('((A & B) >> C)')), 0b11110111)
+
+        formula_reader = FormulaReader()
+        self.assertTrue(formula_reader.is_tautology(' | '.join('ABCDFGHJKLMWRTZU') + ' | ~U'))
+        self.assertFalse(formula_reader.is_tautology(' | '.join('ABCDFGHJKLMWRTZU')))
+
 
 if __name__ == "__main__":
     unittest.main()
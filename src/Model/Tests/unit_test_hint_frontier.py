@@ -0,0 +1,54 @@
+import unittest
+from Model.step import Step
+from Model.actions import Actions
+from Model.step_store import StepStore
+from Model.hint_frontier import HintFrontier
+from Model.solver_budget import SolverBudget
+from Model.budget_exhausted_exception import BudgetExhaustedException
+
+
+class UnitTestHintFrontier(unittest.TestCase):
+    """
+    Unit test for Model.hint_frontier.HintFrontier class
+    """
+
+    def test_next_hint(self) -> None:
+        """
+        Testing the hints while the steps grow
+        """
+        steps = StepStore([Step(0, 'A', Actions.HYP), Step(1, '(B >> C)', Actions.HYP)])
+        frontier = HintFrontier(steps)
+        self.assertIsNone(frontier.next_hint())
+
+        steps.append(Step(2, '(A >> B)', Actions.HYP))
+        self.assertEqual(frontier.next_hint(), (2, 0))
+        steps.append(Step(3, 'B', Actions.MP, rule_implication=2, rule_detached=0))
+        self.assertEqual(frontier.next_hint(), (1, 3))
+        steps.append(Step(4, 'C', Actions.MP, rule_implication=1, rule_detached=3))
+        self.assertEqual(frontier.next_hint(), (2, 1))
+        steps.append(Step(5, '(A >> C)', Actions.CS, rule_implication=2, rule_detached=1))
+        self.assertIsNone(frontier.next_hint())
+
+        budget = SolverBudget()
+        budget.cancel()
+        steps.append(Step(6, '(C >> A)', Actions.HYP))
+        self.assertRaises(BudgetExhaustedException, frontier.next_hint, budget)
+        self.assertEqual(frontier.next_hint(), (1, 6))
+
+    def test_follows(self) -> None:
+        """
+        Testing whether the frontier can follow the steps
+        """
+        steps = StepStore([Step(0, 'A', Actions.HYP), Step(1, '(A >> B)', Actions.HYP)])
+        frontier = HintFrontier(steps)
+        self.assertTrue(frontier.follows(steps))
+        self.assertEqual(frontier.next_hint(), (1, 0))
+        steps.append(Step(2, 'C', Actions.HYP))
+        self.assertTrue(frontier.follows(steps))
+        steps.truncate(1)
+        self.assertFalse(frontier.follows(steps))
+        self.assertFalse(frontier.follows(StepStore()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@ import unittest
 from Model.model import Model
 from Model.step import Step
 from Model.actions import Actions
+from Model.add_step_status import AddStepStatus
+from Model.formula_in_steps_exception import FormulaInStepsException
 
 
 class UnitTestModel(unittest.TestCase):
@@ -365,6 +367,71 @@ class UnitTestModel(unittest.TestCase):
         self.assertFalse(None)
         self.assertFalse(model._Model__steps_append(Step(2, '(B >> C)', Actions.HYP)))
 
+    def test_try_add_step(self) -> None:
+        """
+        Unit test for Model.model.try_add_step function
+        """
+        model = Model(['(A >> B)', 'A'], 'B')
+        self.assertEqual(model.try_add_step('(A >> B)', Actions.HYP), (AddStepStatus.ADDED, 0))
+        self.assertEqual(model.try_add_step('(A >> B)', Actions.HYP), (AddStepStatus.DUPLICATE, 0))
+        self.assertEqual(model.try_add_step('B', Actions.HYP), (AddStepStatus.RULE_NOT_APPLICABLE, -1))
+        self.assertEqual(model.try_add_step('A', 'HYP'), (AddStepStatus.INVALID, -1))
+        self.assertEqual(model.try_add_step('A >>', Actions.HYP), (AddStepStatus.INVALID, -1))
+        self.assertEqual(model.try_add_step('(A >> (B >> A))', Actions.AXIOM, data=['A', 'B']),
+                         (AddStepStatus.ADDED, 1))
+        self.assertEqual(model.try_add_step('', Actions.MP, 0, 1), (AddStepStatus.RULE_NOT_APPLICABLE, -1))
+        self.assertEqual(model.try_add_step('', Actions.MP, 0, 0), (AddStepStatus.INVALID, -1))
+        self.assertEqual(model.try_add_step('', Actions.MP, 0, 5), (AddStepStatus.INVALID, -1))
+        self.assertEqual(model.try_add_step('A', Actions.HYP), (AddStepStatus.ADDED, 2))
+        self.assertEqual(model.try_add_step('', Actions.MP, 1, 2), (AddStepStatus.ADDED, 3))
+        self.assertEqual(model.try_add_step('', Actions.MP, 1, 2), (AddStepStatus.DUPLICATE, 3))
+        self.assertEqual(model.try_add_step('', Actions.MP, 0, 2), (AddStepStatus.ADDED, 4))
+        self.assertTrue(model.end)
+        self.assertEqual(model.try_add_step('A', Actions.HYP), (AddStepStatus.ENDED, -1))
+        self.assertEqual(model.number_of_steps, 5)
+
+        model = Model(['(A >> B)', 'A'], 'B')
+        self.assertTrue(model.add_step('A', Actions.HYP))
+        self.assertFalse(model.add_step('B', Actions.HYP))
+        with self.assertRaises(FormulaInStepsException):
+            model.add_step('A', Actions.HYP)
+
+    def test_try_add_steps(self) -> None:
+        """
+        Unit test for Model.model.try_add_steps function
+        """
+        model = Model(['(A >> B)', 'A'], 'B')
+        self.assertEqual(model.try_add_steps([('(A >> B)', Actions.HYP), ('A', Actions.HYP), ('A', Actions.HYP),
+                                              ('', Actions.MT, 0, 1), ('', Actions.MP, 0, 1), ('A', Actions.HYP)]),
+                         [(AddStepStatus.ADDED, 0), (AddStepStatus.ADDED, 1), (AddStepStatus.DUPLICATE, 1),
+                          (AddStepStatus.RULE_NOT_APPLICABLE, -1), (AddStepStatus.ADDED, 2),
+                          (AddStepStatus.ENDED, -1)])
+        self.assertEqual(model.get_steps_string(), ['1. (A >> B) [HYP]', '2. A [HYP]', '3. B [MP(1,2)]'])
+
+    def test_try_add_axiom_instance(self) -> None:
+        """
+        Unit test for Model.model.try_add_axiom_instance function, the steps must be the same as the steps of
+        try_add_step
+        """
+        import itertools
+        from Model.formula import Formula
+        substitutions = ['A', '~B', '(A >> ~B)', '~(A | B)']
+        model = Model(['(A >> B)'], 'C')
+        instance_model = Model(['(A >> B)'], 'C')
+        for axiom_index, axiom in enumerate(model.base_axioms):
+            schema = Formula.parse(axiom)
+            for data in itertools.product(substitutions, repeat=len(schema.variables)):
+                instance = schema.substitute(dict(zip(schema.variables, [Formula.parse(formula) for formula in data])))
+                self.assertEqual(instance_model.try_add_axiom_instance(axiom_index, instance),
+                                 model.try_add_step(axiom, Actions.AXIOM, data=list(data)))
+        self.assertEqual(instance_model.get_steps_string(), model.get_steps_string())
+
+        self.assertEqual(instance_model.try_add_axiom_instance(0, Formula.parse('(A >> B)')),
+                         (AddStepStatus.INVALID, -1))
+        self.assertEqual(instance_model.try_add_axiom_instance(len(model.base_axioms), Formula.parse('A')),
+                         (AddStepStatus.INVALID, -1))
+        self.assertEqual(instance_model.try_add_axiom_instance(0, 'A'), (AddStepStatus.INVALID, -1))
+
     def test_get_formula_set_consequence_concat(self) -> None:
         """
         Unit test for Model.model.get_formula_set_consequence_concat function
@@ -416,8 +483,43 @@ class UnitTestModel(unittest.TestCase):
         self.assertTrue(model.add_step('', Actions.MP, implication_formula_number=1, formula_to_be_detached_number=0))
         self.assertTrue(model.add_step('(A >> B)', Actions.HYP))
         self.assertEqual(model.get_hint(), (True, '(B >> A)', '(A >> (B >> A))'))
+        self.assertTrue(model.delete_steps(2))
+        self.assertEqual(model.get_hint(), (True, '(A >> (B >> A))', 'A'))
         pass
 
+    def test_fork(self) -> None:
+        """
+        Unit test for Model.model.fork, snapshot and restore functions
+        """
+        model = Model(['(A >> B)', 'A', '~B'], 'B')
+        self.assertTrue(model.add_step('(A >> B)', Actions.HYP))
+        self.assertTrue(model.add_step('A', Actions.HYP))
+        fork = model.fork()
+        self.assertTrue(fork.add_step('~B', Actions.HYP))
+        self.assertEqual(len(model.steps), 2)
+        self.assertEqual(fork.get_hint(), (True, '(A >> B)', 'A'))
+        self.assertTrue(model.add_step('', Actions.MP, 0, 1))
+        self.assertTrue(model.end)
+        self.assertFalse(fork.end)
+        self.assertEqual(fork.get_steps_string(), ['1. (A >> B) [HYP]', '2. A [HYP]', '3. ~B [HYP]'])
+        self.assertEqual(fork.base_axioms, model.base_axioms)
+
+        snapshot = fork.snapshot()
+        self.assertTrue(fork.add_step('', Actions.MT, 0, 2))
+        self.assertEqual(fork.steps[3].formula, '~A')
+        fork.restore(snapshot)
+        self.assertEqual(len(fork.steps), 3)
+        self.assertEqual(fork.number_of_steps, 3)
+        self.assertFalse(fork.steps.contains_formula('~A'))
+        self.assertTrue(fork.add_step('', Actions.MP, 0, 1))
+        self.assertTrue(fork.end)
+        fork.restore(snapshot)
+        self.assertFalse(fork.end)
+        self.assertEqual(len(snapshot.steps), 3)
+        self.assertTrue(fork.delete_steps(1))
+        self.assertEqual(len(snapshot.steps), 3)
+        self.assertEqual(len(model.steps), 3)
+
     def test_delete_steps(self) -> None:
         """
         Unit test for Model.model.delete_steps function
@@ -545,6 +647,21 @@ class UnitTestModel(unittest.TestCase):
         model = Model(['((B >> C) >> (A >> (B >> C)))'], '~(B >> C)')
         self.assertFalse(model.task_is_provable())
 
+    def test_get_counter_model(self) -> None:
+        """
+        Unit test for Model.model.get_counter_model function
+        """
+        model = Model(['(A >> B)', 'A'], 'B')
+        self.assertIsNone(model.get_counter_model())
+        model = Model(['(A >> B)'], 'B')
+        self.assertEqual(model.get_counter_model(), {'A': False, 'B': False})
+        model = Model(['(A | B)', '~A'], '~B')
+        self.assertEqual(model.get_counter_model(), {'A': False, 'B': True})
+        model = Model(['(F >> K)', '~A'], '~F')
+        self.assertEqual(model.get_counter_model()['F'], True)
+        self.assertEqual(model.get_counter_model()['K'], True)
+        self.assertEqual(model.get_counter_model()['A'], False)
+
     def test_save_model(self) -> None:
         """
         Unit test for Model.model.save_model function
@@ -582,6 +699,7 @@ class UnitTestModel(unittest.TestCase):
         self.assertEqual(data['steps'], steps)
         self.assertEqual(data['task_name'], '{(A >> B), A} |- B')
         self.assertEqual(data['added_axioms'], ['(A >> (~A >> B))'])
+        self.assertEqual(data['content_hash'], Model.content_hash(data, data_access.content_key()))
 
     def test_load_model(self) -> None:
         """
@@ -637,7 +755,71 @@ class UnitTestModel(unittest.TestCase):
         self.assertEqual(model.steps[4].rule_detached, 1)
         self.assertEqual(model.get_formula_set_consequence_concat(), "{(A >> B), A} |- B")
         self.assertEqual(model.added_axioms, ['(A >> (~A >> B))'])
+        self.assertTrue(model.verified())
 
+    def test_load_model_content_hash(self) -> None:
+        """
+        Unit test for Model.model.load_model function, with the content hash of the saves
+        """
+        import json
+        import tempfile
+        from Persistence.data_access import DataAccess
+        valid = {
+            "formula_set": ["(A >> B)", "A"],
+            "consequence_formula": "B",
+            "end": True,
+            "number_of_steps": 4,
+            "steps": [
+                [0, "(A >> B)", "Actions.HYP", '', 0, 0],
+                [1, "A", "Actions.HYP", '', 0, 0],
+                [2, "(A >> (B >> A))", "Actions.AXIOM", '', 0, 0],
+                [3, "B", "Actions.MP", '', 0, 1]
+            ],
+            "task_name": "{(A >> B), A} |- B",
+            "added_axioms": []
+        }
+        invalid = dict(valid, steps=valid['steps'][:2] + [[2, "(B >> A)", "Actions.AXIOM", '', 0, 0]] +
+                       valid['steps'][3:])
+        with tempfile.TemporaryDirectory() as directory:
+            data_access = DataAccess(persistence_path=directory)
+            key = data_access.content_key()
+
+            def write(data: dict, with_hash: bool) -> str:
+                path = os.path.join(directory, 'save.json')
+                if with_hash:
+                    data = dict(data, content_hash=Model.content_hash(data, key))
+                with open(path, 'w') as f:
+                    json.dump(data, f)
+                return path
+
+            def load(path: str, verify: str = 'none') -> Model:
+                return Model(file_path=path, data_access=data_access, verify=verify)
+
+            path = write(invalid, False)
+            for verify in ('full', 'lazy', 'none'):
+                self.assertRaises(ValueError, load, path, verify)
+            path = write(dict(invalid, content_hash=Model.content_hash(valid, key)), False)
+            self.assertRaises(ValueError, load, path)
+            path = write(dict(invalid, content_hash=Model.content_hash(invalid, b'\0' * DataAccess.KEY_SIZE)), False)
+            self.assertRaises(ValueError, load, path)
+
+            path = write(invalid, True)
+            self.assertRaises(ValueError, load, path, 'full')
+            model = load(path)
+            self.assertEqual(model.steps[2].formula, '(B >> A)')
+            self.assertIsNone(model.verified())
+            self.assertFalse(load(path, 'lazy').verified())
+            self.assertRaises(ValueError, load, path, 'fast')
+
+            path = write(valid, True)
+            for verify in ('full', 'lazy'):
+                model = load(path, verify)
+                self.assertTrue(model.end)
+                self.assertTrue(model.verified())
+            self.assertEqual(load(path).get_steps_string(), model.get_steps_string())
+            self.assertTrue(Model(file_path=path).verified())
+            self.assertEqual(Model.content_hash(valid, key), Model.content_hash(json.loads(json.dumps(valid)), key))
+            self.assertEqual(DataAccess(persistence_path=directory).content_key(), key)
 
 if __name__ == "__main__":
     unittest.main()
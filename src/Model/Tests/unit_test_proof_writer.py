@@ -0,0 +1,79 @@
+import io
+import json
+import unittest
+
+from Model.model import Model
+from Model.solver import Solver
+from Model.solver_status import SolverStatus
+from Model.proof_writer import ProofWriter
+
+
+class UnitTestProofWriter(unittest.TestCase):
+    """
+    Unit test for Model.ProofWriter class, and the streaming of the steps.
+    """
+
+    class Output(io.StringIO):
+        """
+        StringIO, that counts the flushes.
+        """
+        def __init__(self) -> None:
+            super().__init__()
+            self.flushes = 0
+
+        def flush(self) -> None:
+            super().flush()
+            self.flushes += 1
+
+    def setUp(self) -> None:
+        self.model = Model(['(A >> B)', '(B >> C)', 'A'], 'C')
+        self.result = Solver.run(self.model, closure=False)
+
+    def test_closure(self) -> None:
+        self.assertEqual(self.result.status, SolverStatus.PROVED)
+        self.assertEqual(self.result.steps, [])
+        self.assertEqual(self.result.number_of_steps, len(self.model.steps))
+        self.assertEqual(self.result.to_dict()['number_of_steps'], len(self.model.steps))
+        self.assertEqual(list(self.model.iter_steps_string()), self.model.get_steps_string())
+        self.assertEqual(list(Solver.iter_proof(self.model)), self.result.proof)
+        self.assertEqual(list(Solver.iter_proof(Model(['A'], 'B'))), [])
+
+        result = Solver.run(Model(['(A >> B)', '(B >> C)', 'A'], 'C'))
+        self.assertEqual(result.steps, self.model.get_steps_string())
+        self.assertEqual(result.number_of_steps, len(result.steps))
+
+    def test_write(self) -> None:
+        output = UnitTestProofWriter.Output()
+        writer = ProofWriter(output)
+        self.assertEqual(writer.write_proof(self.model, 7), len(self.result.proof))
+        self.assertEqual(writer.write_closure(self.model, 7), len(self.model.steps))
+        self.assertEqual(writer.write_proof(Model(['A'], 'B')), 0)
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(writer.records, len(records))
+        self.assertEqual(output.flushes, len(records))
+        self.assertEqual(records[0], {'id': 7, 'kind': 'proof', 'number': 1, 'step': self.result.proof[0]})
+        self.assertEqual([record['step'] for record in records if record['kind'] == 'proof'], self.result.proof)
+        self.assertEqual([record['step'] for record in records if record['kind'] == 'closure'],
+                         self.model.get_steps_string())
+        self.assertEqual([record['number'] for record in records if record['kind'] == 'closure'],
+                         list(range(1, len(self.model.steps) + 1)))
+
+    def test_flush(self) -> None:
+        output = UnitTestProofWriter.Output()
+        writer = ProofWriter(output, flush_every=2)
+        writer.write_steps(['1. A [HYP]', '2. B [HYP]', '3. C [HYP]'])
+        self.assertEqual(output.flushes, 1)
+        writer.flush()
+        self.assertEqual(output.flushes, 2)
+
+        output = UnitTestProofWriter.Output()
+        writer = ProofWriter(output, flush_every=0)
+        writer.write_closure(self.model)
+        self.assertEqual(output.flushes, 0)
+        self.assertEqual(len(output.getvalue().splitlines()), len(self.model.steps))
+        self.assertRaises(ValueError, ProofWriter, output, -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from Model.sat_solver import SatSolver
+
+
+class UnitTestSatSolver(unittest.TestCase):
+    """
+    Unit test for Model.sat_solver.SatSolver class
+    """
+
+    def test_solve(self) -> None:
+        """
+        Testing the solver with satisfiable and unsatisfiable clauses
+        """
+        clauses = [[1, 2], [-1, 2], [1, -2, 3], [-3, -1]]
+        solver = SatSolver()
+        for clause in clauses:
+            solver.add_clause(clause)
+        self.assertTrue(solver.solve())
+        self.assertEqual([solver.value(1), solver.value(2)], [False, True])
+        for clause in clauses:
+            self.assertTrue(any(solver.value(literal) for literal in clause))
+
+        solver = SatSolver()
+        for clause in [[1, 2], [-1, 2], [1, -2], [-1, -2]]:
+            solver.add_clause(clause)
+        self.assertFalse(solver.solve())
+
+        solver = SatSolver()
+        solver.add_clause([])
+        self.assertFalse(solver.solve())
+
+    def test_find_counter_model(self) -> None:
+        """
+        Testing deciding the logical consequence, and the counter models
+        """
+        self.assertIsNone(SatSolver.find_counter_model(['(A >> B)', '(B >> C)'], '(A >> C)'))
+        self.assertIsNone(SatSolver.find_counter_model(['~B', 'B'], 'A'))
+        self.assertIsNone(SatSolver.find_counter_model([], '(A >> (B >> A))'))
+        self.assertIsNone(SatSolver.find_counter_model(['A >> B | C', '~B & ~C'], '~A'))
+        self.assertEqual(SatSolver.find_counter_model(['(A >> B)'], '~A'), {'A': True, 'B': True})
+        self.assertEqual(SatSolver.find_counter_model([], '(A >> B)'), {'A': True, 'B': False})
+
+        variables = 'ABCDFGHJKLMWRTZU'
+        formula_set = ['(' + variables[i] + ' >> ' + variables[i + 1] + ')' for i in range(len(variables) - 1)]
+        self.assertIsNone(SatSolver.find_counter_model(formula_set, '(A >> U)'))
+        self.assertEqual(SatSolver.find_counter_model(formula_set, '(U >> A)')['U'], True)
+
+        with self.assertRaises(ValueError):
+            SatSolver.find_counter_model(['(A >> B'], 'A')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,11 @@
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from Model.model import Model
 from Model.solver import Solver
+from Model.actions import Actions
+from Model.step import Step
+from Model.solver_statistics import SolverStatistics
+from Model.solver_status import SolverStatus
 
 
 class SystemTestSolver(unittest.TestCase):
@@ -78,6 +83,159 @@ class SystemTestSolver(unittest.TestCase):
         self.assertTrue(successful)
         self.assertIn('C', proving_theory_list[len(proving_theory_list)-1])
 
+    def test_hypothesis_consequence(self) -> None:
+        """
+        Trying to prove the tasks below, where the consequence is one of the hypotheses.
+        Tasks:
+        {A} |- A
+        {A, B} |- A
+        """
+        for formula_set in (['A'], ['A', 'B']):
+            result = Solver.run(Model(formula_set, 'A'))
+            self.assertEqual(result.status, SolverStatus.PROVED)
+            self.assertEqual(result.proof, ['1. A [HYP]'])
+            self.assertEqual(Solver.solve(Model(formula_set, 'A')), (True, ['1. A [HYP]']))
+
+            model = Model(formula_set, 'A')
+            Solver.run(model, closure=False)
+            self.assertEqual(list(Solver.iter_proof(model)), ['1. A [HYP]'])
+
+    def test_backward(self) -> None:
+        """
+        Trying to prove the tasks below with backward search.
+        Tasks:
+        {F ⊃ K, F ⊃ A, ¬A} |- ¬F
+        {A, B} |- A ∧ B
+        """
+        model = Model(['(F >> K)', '(K >> A)', '~A'], '~F')
+        successful, proving_theory_list = Solver.solve(model, backward=True)
+        self.assertTrue(successful)
+        self.assertEqual(proving_theory_list[len(proving_theory_list) - 1], '5. ~F [MT(1,4)]')
+
+        model = Model(['A', 'B'], '(A & B)')
+        successful, proving_theory_list = Solver.solve(model, backward=True)
+        self.assertTrue(successful)
+        self.assertEqual(len(proving_theory_list), 5)
+        self.assertIn('(A & B)', proving_theory_list[len(proving_theory_list) - 1])
+
+    def test_get_proving_theory(self) -> None:
+        """
+        Filtering the important steps of a deep proof, where every step is derived from the step before it twice.
+        """
+        model = Model(['A'], 'B')
+        model.add_step('A', Actions.HYP)
+        for step_id in range(1, 3000):
+            model.steps.append(Step(step_id, 'A', Actions.MP, rule_implication=step_id - 1,
+                                    rule_detached=step_id - 1))
+        self.assertEqual(Solver.get_proving_theory(model, model.steps[2999]), list(range(3000)))
+        self.assertEqual(Solver.get_proving_theory(model, model.steps[0]), [0])
+        self.assertEqual(Solver.get_proving_theory(None, model.steps[0]), [])
+
+        model = Model(['(A >> B)', 'C', 'A'], 'B')
+        for formula in model.formula_set:
+            model.add_step(formula, Actions.HYP)
+        model.add_step('', Actions.MP, implication_formula_number=0, formula_to_be_detached_number=2)
+        indexes = Solver.get_proving_theory(model, model.steps[3])
+        self.assertEqual(indexes, [0, 2, 3])
+        self.assertEqual(model.get_steps_string(indexes), ['1. (A >> B) [HYP]', '2. A [HYP]', '3. B [MP(1,2)]'])
+
+    def test_use_axioms(self) -> None:
+        """
+        Substituting the variables into the axioms, with and without the relevance filter.
+        Task:
+        {A ∧ B} |- B
+        """
+        model = Model(['(A & B)'], 'B')
+        model.add_step('(A & B)', Actions.HYP)
+        statistics = SolverStatistics()
+        self.assertTrue(Solver.use_axioms(model, ['A', 'B', '(A & B)'], statistics=statistics))
+        self.assertEqual(statistics.axiom_instances, 3 * 3 + 8 * 9 + 3 * 27)
+        self.assertGreater(statistics.axiom_instances_pruned, 0)
+        self.assertLessEqual(statistics.axiom_instances_pruned + statistics.axiom_steps, statistics.axiom_instances)
+        self.assertIn('((A & B) >> B)', [step.formula for step in model.steps])
+        self.assertNotIn('(A >> (A >> A))', [step.formula for step in model.steps])
+
+        unfiltered_model = Model(['(A & B)'], 'B')
+        unfiltered_model.add_step('(A & B)', Actions.HYP)
+        unfiltered_statistics = SolverStatistics()
+        self.assertTrue(Solver.use_axioms(unfiltered_model, ['A', 'B', '(A & B)'], relevant_only=False,
+                                          statistics=unfiltered_statistics))
+        self.assertEqual(unfiltered_statistics.axiom_instances_pruned, 0)
+        self.assertGreater(unfiltered_statistics.axiom_steps, statistics.axiom_steps)
+
+        for workers in (1, 2):
+            model = Model(['(A & B)'], 'B')
+            model.add_step('(A & B)', Actions.HYP)
+            rejected = []
+            self.assertTrue(Solver.use_axioms(model, ['A', 'B', '(A & B)'], workers=workers, rejected=rejected))
+            self.assertEqual(len(rejected), statistics.axiom_instances_pruned)
+            self.assertIn('(A >> (A >> A))', [str(instance) for _, instance in rejected])
+            self.assertTrue(Solver.use_rejected_axioms(model, rejected))
+            self.assertEqual({step.formula for step in model.steps},
+                             {step.formula for step in unfiltered_model.steps})
+
+    def test_use_axioms_parallel(self) -> None:
+        """
+        Substituting the variables into the axioms with a process pool, the steps must be the same as the steps of
+        the sequential substitution.
+        Task:
+        {A ⊃ B, ~B} |- ~A
+        """
+        sequential_model = Model(['(A >> B)', '~B'], '~A')
+        parallel_model = Model(['(A >> B)', '~B'], '~A')
+        variables = ['A', '~A', 'B', '~B', '(A >> B)']
+        for model in (sequential_model, parallel_model):
+            for formula in model.formula_set:
+                model.add_step(formula, Actions.HYP)
+        sequential_statistics = SolverStatistics()
+        parallel_statistics = SolverStatistics()
+        self.assertTrue(Solver.use_axioms(sequential_model, variables, statistics=sequential_statistics))
+        self.assertTrue(Solver.use_axioms(parallel_model, variables, statistics=parallel_statistics, workers=2))
+        self.assertEqual(sequential_model.get_steps_string(), parallel_model.get_steps_string())
+        self.assertEqual(sequential_statistics.axiom_instances, parallel_statistics.axiom_instances)
+        self.assertEqual(sequential_statistics.axiom_steps, parallel_statistics.axiom_steps)
+        self.assertEqual(sequential_statistics.to_dict(), parallel_statistics.to_dict())
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for relevant_only in (True, False):
+                sequential_model = Model(['(A >> B)', '~B'], '~A')
+                parallel_model = Model(['(A >> B)', '~B'], '~A')
+                for model in (sequential_model, parallel_model):
+                    for formula in model.formula_set:
+                        model.add_step(formula, Actions.HYP)
+                self.assertTrue(Solver.use_axioms(sequential_model, variables, relevant_only=relevant_only))
+                self.assertTrue(Solver.use_axioms(parallel_model, variables, relevant_only=relevant_only, workers=2,
+                                                  executor=executor))
+                self.assertEqual(sequential_model.get_steps_string(), parallel_model.get_steps_string())
+
+        result = Solver.solve(Model(['(A & B)'], 'B'), workers=2)
+        self.assertTrue(result[0])
+        self.assertIn('B', result[1][len(result[1]) - 1])
+
+    def test_use_syntax_rules(self) -> None:
+        """
+        Saturating the steps with the syntax rules, the consequence can only be derived from steps, that are derived
+        during the saturation.
+        Task:
+        {C ⊃ D, B ⊃ C, A ⊃ B, A} |- D
+        """
+        model = Model(['(C >> D)', '(B >> C)', '(A >> B)', 'A'], 'D')
+        for formula in model.formula_set:
+            model.add_step(formula, Actions.HYP)
+        self.assertTrue(Solver.use_syntax_rules(model))
+        self.assertTrue(model.end)
+        self.assertEqual(model.steps[len(model.steps) - 1].formula, 'D')
+
+        model = Model(['(A >> B)', '(B >> C)'], 'D')
+        for formula in model.formula_set:
+            model.add_step(formula, Actions.HYP)
+        self.assertTrue(Solver.use_syntax_rules(model))
+        self.assertFalse(model.end)
+        self.assertEqual([step.formula for step in model.steps], ['(A >> B)', '(B >> C)', '(A >> C)'])
+        self.assertTrue(Solver.use_syntax_rules(model, len(model.steps)))
+        self.assertEqual(len(model.steps), 3)
+        self.assertFalse(Solver.use_syntax_rules(model, -1))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from Model.model import Model
+from Model.solver import Solver
+from Model.solver_budget import SolverBudget
+from Model.solver_status import SolverStatus
+from Model.budget_exhausted_exception import BudgetExhaustedException
+
+
+class UnitTestSolverBudget(unittest.TestCase):
+    """
+    Unit testing Model.solver_budget.py and the budget of Model.solver.py
+    """
+
+    def test_init(self) -> None:
+        budget = SolverBudget()
+        self.assertIsNone(budget.time_limit)
+        self.assertIsNone(budget.max_steps)
+        self.assertIsNone(budget.max_memory)
+        self.assertRaises(ValueError, SolverBudget, -1)
+        self.assertRaises(ValueError, SolverBudget, None, -1)
+        self.assertRaises(ValueError, SolverBudget, None, None, -1)
+
+    def test_check(self) -> None:
+        budget = SolverBudget(max_steps=3)
+        budget.start()
+        budget.check(3)
+        with self.assertRaises(BudgetExhaustedException) as context:
+            budget.check(4)
+        self.assertEqual('steps', context.exception.reason)
+
+        budget = SolverBudget(time_limit=0)
+        budget.start()
+        with self.assertRaises(BudgetExhaustedException) as context:
+            budget.check(0)
+        self.assertEqual('time', context.exception.reason)
+
+        budget = SolverBudget(max_memory=1)
+        budget.start()
+        if SolverBudget.resident_memory() is not None:
+            with self.assertRaises(BudgetExhaustedException) as context:
+                budget.check(0)
+            self.assertEqual('memory', context.exception.reason)
+
+    def test_cancel_progress(self) -> None:
+        reports = []
+        budget = SolverBudget(progress=lambda steps, elapsed: reports.append((steps, elapsed)))
+        budget.start()
+        for number_of_steps in range(2 * SolverBudget.PROGRESS_INTERVAL):
+            budget.check(number_of_steps)
+        self.assertEqual([steps for steps, _ in reports], [0, SolverBudget.PROGRESS_INTERVAL])
+        self.assertTrue(all(elapsed >= 0 for _, elapsed in reports))
+
+        self.assertFalse(budget.cancelled)
+        budget.cancel()
+        self.assertTrue(budget.cancelled)
+        with self.assertRaises(BudgetExhaustedException) as context:
+            budget.check(0)
+        self.assertEqual('cancelled', context.exception.reason)
+
+        budget = SolverBudget()
+        budget.cancel()
+        result = Solver.run(Model(['(A & B)'], 'B'), budget=budget)
+        self.assertEqual(SolverStatus.BUDGET_EXHAUSTED, result.status)
+        self.assertEqual('cancelled', result.exhausted_budget)
+
+    def test_run(self) -> None:
+        model = Model(['(A >> B)', 'A'], 'B')
+        result = Solver.run(model, budget=SolverBudget(time_limit=60, max_steps=100))
+        self.assertEqual(SolverStatus.PROVED, result.status)
+        self.assertTrue(result.proved)
+        self.assertIn('B', result.proof[-1])
+
+        model = Model(['(A & B)'], 'B')
+        result = Solver.run(model, budget=SolverBudget(max_steps=20))
+        self.assertEqual(SolverStatus.BUDGET_EXHAUSTED, result.status)
+        self.assertEqual('steps', result.exhausted_budget)
+        self.assertEqual([], result.proof)
+        self.assertIn('1. (A & B) [HYP]', result.steps)
+        self.assertGreater(len(result.steps), 1)
+        self.assertEqual('BUDGET_EXHAUSTED', result.to_dict()['status'])
+
+        model = Model(['(A & B)'], 'B')
+        result = Solver.run(model, budget=SolverBudget(time_limit=0))
+        self.assertEqual(SolverStatus.BUDGET_EXHAUSTED, result.status)
+        self.assertEqual('time', result.exhausted_budget)
+        self.assertEqual((False, ''), Solver.solve(Model(['(A & B)'], 'B'), budget=SolverBudget(time_limit=0)))
+
+        self.assertEqual(SolverStatus.UNPROVABLE, Solver.run(Model(['(A >> B)'], 'B')).status)
+        self.assertEqual(SolverStatus.INVALID, Solver.run(None).status)
+
+
+if __name__ == '__main__':
+    unittest.main()
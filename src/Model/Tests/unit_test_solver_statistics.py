@@ -0,0 +1,71 @@
+import json
+import unittest
+from Model.model import Model
+from Model.solver import Solver
+from Model.actions import Actions
+from Model.add_step_status import AddStepStatus
+from Model.solver_budget import SolverBudget
+from Model.solver_statistics import SolverStatistics
+from Model.formula_in_steps_exception import FormulaInStepsException
+
+
+class UnitTestSolverStatistics(unittest.TestCase):
+    """
+    Unit testing Model.solver_statistics.py and the statistics of Model.solver.py
+    """
+
+    def test_counters(self) -> None:
+        statistics = SolverStatistics()
+        statistics.count_step(Actions.MP, AddStepStatus.ADDED)
+        statistics.count_step(Actions.MP, AddStepStatus.DUPLICATE)
+        statistics.count_step(Actions.CS, AddStepStatus.RULE_NOT_APPLICABLE)
+        statistics.count_exception(FormulaInStepsException())
+        with statistics.phase('axioms'):
+            pass
+        with self.assertRaises(ValueError):
+            with statistics.phase('axioms'):
+                raise ValueError
+        self.assertEqual(statistics.rule_attempts, {'MP': 2, 'CS': 1})
+        self.assertEqual(statistics.rule_successes, {'MP': 1})
+        self.assertEqual(statistics.duplicate_steps, 1)
+        self.assertEqual(statistics.validation_calls, 3)
+        self.assertEqual(statistics.exceptions, {'FormulaInStepsException': 1})
+        self.assertEqual(list(statistics.phase_times), ['axioms'])
+        self.assertGreaterEqual(statistics.phase_times['axioms'], 0)
+        json.dumps(statistics.to_dict())
+
+    def test_log(self) -> None:
+        statistics = SolverStatistics()
+        statistics.count_step(Actions.HYP, AddStepStatus.ADDED)
+        with self.assertLogs('Model.solver', 'DEBUG') as logs:
+            statistics.log()
+        self.assertIn("'HYP': 1", logs.output[0])
+
+    def test_run(self) -> None:
+        statistics = SolverStatistics()
+        with self.assertLogs('Model.solver', 'DEBUG'):
+            result = Solver.run(Model(['(A & B)'], 'B'), statistics=statistics)
+        self.assertTrue(result.proved)
+        self.assertIs(result.statistics, statistics)
+        self.assertEqual(statistics.rule_attempts['HYP'], 1)
+        self.assertGreater(statistics.rule_attempts['AXIOM'], 0)
+        self.assertEqual(statistics.rule_successes['AXIOM'], statistics.axiom_steps)
+        self.assertGreaterEqual(statistics.validation_calls, sum(statistics.rule_attempts.values()))
+        for phase in ('total', 'provability', 'hypotheses', 'syntax_rules', 'axioms', 'proof_extraction'):
+            self.assertIn(phase, statistics.phase_times)
+        self.assertNotIn('backward', statistics.phase_times)
+        self.assertGreaterEqual(statistics.phase_times['total'], statistics.phase_times['axioms'])
+
+        statistics = SolverStatistics()
+        result = Solver.run(Model(['(A >> B)', 'A'], 'B'), backward=True, statistics=statistics)
+        self.assertTrue(result.proved)
+        self.assertEqual(statistics.rule_successes['MP'], 1)
+        self.assertIn('backward', statistics.phase_times)
+
+        statistics = SolverStatistics()
+        Solver.run(Model(['(A & B)'], 'B'), statistics=statistics, budget=SolverBudget(time_limit=0))
+        self.assertEqual(statistics.exceptions['BudgetExhaustedException'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
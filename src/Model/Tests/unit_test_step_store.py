@@ -0,0 +1,114 @@
+import unittest
+from Model.step import Step
+from Model.actions import Actions
+from Model.step_store import StepStore
+
+
+class UnitTestStepStore(unittest.TestCase):
+    """
+    Unit test for Model.step_store.StepStore class
+    """
+
+    def test_append(self) -> None:
+        """
+        Testing appending, indexing and formula searching
+        """
+        steps = StepStore()
+        self.assertEqual(len(steps), 0)
+        self.assertFalse(steps)
+        steps.append(Step(0, '(A >> B)', Actions.HYP))
+        steps.append(Step(1, 'A', Actions.HYP))
+        self.assertEqual(len(steps), 2)
+        self.assertTrue(steps)
+        self.assertEqual(steps[1].formula, 'A')
+        self.assertEqual([step.formula for step in steps], ['(A >> B)', 'A'])
+        self.assertEqual(steps.index_of('(A >> B)'), 0)
+        self.assertEqual(steps.index_of('A'), 1)
+        self.assertEqual(steps.index_of('B'), -1)
+        self.assertTrue(steps.contains_formula('A'))
+        self.assertFalse(steps.contains_formula('B'))
+
+    def test_truncate(self) -> None:
+        """
+        Testing deleting steps from the end of the steps
+        """
+        steps = StepStore([Step(0, '(A >> B)', Actions.HYP), Step(1, 'A', Actions.HYP), Step(2, 'B', Actions.HYP)])
+        steps.truncate(1)
+        self.assertEqual(len(steps), 1)
+        self.assertFalse(steps.contains_formula('A'))
+        self.assertFalse(steps.contains_formula('B'))
+        self.assertTrue(steps.contains_formula('(A >> B)'))
+
+        steps.append(Step(1, 'B', Actions.HYP))
+        self.assertEqual(steps.index_of('B'), 1)
+        del steps[:]
+        self.assertEqual(len(steps), 0)
+        self.assertFalse(steps.contains_formula('(A >> B)'))
+
+        steps = StepStore([Step(0, '(A >> B)', Actions.HYP), Step(1, 'A', Actions.HYP), Step(2, 'B', Actions.HYP)])
+        del steps[0]
+        self.assertEqual(steps.index_of('A'), 0)
+        self.assertEqual(steps.index_of('B'), 1)
+        self.assertFalse(steps.contains_formula('(A >> B)'))
+
+
+    def test_partners(self) -> None:
+        """
+        Testing the syntax rule partners of the steps, and the update of the member indexes
+        """
+        steps = StepStore([Step(0, '(A >> B)', Actions.HYP), Step(1, 'A', Actions.HYP), Step(2, '~B', Actions.HYP),
+                           Step(3, '(B >> C)', Actions.HYP), Step(4, '(~A | C)', Actions.HYP),
+                           Step(5, '(~C >> ~A)', Actions.HYP)])
+        self.assertEqual(steps.partners(1), [(Actions.MP, 0, 1), (Actions.MPT, 5, 1)])
+        self.assertEqual(steps.partners(2), [(Actions.MT, 0, 2)])
+        self.assertEqual(steps.partners(3), [(Actions.CS, 0, 3)])
+        self.assertEqual(steps.partners(0), [(Actions.MP, 0, 1), (Actions.MT, 0, 2), (Actions.CS, 0, 3)])
+        self.assertEqual(steps.partners(0, 2), [(Actions.MP, 0, 1)])
+        self.assertEqual(steps.partners(4), [])
+        self.assertEqual(steps.partners(6), [])
+
+        steps.truncate(1)
+        self.assertEqual(steps.partners(0), [])
+        steps.append(Step(1, '~A', Actions.HYP))
+        steps.append(Step(2, '(A | B)', Actions.HYP))
+        self.assertEqual(steps.partners(1), [(Actions.MTP, 2, 1)])
+
+    def test_fork(self) -> None:
+        """
+        Testing the forks of the steps, that share the common steps and indexes
+        """
+        steps = StepStore([Step(0, '(A >> B)', Actions.HYP), Step(1, '(B >> C)', Actions.HYP)])
+        fork = steps.fork()
+        steps.append(Step(2, 'A', Actions.HYP))
+        fork.append(Step(2, '~C', Actions.HYP))
+        self.assertEqual([step.formula for step in steps], ['(A >> B)', '(B >> C)', 'A'])
+        self.assertEqual([step.formula for step in fork], ['(A >> B)', '(B >> C)', '~C'])
+        self.assertEqual(fork[1].formula, '(B >> C)')
+        self.assertEqual(fork[-1].formula, '~C')
+        self.assertEqual([step.formula for step in fork[1:]], ['(B >> C)', '~C'])
+        self.assertEqual(steps.index_of('A'), 2)
+        self.assertEqual(fork.index_of('A'), -1)
+        self.assertTrue(fork.contains_formula('(A >> B)'))
+        self.assertEqual(steps.partners(2), [(Actions.MP, 0, 2)])
+        self.assertEqual(fork.partners(2), [(Actions.MT, 1, 2)])
+        self.assertEqual(fork.partners(1), [(Actions.CS, 0, 1), (Actions.MT, 1, 2)])
+
+        fork.truncate(1)
+        self.assertEqual(len(fork), 1)
+        self.assertFalse(fork.contains_formula('(B >> C)'))
+        fork.append(Step(1, 'A', Actions.HYP))
+        self.assertEqual(fork.partners(1), [(Actions.MP, 0, 1)])
+        self.assertEqual(steps.partners(1), [(Actions.CS, 0, 1)])
+        self.assertEqual(len(steps), 3)
+
+        branch = fork
+        for depth in range(StepStore.MAX_DEPTH * 2):
+            branch = branch.fork()
+            branch.append(Step(len(branch), '(A >> ' + '~' * depth + 'C)', Actions.HYP))
+        self.assertEqual(len(branch), 2 + StepStore.MAX_DEPTH * 2)
+        self.assertEqual(branch.index_of('(A >> ~C)'), 3)
+        self.assertEqual(len(branch.partners(1)), StepStore.MAX_DEPTH * 2 + 1)
+        self.assertEqual(len(fork), 2)
+
+if __name__ == "__main__":
+    unittest.main()
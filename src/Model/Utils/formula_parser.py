@@ -0,0 +1,135 @@
+from functools import lru_cache
+
+import Model.formula
+
+
+class FormulaParser:
+    """
+    Recursive descent parser for the logical formulas. Validates the formula, checks its brackets and builds its
+    Formula tree in one pass. The precedence of the connectives is the same as in Python: '|' is the weakest, then
+    '&', then '>>' (left associative), and '~' is the strongest.
+
+    The brackets of a formula are correct if every binary operation is in exactly one pair of brackets, and there
+    are no other brackets in the formula, like in '((A >> B) >> ~(A | B))'.
+
+    Attributes:
+        __text: (str) the formula string to be parsed
+        __position: (int) position of the next character to be read in the text
+        __brackets: (int) number of the bracket pairs that contain exactly one binary operation
+        __operations: (int) number of the binary operations read
+        __bracketed: (bool) False if a bracket pair contains anything else than one binary operation
+    """
+
+    def __init__(self, formula_string: str) -> None:
+        """
+        Constructor for FormulaParser. Use the parse function instead, it caches the results.
+
+        Args:
+            formula_string: logical formula to be parsed
+        """
+        self.__text = formula_string
+        self.__position = 0
+        self.__brackets = 0
+        self.__operations = 0
+        self.__bracketed = True
+
+    @staticmethod
+    @lru_cache(maxsize=1 << 16)
+    def parse(formula_string: str) -> ('Model.formula.Formula', bool):
+        """
+        Parses a logical formula. The results are cached, so parsing the same string again is a lookup.
+
+        Raises:
+            ValueError: if the formula string is not a valid logical formula
+
+        Args:
+            formula_string: logical formula
+        Returns:
+            Tuple of the Formula of the string, and whether the brackets of the formula are correct or not
+        """
+        if not isinstance(formula_string, str):
+            raise ValueError
+        parser = FormulaParser(formula_string)
+        formula, is_operation = parser.__parse_disjunction()
+        if parser.__peek() != '':
+            raise ValueError
+        bracketed = parser.__bracketed and not is_operation and parser.__brackets == parser.__operations
+        return formula, bracketed
+
+    def __peek(self) -> str:
+        """
+        Skips the spaces and gives the next token without reading it.
+
+        Returns:
+            the next token ('>>', a connective, a bracket or a letter), or '' at the end of the text
+        """
+        while self.__position < len(self.__text) and self.__text[self.__position].isspace():
+            self.__position += 1
+        if self.__position >= len(self.__text):
+            return ''
+        if self.__text.startswith('>>', self.__position):
+            return '>>'
+        return self.__text[self.__position]
+
+    def __read(self) -> str:
+        """
+        Reads the next token.
+
+        Returns:
+            the read token
+        """
+        token = self.__peek()
+        self.__position += len(token)
+        return token
+
+    def __parse_binary(self, connective: str, parse_member) -> ('Model.formula.Formula', bool):
+        """
+        Parses a left associative chain of binary operations with the same connective.
+
+        Returns:
+            Tuple of the parsed formula, and whether its main connective was read in this chain or not
+        """
+        formula, is_operation = parse_member()
+        while self.__peek() == connective:
+            self.__read()
+            right, _ = parse_member()
+            formula = Model.formula.Formula.binary(connective, formula, right)
+            self.__operations += 1
+            is_operation = True
+        return formula, is_operation
+
+    def __parse_disjunction(self) -> ('Model.formula.Formula', bool):
+        return self.__parse_binary('|', self.__parse_conjunction)
+
+    def __parse_conjunction(self) -> ('Model.formula.Formula', bool):
+        return self.__parse_binary('&', self.__parse_implication)
+
+    def __parse_implication(self) -> ('Model.formula.Formula', bool):
+        return self.__parse_binary('>>', self.__parse_negation)
+
+    def __parse_negation(self) -> ('Model.formula.Formula', bool):
+        """
+        Parses a negation, a variable or a formula in brackets.
+
+        Raises:
+            ValueError: if there is no valid formula at the position
+
+        Returns:
+            Tuple of the parsed formula, and False, because its main connective is not a binary operation read here
+        """
+        token = self.__read()
+        if token == '~':
+            body, _ = self.__parse_negation()
+            return Model.formula.Formula.negation(body), False
+        if token == '(':
+            formula, is_operation = self.__parse_disjunction()
+            if self.__read() != ')':
+                raise ValueError
+            if is_operation:
+                self.__brackets += 1
+            else:
+                self.__bracketed = False
+            return formula, False
+        if len(token) == 1 and 'A' <= token <= 'Z':
+            return Model.formula.Formula.variable(token), False
+        raise ValueError
@@ -1,10 +1,7 @@
-import ast
 import re
-import tokenize
-
-import sympy
 
 import Persistence.data_access
+from Model.Utils.formula_parser import FormulaParser
 
 
 class Utils:
@@ -15,9 +12,9 @@ class Utils:
     def is_valid_formula(formula_string: str) -> bool:
         """
         Checks whether the input formula is valid logical formula, or not.
-        If not, the sympy.parsing.sympy_parser.parse_expr() throws exception.
-        Formula cannot contain the letter 'S' due to sympy.parse_expr. This function converts S to a local dictionary
-        in the formula_string
+        The formula is parsed by FormulaParser, which raises ValueError if the formula is invalid.
+        Formula cannot contain the letters that sympy reserves (like 'S'), so the formulas stay compatible with the
+        formulas saved earlier.
 
         Args:
             formula_string (str): a string logical formula
@@ -33,18 +30,10 @@ class Utils:
             if char not in acceptable_characters:
                 return False
 
-        if ' > ' in formula_string:
-            return False
-        if '&&' in formula_string:
-            return False
-        if '||' in formula_string:
-            return False
-        if '<<' in formula_string:
-            return False
         try:
-            sympy.parse_expr(formula_string)
+            FormulaParser.parse(formula_string)
             return True
-        except (sympy.SympifyError, TypeError, SyntaxError, tokenize.TokenError):
+        except ValueError:
             return False
 
     @staticmethod
@@ -76,8 +65,9 @@ class Utils:
         """
         if not Utils.is_valid_formula(formula):
             raise ValueError
-        list_of_variables = set(re.findall(r'\b[A-Z]\b', formula))
-        return sorted(list_of_variables)
+        if formula == '':
+            return []
+        return list(FormulaParser.parse(formula)[0].variables)
 
     @staticmethod
     def bind_variables_to_substitution_data(list_of_variables: list, data: list) -> dict:
@@ -165,7 +155,8 @@ class Utils:
     @staticmethod
     def check_brackets(formula: str) -> bool:
         """
-        Checking whether the formula's brackets are correct or not.
+        Checking whether the formula's brackets are correct or not. The brackets are correct if every binary
+        operation is in exactly one pair of brackets, and there are no other brackets in the formula.
 
         Args:
             formula (str): string of the logical formula
@@ -175,30 +166,14 @@ class Utils:
         """
         if not isinstance(formula, str):
             return False
-        formula = Utils.formula_re_formatter(formula)
-
-        if len(formula) == 0:
+        if formula.strip() == '':
             return True
 
         try:
-            ast.parse(formula)
-        except SyntaxError:
-            return False
-
-        operations = 0
-        operations += (formula.count('>>') * 2)
-        operations += (formula.count('|') * 2)
-        operations += (formula.count('&') * 2)
-
-        operations = operations - len(re.findall(r'\b[A-Z]\b', formula))
-
-        if formula.count('(') != (operations + 1):
-            return False
-        if formula.count(')') != (operations + 1):
+            return FormulaParser.parse(formula)[1]
+        except ValueError:
             return False
 
-        return True
-
     @staticmethod
     def saving_new_proving_method_config(formula_set_string: str,
                                          consequence_formula: str) -> bool:
@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class AddStepStatus(Enum):
+    """
+    Enum for the result of Model.try_add_step.
+    ADDED: the step is appended to the steps
+    DUPLICATE: the formula of the step is already in the steps
+    RULE_NOT_APPLICABLE: the action can't be used on the given formula or steps
+    INVALID: the action, the formula or the indexes of the params are not valid
+    ENDED: the consequence formula is already proved, no more steps can be added
+    """
+    ADDED = 0
+    DUPLICATE = 1
+    RULE_NOT_APPLICABLE = 2
+    INVALID = 3
+    ENDED = 4
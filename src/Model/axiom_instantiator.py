@@ -0,0 +1,80 @@
+import itertools
+
+from Model.formula import Formula
+
+
+class AxiomInstantiator:
+    """
+    Worker side of the parallel axiom usage of the Solver. A worker process gets shards of the axiom instances:
+    an axiom and the substitution of its first variable, and substitutes every combination of the other
+    variables. The surely irrelevant instances are dropped (or only marked, if the Solver keeps the rejected
+    instances), the substitutions of the others are returned to the Solver, which builds the instances again
+    structurally, and adds them to the steps.
+
+    The steps grow during the axiom usage, so a worker can't know, which instances become relevant later. It
+    keeps an instance if it is relevant for the original steps, or its antecedent (or the negation of its
+    consequent) is an axiom instance, so it could be added to the steps later.
+
+    The workers keep no state between the shards: the data of an axiom usage is in the context of the shards, so
+    the same process pool can be used for every axiom usage of a solving. The shards of a chunk share the context
+    object, so it is sent to a worker once per chunk.
+    """
+
+    @staticmethod
+    def instantiate(shard: tuple) -> (list, int, int):
+        """
+        Substitutes the combinations of the substitutions into an axiom, with a fixed first variable.
+
+        Args:
+            shard: tuple of the axiom's index, the index of the first variable's substitution, and the context:
+                tuple of the parsed base axioms, the formulas to be substituted into the axioms, the formulas of the
+                steps before the axiom usage, the subformulas of the consequence formula and their negations, the
+                relevant_only flag (if False, no instance is dropped), and the keep_rejected flag (if True, the
+                irrelevant instances are marked instead of dropped)
+        Returns:
+            Tuple of the list of the kept instances: tuples of the indexes of the substitutions of the axiom's
+            variables, and whether the instance can be relevant, in the order of the substitutions, the number of
+            the generated instances and the number of the dropped instances
+        """
+        axiom_index, first_index, context = shard
+        schemas, substitutions, steps, goals, relevant_only, keep_rejected = context
+        schema = schemas[axiom_index]
+
+        instances = []
+        generated = 0
+        pruned = 0
+        for rest in itertools.product(range(len(substitutions)), repeat=len(schema.variables) - 1):
+            indexes = (first_index,) + rest
+            generated += 1
+            relevant = True
+            if relevant_only:
+                instance = schema.substitute({variable: substitutions[index]
+                                              for variable, index in zip(schema.variables, indexes)})
+                relevant = AxiomInstantiator.__can_be_relevant(instance, schemas, steps, goals)
+                if not relevant and not keep_rejected:
+                    pruned += 1
+                    continue
+            instances.append((indexes, relevant))
+        return instances, generated, pruned
+
+    @staticmethod
+    def __can_be_relevant(instance: Formula, schemas: list, steps: set, goals: set) -> bool:
+        """
+        Decides whether an axiom instance is relevant for the original steps, or it could become relevant after
+        adding other axiom instances.
+
+        Returns:
+            False if the instance can't be used in the proof
+            True otherwise
+        """
+        if not instance.is_implication():
+            return instance in goals
+        if instance.right in goals:
+            return True
+        negated_consequent = Formula.negation(instance.right)
+        for formula in (instance.left, negated_consequent):
+            if formula in steps:
+                return True
+            if any(schema.match(formula, {}) for schema in schemas):
+                return True
+        return False
@@ -0,0 +1,256 @@
+from Model.model import Model
+from Model.actions import Actions
+from Model.formula import Formula
+from Model.solver_budget import SolverBudget
+from Model.solver_statistics import SolverStatistics
+
+
+class BackwardChainer:
+    """
+    Goal-directed search for the proof of a Model object's task. Starts from the consequence formula, and looks for
+    the rules that could derive the current goal: implications with the goal as consequent (MP), disjunctions (MTP),
+    negated implications (MPT), implications with the negated goal's antecedent (MT), implications to chain (CS) and
+    axiom instances. The premises of the chosen rule become the new goals. A goal is proved if it is in the steps,
+    the proved goals are added to the steps of the model with the rule, that proved them.
+
+    The candidate implications and disjunctions are the subformulas of the steps (hypotheses) and the consequence
+    formula, and the axiom instances (or the implications on their right side) whose consequent matches the goal.
+    The search is iterative deepening, the refuted goals are remembered with the depth they were refuted at.
+
+    Attributes:
+        __model: (Model) the model of the task, the proved goals are added to its steps
+        __budget: (SolverBudget) limits of the search, or None
+        __statistics: (SolverStatistics) the rule usages of the search are counted in it
+        __axioms: (Formula list) parsed base axioms of the model
+        __by_consequent: (dict) id of a formula -> implications with the formula as consequent
+        __by_antecedent: (dict) id of a formula -> implications with the formula as antecedent
+        __by_second_member: (dict) id of a formula -> disjunctions with the formula as second member
+        __by_negated_antecedent: (dict) id of a formula -> implications like (~formula >> ~X)
+        __refuted: (dict) goal -> the greatest depth the goal was refuted at
+        __in_progress: (set) goals on the current search path
+        __cut: (bool) True if the search of the current goal was cut by the depth or by a cycle, so its failure
+               can't be remembered
+    """
+
+    MAX_DEPTH = 10
+
+    def __init__(self, model: Model, budget: SolverBudget = None, statistics: SolverStatistics = None) -> None:
+        """
+        Constructor for BackwardChainer. Indexes the candidate formulas of the model's steps and consequence.
+
+        Args:
+            model: the model of the task
+            budget: if given, it is checked before every goal
+            statistics: if given, the rule usages of the search are counted in it
+        """
+        self.__model = model
+        self.__budget = budget
+        self.__statistics = statistics if statistics is not None else SolverStatistics()
+        self.__axioms = [Formula.parse(axiom) for axiom in model.base_axioms]
+        self.__by_consequent = {}
+        self.__by_antecedent = {}
+        self.__by_second_member = {}
+        self.__by_negated_antecedent = {}
+        self.__refuted = {}
+        self.__in_progress = set()
+        self.__cut = False
+
+        formulas = [step.formula_tree for step in model.steps] + [Formula.parse(model.consequence_formula)]
+        candidates = set()
+        for formula in formulas:
+            for subformula in formula.subformulas():
+                if subformula in candidates:
+                    continue
+                candidates.add(subformula)
+                if subformula.is_implication():
+                    self.__by_consequent.setdefault(id(subformula.right), []).append(subformula)
+                    self.__by_antecedent.setdefault(id(subformula.left), []).append(subformula)
+                    if subformula.left.is_negation() and subformula.right.is_negation():
+                        self.__by_negated_antecedent.setdefault(id(subformula.left.left), []).append(subformula)
+                elif subformula.is_disjunction():
+                    self.__by_second_member.setdefault(id(subformula.right), []).append(subformula)
+
+    @staticmethod
+    def prove(model: Model,
+              max_depth: int = MAX_DEPTH,
+              budget: SolverBudget = None,
+              statistics: SolverStatistics = None) -> bool:
+        """
+        Searches for the proof of the model's consequence formula backwards, with iterative deepening. The
+        hypotheses must be added to the steps before.
+
+        Args:
+            model: the model of the task
+            max_depth: the greatest number of the rule usages on a path from the consequence to a known step
+            budget: if given, it is checked before every goal
+            statistics: if given, the rule usages of the search are counted in it
+        Raises:
+            BudgetExhaustedException: if a limit of the budget is exceeded
+        Returns:
+            True if the consequence formula was derived (model.end is True)
+            False otherwise
+        """
+        if not isinstance(model, Model) or model.consequence_formula == '':
+            return False
+        if model.end:
+            return True
+        chainer = BackwardChainer(model, budget, statistics)
+        goal = Formula.parse(model.consequence_formula)
+        for depth in range(1, max_depth + 1):
+            chainer.__cut = False
+            chainer.__prove(goal, depth)
+            if model.end or not chainer.__cut:
+                break
+        return model.end
+
+    def __prove(self, goal: Formula, depth: int) -> int | None:
+        """
+        Tries to prove the goal with at most depth rule usages on a path.
+
+        Returns:
+            index of the step with the goal, or None if the goal could not be proved
+        """
+        index = self.__model.steps.index_of(str(goal))
+        if index >= 0:
+            return index
+        if self.__model.end:
+            return None
+        if depth == 0 or goal in self.__in_progress:
+            self.__cut = True
+            return None
+        if self.__refuted.get(goal, 0) >= depth:
+            return None
+        if self.__budget is not None:
+            self.__budget.check(len(self.__model.steps))
+
+        self.__in_progress.add(goal)
+        outer_cut = self.__cut
+        self.__cut = False
+        index = self.__prove_with_rules(goal, depth)
+        if index is None and not self.__cut:
+            self.__refuted[goal] = depth
+        self.__cut = self.__cut or outer_cut
+        self.__in_progress.discard(goal)
+        return index
+
+    def __prove_with_rules(self, goal: Formula, depth: int) -> int | None:
+        """
+        Tries the rules that can derive the goal, one after the other.
+
+        Returns:
+            index of the step with the goal, or None if none of the rules could prove it
+        """
+        for axiom in self.__axioms:
+            binding = {}
+            if axiom.match(goal, binding):
+                data = [str(binding[variable]) for variable in axiom.variables]
+                index = self.__add_step(goal, str(axiom), Actions.AXIOM, data=data)
+                if index is not None:
+                    return index
+
+        implications = self.__by_consequent.get(id(goal), []) + self.__axiom_implications(goal)
+        for implication in implications:
+            index = self.__prove_from_premises(goal, Actions.MP, implication, implication.left, depth)
+            if index is not None:
+                return index
+
+        for disjunction in self.__by_second_member.get(id(goal), []):
+            index = self.__prove_from_premises(goal, Actions.MTP, disjunction, Formula.negation(disjunction.left),
+                                               depth)
+            if index is not None:
+                return index
+
+        for implication in self.__by_negated_antecedent.get(id(goal), []):
+            index = self.__prove_from_premises(goal, Actions.MPT, implication, implication.right.left, depth)
+            if index is not None:
+                return index
+
+        if goal.is_negation():
+            for implication in self.__by_antecedent.get(id(goal.left), []):
+                index = self.__prove_from_premises(goal, Actions.MT, implication, Formula.negation(implication.right),
+                                                   depth)
+                if index is not None:
+                    return index
+
+        if goal.is_implication():
+            for implication in self.__by_antecedent.get(id(goal.left), []):
+                if implication is goal:
+                    continue
+                second = Formula.binary('>>', implication.right, goal.right)
+                index = self.__prove_from_premises(goal, Actions.CS, implication, second, depth)
+                if index is not None:
+                    return index
+        return None
+
+    def __axiom_implications(self, goal: Formula) -> list:
+        """
+        Collects the implications with the goal as consequent, that are axiom instances, or can be derived from an
+        axiom instance with MP: the implications on the right side of an axiom, like (B >> A) in (A >> (B >> A)).
+        The variables of the antecedent, that are not bound by the goal, are bound by matching the antecedent to
+        the formulas of the steps. The implications are skipped, if a variable of the axiom remains unbound, or the
+        goal itself would be needed to derive them.
+
+        Returns:
+            list of the implications
+        """
+        implications = []
+        for axiom in self.__axioms:
+            antecedents = []
+            implication = axiom
+            while implication.is_implication():
+                antecedents.append(implication.left)
+                binding = {}
+                if implication.right.match(goal, binding):
+                    bindings = [binding]
+                    if not all(variable in binding for variable in implication.left.variables):
+                        bindings = []
+                        for step in self.__model.steps:
+                            step_binding = dict(binding)
+                            if implication.left.match(step.formula_tree, step_binding):
+                                bindings.append(step_binding)
+                    for binding in bindings:
+                        if not all(variable in binding for variable in axiom.variables):
+                            continue
+                        if all(antecedent.substitute(binding) is not goal
+                               for antecedent in antecedents):
+                            implications.append(implication.substitute(binding))
+                implication = implication.right
+        return implications
+
+    def __prove_from_premises(self,
+                              goal: Formula,
+                              action: Actions,
+                              first: Formula,
+                              second: Formula,
+                              depth: int) -> int | None:
+        """
+        Proves the two premises of a syntax rule as goals, then derives the goal from them.
+
+        Returns:
+            index of the step with the goal, or None if one of the premises could not be proved
+        """
+        first_index = self.__prove(first, depth - 1)
+        if first_index is None:
+            return None
+        second_index = self.__prove(second, depth - 1)
+        if second_index is None:
+            return None
+        return self.__add_step(goal, '', action, first_index, second_index)
+
+    def __add_step(self,
+                   goal: Formula,
+                   formula: str,
+                   action: Actions,
+                   first_index: int = 0,
+                   second_index: int = 0,
+                   data: list = None) -> int | None:
+        """
+        Adds the step of the goal to the model.
+
+        Returns:
+            index of the step with the goal, or None if the step could not be added
+        """
+        status, _ = self.__model.try_add_step(formula, action, first_index, second_index, data)
+        self.__statistics.count_step(action, status)
+        index = self.__model.steps.index_of(str(goal))
+        return index if index >= 0 else None
@@ -0,0 +1,17 @@
+class BudgetExhaustedException(Exception):
+    """
+    This exception raised, when the Solver runs out of one of its budgets (time, steps or memory), or its run is
+    cancelled.
+
+    Attributes:
+        reason: (str) the exhausted budget: 'time', 'steps' or 'memory', or 'cancelled'
+    """
+    def __init__(self, reason: str) -> None:
+        """
+        Constructor of the exception.
+
+        Args:
+            reason: the exhausted budget
+        """
+        super().__init__('Solver budget is exhausted: ' + reason + '!')
+        self.reason = reason
@@ -0,0 +1,246 @@
+import weakref
+import threading
+
+import Model.Utils.formula_parser
+
+
+class Formula:
+    """
+    Immutable, structural representation of a logical formula. Formulas are hash-consed: there is exactly one
+    instance for every distinct formula, so two formulas are equal if and only if they are the same object, and the
+    derived formulas share their subformulas. The formulas are created under a lock, so threads (for example the
+    background workers) can't create two instances of the same formula.
+
+    Attributes:
+        connective: (str) main connective of the formula: '' for variables, otherwise '~', '&', '|' or '>>'
+        name: (str) name of the variable, '' for compound formulas
+        left: (Formula) body of a negation, or the first member of a binary formula, None for variables
+        right: (Formula) second member of a binary formula, None for variables and negations
+        __text: (str) reformatted string of the formula, like the Utils.formula_re_formatter output
+        __variables: (tuple) sorted variables of the formula, computed on first use
+    """
+    __slots__ = ('connective', 'name', 'left', 'right', '__text', '__variables', '__weakref__')
+
+    __instances = weakref.WeakValueDictionary()
+    __lock = threading.Lock()
+
+    BINARY_CONNECTIVES = ('>>', '&', '|')
+
+    def __init__(self, connective: str, name: str, left, right, text: str) -> None:
+        """
+        Constructor for Formula. Use the variable, negation and binary functions instead, they keep the formulas
+        unique.
+        """
+        object.__setattr__(self, 'connective', connective)
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'left', left)
+        object.__setattr__(self, 'right', right)
+        object.__setattr__(self, '_Formula__text', text)
+        object.__setattr__(self, '_Formula__variables', None)
+
+    def __setattr__(self, key, value) -> None:
+        raise AttributeError('Formula is immutable!')
+
+    def __delattr__(self, key) -> None:
+        raise AttributeError('Formula is immutable!')
+
+    def __str__(self) -> str:
+        return self.__text
+
+    def __repr__(self) -> str:
+        return 'Formula(' + repr(self.__text) + ')'
+
+    def __reduce__(self) -> tuple:
+        return Formula.parse, (self.__text,)
+
+    @staticmethod
+    def variable(name: str) -> 'Formula':
+        """
+        Gives the unique formula of a variable.
+
+        Args:
+            name: one capital letter
+        Returns:
+            the variable formula
+        """
+        key = ('', name)
+        formula = Formula.__instances.get(key)
+        if formula is None:
+            with Formula.__lock:
+                formula = Formula.__instances.get(key)
+                if formula is None:
+                    formula = Formula('', name, None, None, name)
+                    Formula.__instances[key] = formula
+        return formula
+
+    @staticmethod
+    def negation(body: 'Formula') -> 'Formula':
+        """
+        Gives the unique negation of a formula.
+
+        Args:
+            body: the negated formula
+        Returns:
+            the negation formula
+        """
+        key = ('~', id(body))
+        formula = Formula.__instances.get(key)
+        if formula is None:
+            with Formula.__lock:
+                formula = Formula.__instances.get(key)
+                if formula is None:
+                    formula = Formula('~', '', body, None, '~' + body.__text)
+                    Formula.__instances[key] = formula
+        return formula
+
+    @staticmethod
+    def binary(connective: str, left: 'Formula', right: 'Formula') -> 'Formula':
+        """
+        Gives the unique binary formula of the connective and the members.
+
+        Args:
+            connective: '>>', '&' or '|'
+            left: first member of the formula
+            right: second member of the formula
+        Returns:
+            the binary formula
+        """
+        key = (connective, id(left), id(right))
+        formula = Formula.__instances.get(key)
+        if formula is None:
+            with Formula.__lock:
+                formula = Formula.__instances.get(key)
+                if formula is None:
+                    text = '(' + left.__text + ' ' + connective + ' ' + right.__text + ')'
+                    formula = Formula(connective, '', left, right, text)
+                    Formula.__instances[key] = formula
+        return formula
+
+    @staticmethod
+    def parse(formula_string: str) -> 'Formula':
+        """
+        Parses a logical formula string into its unique Formula. Every binary operation must be in brackets, like
+        in the reformatted formulas. Parsing is done by FormulaParser, which caches the results.
+
+        Raises:
+            ValueError: if the string is not a valid, correctly bracketed logical formula
+
+        Args:
+            formula_string: logical formula
+        Returns:
+            the parsed formula
+        """
+        formula, bracketed = Model.Utils.formula_parser.FormulaParser.parse(formula_string)
+        if not bracketed:
+            raise ValueError
+        return formula
+
+    def compact(self) -> str:
+        """
+        Returns:
+            the formula string without spaces
+        """
+        return self.__text.replace(' ', '')
+
+    @property
+    def variables(self) -> tuple:
+        """
+        Returns:
+            sorted tuple of the variables in the formula
+        """
+        if self.__variables is None:
+            if self.connective == '':
+                variables = (self.name,)
+            elif self.connective == '~':
+                variables = self.left.variables
+            else:
+                variables = tuple(sorted(set(self.left.variables) | set(self.right.variables)))
+            object.__setattr__(self, '_Formula__variables', variables)
+        return self.__variables
+
+    def is_implication(self) -> bool:
+        """
+        Returns:
+            True if the main connective of the formula is an implication, otherwise False
+        """
+        return self.connective == '>>'
+
+    def is_negation(self) -> bool:
+        """
+        Returns:
+            True if the main connective of the formula is a negation, otherwise False
+        """
+        return self.connective == '~'
+
+    def is_disjunction(self) -> bool:
+        """
+        Returns:
+            True if the main connective of the formula is a disjunction, otherwise False
+        """
+        return self.connective == '|'
+
+    def substitute(self, binding: dict) -> 'Formula':
+        """
+        Substitutes formulas into the variables of the formula, simultaneously.
+
+        Args:
+            binding: name of a variable -> the formula to be substituted, unbound variables are kept
+        Returns:
+            the formula after the substitution
+        """
+        if self.connective == '':
+            return binding.get(self.name, self)
+        if self.connective == '~':
+            return Formula.negation(self.left.substitute(binding))
+        return Formula.binary(self.connective, self.left.substitute(binding), self.right.substitute(binding))
+
+    def match(self, formula: 'Formula', binding: dict) -> bool:
+        """
+        Decides whether the formula is an instance of this formula (used as a schema), and binds the variables.
+
+        Args:
+            formula: formula to be matched
+            binding: name of a variable -> the formula it is bound to, the function extends it
+        Returns:
+            True if the formula is an instance of the schema with the binding
+            False otherwise
+        """
+        pairs = [(self, formula)]
+        while pairs:
+            schema, formula = pairs.pop()
+            if schema.connective == '':
+                bound = binding.setdefault(schema.name, formula)
+                if bound is not formula:
+                    return False
+            elif schema.connective != formula.connective:
+                return False
+            else:
+                pairs.append((schema.left, formula.left))
+                if schema.right is not None:
+                    pairs.append((schema.right, formula.right))
+        return True
+
+    def subformulas(self) -> list:
+        """
+        Collects all different subformulas of the formula (including itself), the members before the formula.
+
+        Returns:
+            list of the subformulas
+        """
+        subformulas = []
+        visited = set()
+        stack = [(self, False)]
+        while stack:
+            formula, expanded = stack.pop()
+            if expanded:
+                subformulas.append(formula)
+                continue
+            if id(formula) in visited:
+                continue
+            visited.add(id(formula))
+            stack.append((formula, True))
+            if formula.right is not None:
+                stack.append((formula.right, False))
+            if formula.left is not None:
+                stack.append((formula.left, False))
+        return subformulas
@@ -1,6 +1,8 @@
-import sympy.logic.boolalg
-from sympy import *
+from functools import lru_cache
+
+from Model.formula import Formula
 from Model.Utils.utils import Utils
+from Model.Utils.formula_parser import FormulaParser
 
 
 class FormulaReader:
@@ -8,11 +10,15 @@ class FormulaReader:
     This class can convert strings to logical formulas, generate truth table to the formulas and can decide
     that formulas are tautologies or not.
 
+    The truth table is bit-parallel: the truth values of a (sub)formula in all the 2^n interpretations are the bits
+    of one integer, so every connective is evaluated in all interpretations at the same time with one bitwise
+    operation.
+
     Attributes:
         __formula_string: (str) raw formula itself
-        __formula: (logical_formula) parsed logical formula
+        __formula: (Formula) parsed logical formula
         __variable_list: (str list) the formula's variable
-        __truth_table: (truth table) contains formula's all variable, and all interpretations with substitution value
+        __truth_table: (int) the formula's truth values, the i-th bit is the value in the i-th interpretation
     """
     def __init__(self) -> None:
         """
@@ -28,23 +34,58 @@ class FormulaReader:
         Converts strings to logical formula.
 
         Gets all variables from the logical formula into formula_variables.
-        sympy.parse_expr(self.formula_string) parse a string into a logical formula
+        FormulaParser.parse(self.formula_string) parse a string into a logical formula
         """
         if not Utils.is_valid_formula(current_formula_string):
             return
         self.__formula_string = current_formula_string
-        formula_variables = set(symbols([c for c in self.__formula_string if c.isalpha()]))
-        self.__variable_list = list(formula_variables)
-        self.__formula = sympy.parse_expr(self.__formula_string)
+        self.__formula = FormulaParser.parse(self.__formula_string)[0]
+        self.__variable_list = list(self.__formula.variables)
 
     def __create_truth_table(self) -> None:
         """
-        Create a truth table from the formula with sympy.logic.boolalg.truth_table() method
+        Create a truth table from the formula with FormulaReader.truth_table() method
         The truth table contain all values for the variation of the formula.
         """
-        if not Utils.is_valid_formula(self.__formula_string):
+        if self.__formula is None:
             return
-        self.__truth_table = sympy.logic.boolalg.truth_table(self.__formula_string, self.__variable_list)
+        self.__truth_table = FormulaReader.truth_table(self.__formula)
+
+    @staticmethod
+    @lru_cache(maxsize=1 << 14)
+    def truth_table(formula: Formula) -> int:
+        """
+        Evaluates the formula in all interpretations of its variables at the same time. The interpretations are
+        numbered: in the i-th interpretation the value of the j-th variable (in formula.variables) is the j-th bit
+        of i. The results are cached, because the formulas are unique.
+
+        Args:
+            formula: the parsed logical formula
+        Returns:
+            integer of 2^n bits, the i-th bit is the value of the formula in the i-th interpretation
+        """
+        number_of_rows = 1 << len(formula.variables)
+        mask = (1 << number_of_rows) - 1
+        values = {}
+        for index, variable in enumerate(formula.variables):
+            block = 1 << index
+            column = ((1 << block) - 1) << block
+            length = block << 1
+            while length < number_of_rows:
+                column |= column << length
+                length <<= 1
+            values[id(Formula.variable(variable))] = column
+
+        for subformula in formula.subformulas():
+            if subformula.connective == '~':
+                values[id(subformula)] = mask ^ values[id(subformula.left)]
+            elif subformula.connective == '&':
+                values[id(subformula)] = values[id(subformula.left)] & values[id(subformula.right)]
+            elif subformula.connective == '|':
+                values[id(subformula)] = values[id(subformula.left)] | values[id(subformula.right)]
+            elif subformula.connective == '>>':
+                values[id(subformula)] = (mask ^ values[id(subformula.left)]) | values[id(subformula.right)]
+        return values[id(formula)]
 
     def is_tautology(self, current_formula_string: str) -> bool:
         """
@@ -63,7 +104,4 @@ class FormulaReader:
             return False
         self.__formula_converter(current_formula_string)
         self.__create_truth_table()
-        for row in self.__truth_table:
-            if not row[len(row)-1]:
-                return False
-        return True
+        return self.__truth_table == (1 << (1 << len(self.__variable_list))) - 1
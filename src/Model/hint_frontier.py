@@ -0,0 +1,90 @@
+import heapq
+
+from Model.actions import Actions
+from Model.step_store import StepStore
+from Model.solver_budget import SolverBudget
+from Model.Rules.modus_ponens import ModusPonens
+from Model.Rules.modus_tollens import ModusTollens
+from Model.Rules.modus_tollendo_ponens import ModusTollendoPonens
+from Model.Rules.modus_ponendo_tollens import ModusPonendoTollens
+from Model.Rules.conditional_syllogism import ConditionalSyllogism
+
+
+class HintFrontier:
+    """
+    Keeps the pending syntax rule usages of the steps for the hints. When a step is appended, only its pairs with
+    the steps before it are examined (looked up in the member indexes of the StepStore), and the first rule of the
+    pair, that can be used, is applied. The results, that are not in the steps, are kept in a heap ordered by the
+    pair's indexes. A hint is the first pair of the heap, the pairs whose results were added to the steps are
+    dropped from the heap.
+
+    The steps can only grow, a frontier can't follow the deletion of steps, it must be built again.
+
+    Attributes:
+        __steps: (StepStore) the steps of the model
+        __heap: (list) heap of (first index, second index, result formula) tuples
+        __size: (int) number of the steps, whose pairs are already examined
+    """
+
+    RULES = {Actions.MP: ModusPonens(), Actions.MT: ModusTollens(), Actions.MTP: ModusTollendoPonens(),
+             Actions.MPT: ModusPonendoTollens(), Actions.CS: ConditionalSyllogism()}
+
+    def __init__(self, steps: StepStore) -> None:
+        """
+        Constructor for HintFrontier.
+
+        Args:
+            steps: the steps of the model
+        """
+        self.__steps = steps
+        self.__heap = []
+        self.__size = 0
+
+    def follows(self, steps: StepStore) -> bool:
+        """
+        Args:
+            steps: the current steps of the model
+        Returns:
+            True if the frontier can be updated to the steps: they are the same steps, and no step was deleted
+            False otherwise
+        """
+        return steps is self.__steps and len(steps) >= self.__size
+
+    def next_hint(self, budget: SolverBudget = None) -> tuple | None:
+        """
+        Examines the new steps, then gives the first pair of the steps, whose result is not in the steps.
+
+        Raises:
+            BudgetExhaustedException: if a limit of the budget is exceeded, or it is cancelled
+
+        Args:
+            budget: if given, it is checked before examining a step
+        Returns:
+            Tuple of the first and the second param's index, or None if there is no usable pair
+        """
+        self.__update(budget)
+        while self.__heap:
+            first, second, result = self.__heap[0]
+            if not self.__steps.contains_formula(result):
+                return first, second
+            heapq.heappop(self.__heap)
+        return None
+
+    def __update(self, budget: SolverBudget) -> None:
+        """
+        Examines the pairs of the steps appended since the last update, with the steps before them.
+        """
+        while self.__size < len(self.__steps):
+            if budget is not None:
+                budget.check(len(self.__steps))
+            index = self.__size
+            tried = set()
+            for action, first, second in self.__steps.partners(index, index + 1):
+                if (first, second) in tried:
+                    continue
+                tried.add((first, second))
+                result = HintFrontier.RULES[action].apply(self.__steps[first].formula_tree,
+                                                          self.__steps[second].formula_tree)
+                if result is not None and not self.__steps.contains_formula(str(result)):
+                    heapq.heappush(self.__heap, (first, second, str(result)))
+            self.__size += 1
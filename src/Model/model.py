@@ -1,9 +1,21 @@
+import copy
+import json
+import hmac
+import hashlib
+import threading
+
 from Model.step import Step
+from Model.formula import Formula
+from Model.step_store import StepStore
+from Model.hint_frontier import HintFrontier
+from Model.solver_budget import SolverBudget
 from Model.actions import Actions
+from Model.add_step_status import AddStepStatus
 from Model.Utils.utils import Utils
 from Persistence.axiom_reader import AxiomReader
 from Persistence.data_access import DataAccess
 from Model.formula_reader import FormulaReader
+from Model.sat_solver import SatSolver
 from Model.Rules.modus_ponens import ModusPonens
 from Model.Rules.modus_tollens import ModusTollens
 from Model.Rules.modus_tollendo_ponens import ModusTollendoPonens
@@ -19,19 +31,25 @@ class Model:
     Attributes:
         formula_set: (str list) list of logical formulas, as string, hypothesis
         consequence_formula: (str) consequence logical formula, that will should be proved
-        steps: (Step list) list of steps in the proving method
+        steps: (StepStore) list of steps in the proving method, indexed by the steps' formulas
         number_of_steps: (int) current number of steps. Used as an id for new steps as well
         end: (bool) represents that the consequence_formula is proved, or not
         base_axioms: (str list) list that contains the base axioms (read from json file)
         added_axioms: (str list) list that contains added axioms (added in runtime)
         __axiom_reader: (AxiomReader) sets the base axioms for the model. Use the AxiomReader.read_axioms function
         __data_access: (DataAccess) manages files and database. Handles saving loading functions.
+        __hint_frontier: (HintFrontier) pending syntax rule usages of the steps for get_hint, None if it must be
+                         built again
+        __verified: (bool) result of checking the steps, None if the steps of a trusted save were not checked (yet)
+        __verification: (Thread) background checking of the steps of a trusted save, None if there is none
     """
 
     def __init__(self,
                  formula_set: list = None,
                  consequence_formula: str = None,
-                 file_path: str = None) -> None:
+                 file_path: str = None,
+                 data_access: DataAccess = None,
+                 verify: str = 'none') -> None:
         """
         Constructor to Model class.
         If the constructor gets the formula_set and consequence_formula as param, then the function
@@ -45,9 +63,12 @@ class Model:
             formula_set: list of logical formulas, as string, hypothesis
             consequence_formula: consequence logical formula, that will should be proved
             file_path: string to  a file, that contains data for a model.
+            data_access: the storage of the saves, the default is the JSON files of DataAccess (for example
+                SqliteDataAccess stores them in a database)
+            verify: checking of the loaded save, 'full', 'lazy' or 'none' (see load_model)
         """
         self.__axiom_reader = AxiomReader()
-        self.__data_access = DataAccess()
+        self.__data_access = data_access if data_access is not None else DataAccess()
         self.base_axioms = self.__axiom_reader.read_axioms_from_json()
         if not self.__axiom_checker(self.base_axioms):
             raise ValueError
@@ -58,6 +79,9 @@ class Model:
         self.steps = None
         self.number_of_steps = None
         self.end = None
+        self.__hint_frontier = None
+        self.__verified = True
+        self.__verification = None
 
         if (formula_set or (formula_set == [])) and consequence_formula and (file_path is None):
             try:
@@ -70,13 +94,13 @@ class Model:
                 self.formula_set.append(Utils.formula_re_formatter(formula))
 
             self.consequence_formula = Utils.formula_re_formatter(consequence_formula)
-            self.steps = []
+            self.steps = StepStore()
             self.number_of_steps = 0
             self.end = False
 
         elif (formula_set is None) and (consequence_formula is None) and file_path:
             try:
-                if not self.load_model(file_path):
+                if not self.load_model(file_path, verify):
                     raise ValueError
             except Exception:
                 raise ValueError
@@ -93,7 +117,10 @@ class Model:
                  data: list = None) -> bool:
         """
         Tries to add the current_step to steps, if possible.
-        Checks the action and tries to execute the correct action, after conflict resolution
+        Checks the action and tries to execute the correct action, after conflict resolution (see try_add_step).
+
+        Raises:
+            FormulaInStepsException: if the formula of the step is already in the steps
 
         Args:
             formula: logical formula, related to the action-param
@@ -106,52 +133,147 @@ class Model:
         Returns:
             Whether the addition was successful or not
         """
+        status, _ = self.try_add_step(formula, action, implication_formula_number, formula_to_be_detached_number,
+                                      data)
+        if status == AddStepStatus.DUPLICATE:
+            raise FormulaInStepsException
+        return status == AddStepStatus.ADDED
+
+    def try_add_step(self,
+                     formula: str,
+                     action: Actions,
+                     implication_formula_number: int = 0,
+                     formula_to_be_detached_number: int = 0,
+                     data: list = None) -> tuple:
+        """
+        Tries to add the current_step to steps, if possible, without raising exceptions.
+        Checks the action and tries to execute the correct action, after conflict resolution
+
+        Args:
+            formula: logical formula, related to the action-param
+            action: that will be executed
+            implication_formula_number: index of the rule functions first param, in steps
+            formula_to_be_detached_number: index of the rule functions second param, in steps
+            data: list of logical formula strings. List length must be exactly the same as how many
+                variable are in the current step's formula.
+
+        Returns:
+            Tuple of the AddStepStatus and the index of the step: the index of the new step if it is ADDED, the
+            index of the step with the same formula if it is DUPLICATE, -1 otherwise
+        """
         if data is None:
             data = []
         if self.end:
-            return False
+            return AddStepStatus.ENDED, -1
         if not isinstance(action, Actions):
-            return False
+            return AddStepStatus.INVALID, -1
         try:
             current_step = Step(self.number_of_steps, formula, action, rule_implication=implication_formula_number,
                                 rule_detached=formula_to_be_detached_number)
         except ValueError:
-            return False
+            return AddStepStatus.INVALID, -1
 
         if current_step.action == Actions.HYP:
             current_step = self.__action_hyp(current_step)
         elif current_step.action == Actions.AXIOM:
             current_step = self.__action_axiom(current_step, data)
-        elif current_step.action == Actions.MP:
-            current_step = self.__action_syntax_rule(current_step, implication_formula_number,
-                                                     formula_to_be_detached_number)
-        elif current_step.action == Actions.MT:
-            current_step = self.__action_syntax_rule(current_step, implication_formula_number,
-                                                     formula_to_be_detached_number)
-        elif current_step.action == Actions.MTP:
-            current_step = self.__action_syntax_rule(current_step, implication_formula_number,
-                                                     formula_to_be_detached_number)
-        elif current_step.action == Actions.MPT:
-            current_step = self.__action_syntax_rule(current_step, implication_formula_number,
-                                                     formula_to_be_detached_number)
-        elif current_step.action == Actions.CS:
+        else:
+            if not self.__valid_param_indexes(implication_formula_number, formula_to_be_detached_number):
+                return AddStepStatus.INVALID, -1
             current_step = self.__action_syntax_rule(current_step, implication_formula_number,
                                                      formula_to_be_detached_number)
 
-        else:
-            current_step = None
-
         if current_step is None:
-            return False
+            return AddStepStatus.RULE_NOT_APPLICABLE, -1
+        return self.__try_append(current_step)
 
-        try:
-            if not self.__steps_append(current_step):
-                return False
-        except FormulaInStepsException:
-            raise FormulaInStepsException
+    def try_add_axiom_instance(self, axiom_index: int, instance: Formula) -> tuple:
+        """
+        Tries to add an instance of a base axiom, that is already substituted (for example by the Solver), without
+        substituting into the axiom's string and checking the substitutions again. The instance is matched to the
+        axiom structurally, the step is the same as the step of try_add_step with the matched substitutions.
+
+        Args:
+            axiom_index: index of the axiom in the base axioms
+            instance: the substituted axiom
+
+        Returns:
+            Tuple of the AddStepStatus and the index of the step (see try_add_step), INVALID if the formula is not
+            an instance of the axiom
+        """
+        if self.end:
+            return AddStepStatus.ENDED, -1
+        if not isinstance(axiom_index, int) or not 0 <= axiom_index < len(self.base_axioms):
+            return AddStepStatus.INVALID, -1
+        if not isinstance(instance, Formula):
+            return AddStepStatus.INVALID, -1
+        schema = Formula.parse(self.base_axioms[axiom_index])
+        binding = {}
+        if not schema.match(instance, binding):
+            return AddStepStatus.INVALID, -1
+
+        current_step = Step(self.number_of_steps, '', Actions.AXIOM)
+        current_step.formula = str(instance)
+        current_step.axiom_details = '[AXIOM: ' + str(axiom_index + 1) + '.'
+        for variable in schema.variables:
+            current_step.axiom_details = current_step.axiom_details + ' ' + variable + '=' + str(binding[variable])
+        current_step.axiom_details = current_step.axiom_details + ']'
+        return self.__try_append(current_step)
+
+    def __try_append(self, step: Step) -> tuple:
+        """
+        Appends a new step to the steps, if possible, and checks the end of the proving.
+
+        Args:
+            step: the new step
+
+        Returns:
+            Tuple of the AddStepStatus and the index of the step (see try_add_step)
+        """
+        status = self.__append_status(step)
+        if status == AddStepStatus.DUPLICATE:
+            return status, self.steps.index_of(step.formula)
+        if status != AddStepStatus.ADDED:
+            return status, -1
         self.number_of_steps += 1
         self.__check_end()
-        return True
+        return status, step.step_id
+
+    def try_add_steps(self, requests: list) -> list:
+        """
+        Bulk form of try_add_step, tries to add the steps in order. The steps after the consequence formula is proved
+        are not tried, their status is ENDED.
+
+        Args:
+            requests: list of tuples of the params of try_add_step: (formula, action), or
+                (formula, action, implication_formula_number, formula_to_be_detached_number), or
+                (formula, action, implication_formula_number, formula_to_be_detached_number, data)
+
+        Returns:
+            list of (AddStepStatus, index) tuples, one for every request (see try_add_step)
+        """
+        results = []
+        for request in requests:
+            if self.end:
+                results.append((AddStepStatus.ENDED, -1))
+            else:
+                results.append(self.try_add_step(*request))
+        return results
+
+    def __valid_param_indexes(self, implication_formula_number: int, formula_to_be_detached_number: int) -> bool:
+        """
+        Checks the indexes of a syntax rule's params.
+
+        Returns:
+            True if the indexes are different indexes of the steps
+            False otherwise
+        """
+        if not isinstance(implication_formula_number, int) or not isinstance(formula_to_be_detached_number, int):
+            return False
+        if implication_formula_number == formula_to_be_detached_number:
+            return False
+        return (0 <= implication_formula_number < len(self.steps) and
+                0 <= formula_to_be_detached_number < len(self.steps))
 
     @staticmethod
     def __input_checker(formula_set: list, consequence_formula: str) -> None:
@@ -356,7 +478,7 @@ class Model:
                               formula_to_be_detached_number: int) -> Step | None:
         """
         Tries to execute modus ponens rule, if possible.
-        If it's possible, the  current step will contain the ModusPonens.rule() return value.
+        If it's possible, the  current step will contain the ModusPonens.apply() return value.
 
         Args:
             step: current step
@@ -367,16 +489,13 @@ class Model:
             Otherwise return the current step, current step's formula will be the return value of the MP function
         """
         try:
-            current_mp = ModusPonens.rule(ModusPonens(), (self.steps[implication_formula_number]).formula,
-                                          (self.steps[formula_to_be_detached_number]).formula)
-        except IndexError:
+            current_mp = ModusPonens().apply(self.steps[implication_formula_number].formula_tree,
+                                             self.steps[formula_to_be_detached_number].formula_tree)
+        except (IndexError, ValueError):
             return None
-        if not current_mp[0]:
+        if current_mp is None:
             return None
-        else:
-            current_formula = current_mp[1]
-            current_formula = Utils.formula_re_formatter(current_formula)
-            step.formula = current_formula
+        step.formula = str(current_mp)
         return step
 
     def __action_modus_tollens(self,
@@ -385,7 +504,7 @@ class Model:
                                formula_to_be_detached_number: int) -> Step | None:
         """
         Tries to execute modus tollens rule, if possible.
-        If it's possible, the  current step will contain the ModusTollens.rule() return value.
+        If it's possible, the  current step will contain the ModusTollens.apply() return value.
 
         Args:
             step: current step
@@ -396,16 +515,13 @@ class Model:
             Otherwise return the current step, current step's formula will be the return value of the MT function
         """
         try:
-            current_mt = ModusTollens.rule(ModusTollens(), (self.steps[implication_formula_number]).formula,
-                                           (self.steps[formula_to_be_detached_number]).formula)
-        except IndexError:
+            current_mt = ModusTollens().apply(self.steps[implication_formula_number].formula_tree,
+                                              self.steps[formula_to_be_detached_number].formula_tree)
+        except (IndexError, ValueError):
             return None
-        if not current_mt[0]:
+        if current_mt is None:
             return None
-        else:
-            current_formula = current_mt[1]
-            current_formula = Utils.formula_re_formatter(current_formula)
-            step.formula = current_formula
+        step.formula = str(current_mt)
         return step
 
     def __action_modus_tollendo_tollens(self,
@@ -414,7 +530,7 @@ class Model:
                                         formula_to_be_detached_number: int) -> Step | None:
         """
        Tries to execute modus tollendo ponens rule, if possible.
-       If it's possible, the  current step will contain the ModusTollendoPonens.rule() return value.
+       If it's possible, the  current step will contain the ModusTollendoPonens.apply() return value.
 
        Args:
            step: current step
@@ -425,17 +541,13 @@ class Model:
            Otherwise return the current step, current step's formula will be the return value of the MTP function
        """
         try:
-            current_mtp = ModusTollendoPonens.rule(ModusTollendoPonens(),
-                                                   (self.steps[disjunction_formula_number]).formula,
-                                                   (self.steps[formula_to_be_detached_number]).formula)
-        except IndexError:
+            current_mtp = ModusTollendoPonens().apply(self.steps[disjunction_formula_number].formula_tree,
+                                                      self.steps[formula_to_be_detached_number].formula_tree)
+        except (IndexError, ValueError):
             return None
-        if not current_mtp[0]:
+        if current_mtp is None:
             return None
-        else:
-            current_formula = current_mtp[1]
-            current_formula = Utils.formula_re_formatter(current_formula)
-            step.formula = current_formula
+        step.formula = str(current_mtp)
         return step
 
     def __action_modus_ponendo_tollens(self,
@@ -444,7 +556,7 @@ class Model:
                                        formula_to_be_detached_number: int) -> Step | None:
         """
        Tries to execute modus ponendo tollens rule, if possible.
-       If it's possible, the  current step will contain the ModusPonendoTollens.rule() return value.
+       If it's possible, the  current step will contain the ModusPonendoTollens.apply() return value.
 
        Args:
            step: current step
@@ -455,17 +567,13 @@ class Model:
            Otherwise return the current step, current step's formula will be the return value of the MPT function
        """
         try:
-            current_mpt = ModusPonendoTollens.rule(ModusPonendoTollens(),
-                                                   (self.steps[disjunction_formula_number]).formula,
-                                                   (self.steps[formula_to_be_detached_number]).formula)
-        except IndexError:
+            current_mpt = ModusPonendoTollens().apply(self.steps[disjunction_formula_number].formula_tree,
+                                                      self.steps[formula_to_be_detached_number].formula_tree)
+        except (IndexError, ValueError):
             return None
-        if not current_mpt[0]:
+        if current_mpt is None:
             return None
-        else:
-            current_formula = current_mpt[1]
-            current_formula = Utils.formula_re_formatter(current_formula)
-            step.formula = current_formula
+        step.formula = str(current_mpt)
         return step
 
     def __action_conditional_syllogism(self,
@@ -474,7 +582,7 @@ class Model:
                                        second_implication_formula_number: int) -> Step | None:
         """
        Tries to execute conditional syllogism rule, if possible.
-       If it's possible, the  current step will contain the ConditionalSyllogism.rule() return value.
+       If it's possible, the  current step will contain the ConditionalSyllogism.apply() return value.
 
        Args:
            step: current step
@@ -485,21 +593,16 @@ class Model:
            Otherwise return the current step, current step's formula will be the return value of the CS function
        """
         try:
-            current_cs = ConditionalSyllogism.rule(ConditionalSyllogism(),
-                                                   (self.steps[first_implication_formula_number]).formula,
-                                                   (self.steps[second_implication_formula_number]).formula)
-            if not current_cs[0]:
-                current_cs = ConditionalSyllogism.rule(ConditionalSyllogism(),
-                                                       (self.steps[second_implication_formula_number]).formula,
-                                                       (self.steps[first_implication_formula_number]).formula)
-            if not current_cs[0]:
-                return None
-        except IndexError:
+            first_implication = self.steps[first_implication_formula_number].formula_tree
+            second_implication = self.steps[second_implication_formula_number].formula_tree
+        except (IndexError, ValueError):
             return None
-        else:
-            current_formula = current_cs[1]
-            current_formula = Utils.formula_re_formatter(current_formula)
-            step.formula = current_formula
+        current_cs = ConditionalSyllogism().apply(first_implication, second_implication)
+        if current_cs is None:
+            current_cs = ConditionalSyllogism().apply(second_implication, first_implication)
+        if current_cs is None:
+            return None
+        step.formula = str(current_cs)
         return step
 
     def __check_end(self) -> None:
@@ -507,44 +610,58 @@ class Model:
         Checks if the consequence_formula appears in the steps.formula
         If it appears, then it means that it is a consequence formula, and the proving method can end,
         otherwise the method may continue.
+        The steps are looked up in the formula index of the steps, instead of scanning them.
         """
-        for formula in self.formula_set:
-            if formula == self.consequence_formula:
-                self.end = True
-                return
-        for step in self.steps:
-            if self.consequence_formula == step.formula:
-                self.end = True
-                return
-        self.end = False
+        self.end = (self.consequence_formula in self.formula_set or
+                    self.steps.contains_formula(self.consequence_formula))
 
     def __steps_append(self, step: Step) -> bool:
         """
         Appending to self steps list, if it's possible, if step id contained by steps, returns False, otherwise True
         If the step is None, return False
+        Duplicates are searched in the formula index of the steps, instead of scanning them.
+
+        Raises:
+            FormulaInStepsException: if the formula of the step is already in the steps
 
         Args:
             step: step will be appended if possible
         Returns:
              whether to append was successful or not
         """
+        status = self.__append_status(step)
+        if status == AddStepStatus.DUPLICATE:
+            raise FormulaInStepsException
+        return status == AddStepStatus.ADDED
+
+    def __append_status(self, step: Step) -> AddStepStatus:
+        """
+        Appends the step to self steps list, if it's possible, without raising exceptions.
+        Duplicates are searched in the formula index of the steps, instead of scanning them.
+
+        Args:
+            step: step will be appended if possible
+        Returns:
+            ADDED if the step is appended, DUPLICATE if its formula is already in the steps, INVALID if the step or
+            its id is not valid
+        """
         if step is None:
-            return False
+            return AddStepStatus.INVALID
         if not isinstance(step, Step):
-            return False
-        counter = 0
+            return AddStepStatus.INVALID
         step_id = step.step_id
-        for current_step in self.steps:
-            counter += 1
-            if current_step.step_id == step_id:
-                return False
-            if current_step.formula == step.formula:
-                raise FormulaInStepsException
-        if counter != step_id:
-            return False
+        formula_index = self.steps.index_of(step.formula)
+        if step_id < len(self.steps):
+            if formula_index != -1 and formula_index < step_id:
+                return AddStepStatus.DUPLICATE
+            return AddStepStatus.INVALID
+        if formula_index != -1:
+            return AddStepStatus.DUPLICATE
+        if len(self.steps) != step_id:
+            return AddStepStatus.INVALID
 
         self.steps.append(step)
-        return True
+        return AddStepStatus.ADDED
 
     def new(self, formula_set: list, consequence_formula: str) -> None:
         """
@@ -554,7 +671,7 @@ class Model:
             formula_set: list of logical formulas, as string, hypothesis
             consequence_formula: consequence logical formula, that will should be proved
         """
-        self.__init__(formula_set, consequence_formula)
+        self.__init__(formula_set, consequence_formula, data_access=self.__data_access)
 
     def get_formula_set_consequence_concat(self) -> str:
         """
@@ -574,48 +691,66 @@ class Model:
             concat = '{' + concat + '} |- ' + self.consequence_formula
         return str(concat)
 
-    def get_steps_string(self) -> list:
+    def get_steps_string(self, indexes: list = None) -> list:
         """
         Runs through self steps and generates a list of strings. Strings contains all data from each step.
+        If the indexes are given, only those steps are listed, and they are renumbered from 1: the references of the
+        syntax rules point to the new numbers.
 
+        Args:
+            indexes: sorted indexes of the steps to be listed, that contain the parents of the listed steps.
+                All steps are listed if it is None.
         Returns:
             steps (list of strings) contains string that represents model steps.
         """
-        steps = []
-        for step in self.steps:
+        try:
+            return list(self.iter_steps_string(indexes))
+        except ValueError:
+            return []
+
+    def iter_steps_string(self, indexes: list = None):
+        """
+        Generates the strings of the steps one by one, like get_steps_string, without building the list of them.
+
+        Raises:
+            ValueError: if a step has an unknown action
+
+        Args:
+            indexes: sorted indexes of the steps to be listed, that contain the parents of the listed steps.
+                All steps are listed if it is None.
+        Returns:
+            generator of the strings of the steps
+        """
+        if indexes is None:
+            indexes = range(len(self.steps))
+        numbers = {index: number + 1 for number, index in enumerate(indexes)}
+        rule_names = {Actions.MP: 'MP', Actions.MT: 'MT', Actions.MTP: 'MTP', Actions.MPT: 'MPT', Actions.CS: 'CS'}
+        for index in indexes:
+            step = self.steps[index]
+            number = str(numbers[index])
             if step.action == Actions.HYP:
-                current_step = str(step.step_id + 1) + '. ' + str(step.formula) + ' [HYP]'
-                steps.append(current_step)
+                yield number + '. ' + str(step.formula) + ' [HYP]'
             elif step.action == Actions.AXIOM:
-                current_step = str(step.step_id + 1) + '. ' + str(step.formula) + ' ' + step.axiom_details
-                steps.append(current_step)
-            elif step.action == Actions.MP:
-                current_step = (str(step.step_id + 1) + '. ' + str(step.formula) + ' [MP(' + str(
-                    step.rule_implication + 1) + ',' + str(step.rule_detached + 1) + ')]')
-                steps.append(current_step)
-            elif step.action == Actions.MT:
-                current_step = (str(step.step_id + 1) + '. ' + str(step.formula) + ' [MT(' + str(
-                    step.rule_implication + 1) + ',' + str(step.rule_detached + 1) + ')]')
-                steps.append(current_step)
-            elif step.action == Actions.MTP:
-                current_step = (str(step.step_id + 1) + '. ' + str(step.formula) + ' [MTP(' + str(
-                    step.rule_implication + 1) + ',' + str(step.rule_detached + 1) + ')]')
-                steps.append(current_step)
-            elif step.action == Actions.MPT:
-                current_step = (str(step.step_id + 1) + '. ' + str(step.formula) + ' [MPT(' + str(
-                    step.rule_implication + 1) + ',' + str(step.rule_detached + 1) + ')]')
-                steps.append(current_step)
-            elif step.action == Actions.CS:
-                current_step = (str(step.step_id + 1) + '. ' + str(step.formula) + ' [CS(' + str(
-                    step.rule_implication + 1) + ',' + str(step.rule_detached + 1) + ')]')
-                steps.append(current_step)
+                yield number + '. ' + str(step.formula) + ' ' + step.axiom_details
+            elif step.action in rule_names:
+                implication = numbers.get(step.rule_implication, step.rule_implication + 1)
+                detached = numbers.get(step.rule_detached, step.rule_detached + 1)
+                yield (number + '. ' + str(step.formula) + ' [' + rule_names[step.action] + '(' +
+                       str(implication) + ',' + str(detached) + ')]')
             else:
-                return []
-        return steps
+                raise ValueError
 
-    def get_hint(self) -> (bool, str, str):
+    def get_hint(self, budget: SolverBudget = None) -> (bool, str, str):
         """
         Gives hint, that is there any new option to execute the Modus Ponens rule
+        The pending rule usages are kept in a frontier (HintFrontier), that only examines the new steps' pairs, so
+        the steps are not scanned again for every hint. The frontier is built again after deleting steps.
+
+        Raises:
+            BudgetExhaustedException: if a limit of the budget is exceeded, or it is cancelled
+
+        Args:
+            budget: if given, it is checked before examining a step
 
         Returns:
             Tuple of (success_flag, implication, detached).
@@ -625,59 +760,53 @@ class Model:
         """
         if self.end:
             return False, '', ''
-        for implication in self.steps:
-            for detached in self.steps:
-                current_mp = list(ModusPonens.rule(ModusPonens(), implication.formula, detached.formula))
-                current_mt = list(ModusTollens.rule(ModusTollens(), implication.formula, detached.formula))
-                current_mtp = list(
-                    ModusTollendoPonens.rule(ModusTollendoPonens(), implication.formula, detached.formula))
-                current_mpt = list(
-                    ModusPonendoTollens.rule(ModusPonendoTollens(), implication.formula, detached.formula))
-                current_cs = list(
-                    ConditionalSyllogism.rule(ConditionalSyllogism(), implication.formula, detached.formula))
-                if current_mp[0]:
-                    formula_in_set = False
-                    for formula in self.steps:
-                        if Utils.formula_re_formatter(current_mp[1]) == formula.formula:
-                            formula_in_set = True
-                            break
-                    if not formula_in_set:
-                        return True, implication.formula, detached.formula
-                elif current_mt[0]:
-                    formula_in_set = False
-                    for formula in self.steps:
-                        if Utils.formula_re_formatter(current_mt[1]) == formula.formula:
-                            formula_in_set = True
-                            break
-                    if not formula_in_set:
-                        return True, implication.formula, detached.formula
-                elif current_mtp[0]:
-                    formula_in_set = False
-                    for formula in self.steps:
-                        if Utils.formula_re_formatter(current_mtp[1]) == formula.formula:
-                            formula_in_set = True
-                            break
-                    if not formula_in_set:
-                        return True, implication.formula, detached.formula
-                elif current_mpt[0]:
-                    formula_in_set = False
-                    for formula in self.steps:
-                        if Utils.formula_re_formatter(current_mpt[1]) == formula.formula:
-                            formula_in_set = True
-                            break
-                    if not formula_in_set:
-                        return True, implication.formula, detached.formula
-                elif current_cs[0]:
-                    formula_in_set = False
-                    for formula in self.steps:
-                        if Utils.formula_re_formatter(current_cs[1]) == formula.formula:
-                            formula_in_set = True
-                            break
-                    if not formula_in_set:
-                        return True, implication.formula, detached.formula
-                else:
-                    continue
-        return False, '', ''
+        if self.__hint_frontier is None or not self.__hint_frontier.follows(self.steps):
+            self.__hint_frontier = HintFrontier(self.steps)
+        hint = self.__hint_frontier.next_hint(budget)
+        if hint is None:
+            return False, '', ''
+        return True, self.steps[hint[0]].formula, self.steps[hint[1]].formula
+
+    def fork(self) -> 'Model':
+        """
+        Creates a branch of the model in constant time. The new model has the same task, axioms and steps, but the
+        steps are shared (StepStore.fork), so adding or deleting steps in one of the models does not change the
+        other. The axioms are not read again.
+
+        Returns:
+            the new model
+        """
+        fork = copy.copy(self)
+        fork.formula_set = list(self.formula_set)
+        fork.added_axioms = list(self.added_axioms)
+        fork.steps = self.steps.fork()
+        fork.__hint_frontier = None
+        return fork
+
+    def snapshot(self) -> 'Model':
+        """
+        Saves the current state of the model in constant time, the model can be set back to it with restore.
+        The snapshot must not be changed.
+
+        Returns:
+            the snapshot of the model
+        """
+        return self.fork()
+
+    def restore(self, snapshot: 'Model') -> None:
+        """
+        Sets back the model to the state of a snapshot. The snapshot is not changed, so it can be restored again.
+
+        Args:
+            snapshot: a snapshot of the model, created with the snapshot function
+        """
+        self.formula_set = list(snapshot.formula_set)
+        self.consequence_formula = snapshot.consequence_formula
+        self.added_axioms = list(snapshot.added_axioms)
+        self.steps = snapshot.steps.fork()
+        self.number_of_steps = snapshot.number_of_steps
+        self.end = snapshot.end
+        self.__hint_frontier = None
 
     def delete_steps(self, index: int) -> bool:
         """
@@ -696,7 +825,8 @@ class Model:
         if not (0 <= index < len(self.steps)):
             return False
 
-        del self.steps[index:]
+        self.steps.truncate(index)
+        self.__hint_frontier = None
         self.number_of_steps = len(self.steps)
         self.__check_end()
         return True
@@ -791,9 +921,8 @@ class Model:
 
     def task_is_provable(self) -> bool:
         """
-        Creates a conjunction chain of the formulas in formula set, and the negated consequence formula.
-        If this formula is negated, and the negated formula is tautology, according to logic, the consequence is
-        provable.
+        Decides whether the consequence formula follows from the formulas in formula set, with SatSolver: the task is
+        provable if there is no counter model. Tasks without formula set are provable.
 
         Returns:
             True if the task is provable
@@ -802,22 +931,32 @@ class Model:
         if not self.formula_set:
             return True
 
-        task = ''
-        for formula in self.formula_set:
-            task = task + formula
-            task = task + ' & '
+        try:
+            return SatSolver.find_counter_model(self.formula_set, self.consequence_formula) is None
+        except ValueError:
+            return False
 
-        task = '~(' + task + '(~' + self.consequence_formula + '))'
+    def get_counter_model(self) -> dict | None:
+        """
+        Searches for an interpretation, where all formulas in formula set are true, but the consequence formula is
+        false. If there is one, the task is not provable.
 
-        formula_reader = FormulaReader()
-        if formula_reader.is_tautology(task):
-            return True
-        else:
-            return False
+        Returns:
+            dictionary of the variables and their values in the counter model, or None if the task is provable, the
+            formula set is empty or the task contains invalid formula
+        """
+        if not self.formula_set:
+            return None
+
+        try:
+            return SatSolver.find_counter_model(self.formula_set, self.consequence_formula)
+        except ValueError:
+            return None
 
     def save_model(self) -> bool:
         """
-        Tries to save all data of the current model
+        Tries to save all data of the current model, with the content hash of the data (see load_model). If the
+        local key of the content hashes can't be read, the save has no content hash.
 
         Returns:
             True if the saving was successful
@@ -851,35 +990,127 @@ class Model:
             'task_name': self.get_formula_set_consequence_concat(),
             'added_axioms': self.added_axioms
         }
+        try:
+            data['content_hash'] = Model.content_hash(data, self.__data_access.content_key())
+        except OSError:
+            pass
         try:
             self.__data_access.save_model(data)
             return True
         except OSError:
             return False
 
-    def load_model(self, path: str) -> bool:
+    def load_model(self, path: str, verify: str = 'none') -> bool:
         """
         Tries to load a model, from a json file (with the given specific path).
         Sets all model data from the json. Appending every step from the file after checking,
          whether it is valid addition.
+        If the content hash of the save matches its data, the save was written by save_model and not changed since,
+        so the axioms and the rule usages are not checked again, unless verify is 'full'. The content hash is an
+        HMAC with the local key of DataAccess, so a changed save can't get a matching hash without the key. The
+        saves without content hash, with a content hash that doesn't match (for example the saves of other
+        computers), or when the key can't be read, are always checked.
+
+        Raises:
+            ValueError: if verify is not 'full', 'lazy' or 'none'
 
         Args:
             path: full path to json file that contains data to load.
+            verify: 'full' checks every step, even if the content hash matches, 'lazy' checks the steps of a
+                    trusted save in a background thread (see verified), 'none' does not check them
 
         Returns:
             True if loading was successful
             False otherwise
         """
+        if verify not in ('full', 'lazy', 'none'):
+            raise ValueError
         try:
             data = self.__data_access.load_model(path)
         except OSError:
             return False
 
+        trusted = False
+        if verify != 'full' and isinstance(data, dict) and isinstance(data.get('content_hash'), str):
+            try:
+                trusted = hmac.compare_digest(data['content_hash'].encode(),
+                                              Model.content_hash(data, self.__data_access.content_key()).encode())
+            except (OSError, TypeError, ValueError):
+                trusted = False
+        self.__load_data(data, not trusted)
+        self.__verified = None if trusted else True
+        self.__verification = None
+        if trusted and verify == 'lazy':
+            self.__verification = threading.Thread(target=self.__verify_data, args=(copy.deepcopy(data),),
+                                                   daemon=True)
+            self.__verification.start()
+        return True
+
+    def verified(self, timeout: float = None) -> bool:
+        """
+        Tells whether the steps of the model were checked. The steps of a new model, and of a save loaded with
+        checking, are checked. If the checking of a trusted save runs in the background (verify='lazy'), waits for it.
+
+        Args:
+            timeout: the maximum time of waiting for the background checking in seconds, None waits until it ends
+
+        Returns:
+            True if the steps were checked and they are valid, False if the background checking found an invalid
+            step, None if the steps were not checked (yet)
+        """
+        if self.__verification is not None:
+            self.__verification.join(timeout)
+        return self.__verified
+
+    @staticmethod
+    def content_hash(data: dict, key: bytes) -> str:
+        """
+        Calculates the content hash of the data of a save, the 'content_hash' key of the data is not part of it.
+
+        Raises:
+            TypeError, ValueError: if the data can't be written to JSON
+
+        Args:
+            data: dictionary contains all data of a model (see save_model)
+            key: the secret key of the hash (see DataAccess.content_key)
+
+        Returns:
+            HMAC-SHA-256 of the canonical JSON form of the data, as hexadecimal string
+        """
+        content = {name: value for name, value in data.items() if name != 'content_hash'}
+        message = json.dumps(content, sort_keys=True, separators=(',', ':')).encode()
+        return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+    def __verify_data(self, data: dict) -> None:
+        """
+        Checks every step of the data of a trusted save on a copy of the model, and sets the result of the checking.
+
+        Args:
+            data: dictionary contains all data of the loaded save
+        """
+        verifier = copy.copy(self)
+        try:
+            verifier.__load_data(data, True)
+            self.__verified = True
+        except Exception:
+            self.__verified = False
+
+    def __load_data(self, data: dict, check: bool) -> None:
+        """
+        Sets all model data from the data of a save.
+
+        Raises:
+            ValueError: if the data is not valid
+
+        Args:
+            data: dictionary contains all data of a model
+            check: if False, the axioms and the rule usages of the steps are not checked
+        """
         try:
             self.__input_checker(data['formula_set'], data['consequence_formula'])
             self.formula_set = data['formula_set']
             self.consequence_formula = Utils.formula_re_formatter(data['consequence_formula'])
-            self.steps = []
+            self.steps = StepStore()
             self.number_of_steps = data['number_of_steps']
             self.end = data['end']
             self.added_axioms = data['added_axioms']
@@ -892,37 +1123,37 @@ class Model:
                         raise ValueError
                 elif current_step[2] == 'Actions.AXIOM':
                     formula_reader = FormulaReader()
-                    if not formula_reader.is_tautology(current_step[1]):
+                    if check and not formula_reader.is_tautology(current_step[1]):
                         raise ValueError
                     if not self.__steps_append(
                             Step(current_step[0], current_step[1], Actions.AXIOM, axiom_details=current_step[3])):
                         raise ValueError
                 elif current_step[2] == 'Actions.MP':
-                    if not ModusPonens.rule(ModusPonens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
+                    if check and not ModusPonens.rule(ModusPonens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
                         raise ValueError
                     if not self.__steps_append(
                             Step(current_step[0], current_step[1], Actions.MP, '', current_step[4], current_step[5])):
                         raise ValueError
                 elif current_step[2] == 'Actions.MT':
-                    if not ModusTollens.rule(ModusTollens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
+                    if check and not ModusTollens.rule(ModusTollens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
                         raise ValueError
                     if not self.__steps_append(
                             Step(current_step[0], current_step[1], Actions.MT, '', current_step[4], current_step[5])):
                         raise ValueError
                 elif current_step[2] == 'Actions.MTP':
-                    if not ModusTollendoPonens.rule(ModusTollendoPonens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
+                    if check and not ModusTollendoPonens.rule(ModusTollendoPonens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
                         raise ValueError
                     if not self.__steps_append(
                             Step(current_step[0], current_step[1], Actions.MTP, '', current_step[4], current_step[5])):
                         raise ValueError
                 elif current_step[2] == 'Actions.MPT':
-                    if not ModusPonendoTollens.rule(ModusPonendoTollens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
+                    if check and not ModusPonendoTollens.rule(ModusPonendoTollens(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
                         raise ValueError
                     if not self.__steps_append(
                             Step(current_step[0], current_step[1], Actions.MPT, '', current_step[4], current_step[5])):
                         raise ValueError
                 elif current_step[2] == 'Actions.CS':
-                    if not ConditionalSyllogism.rule(ConditionalSyllogism(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
+                    if check and not ConditionalSyllogism.rule(ConditionalSyllogism(), self.steps[current_step[4]].formula, self.steps[current_step[5]].formula)[0]:
                         raise ValueError
                     if not self.__steps_append(
                             Step(current_step[0], current_step[1], Actions.CS, '', current_step[4], current_step[5])):
@@ -935,4 +1166,3 @@ class Model:
             raise ValueError
         except Exception:
             raise Exception
-        return True
@@ -0,0 +1,99 @@
+import json
+
+from Model.model import Model
+from Model.solver import Solver
+
+
+class ProofWriter:
+    """
+    Writes the steps of the solved models as JSONL, one record per line: {"id": ..., "kind": ..., "number": ...,
+    "step": ...}. The steps are generated from the model one by one while they are written, so the list of the
+    steps' strings is never built, and the records can be read while they are written.
+
+    Attributes:
+        records: (int) number of the written records
+        __file: (TextIO) the output, opened for writing text
+        __flush_every: (int) the output is flushed after this number of records, 0 means only by the flush function
+        __unflushed: (int) number of the records written since the last flush
+    """
+
+    def __init__(self, file, flush_every: int = 1) -> None:
+        """
+        Constructor for ProofWriter.
+
+        Raises:
+            ValueError: if flush_every is negative
+
+        Args:
+            file: the output, opened for writing text, for example sys.stdout
+            flush_every: the output is flushed after this number of records, 0 means only by the flush function
+        """
+        if flush_every < 0:
+            raise ValueError
+        self.records = 0
+        self.__file = file
+        self.__flush_every = flush_every
+        self.__unflushed = 0
+
+    def write(self, record: dict) -> None:
+        """
+        Writes a record as a JSON line.
+
+        Args:
+            record: dictionary, that can be written to JSON
+        """
+        self.__file.write(json.dumps(record) + '\n')
+        self.records += 1
+        self.__unflushed += 1
+        if self.__flush_every and self.__unflushed >= self.__flush_every:
+            self.flush()
+
+    def write_steps(self, steps, task_id=None, kind: str = 'step') -> int:
+        """
+        Writes the steps as records, numbered from 1.
+
+        Args:
+            steps: iterable of the strings of the steps, for example a generator
+            task_id: the id of the task, copied to the records
+            kind: the kind of the steps, copied to the records
+
+        Returns:
+            number of the written steps
+        """
+        number = 0
+        for number, step in enumerate(steps, 1):
+            self.write({'id': task_id, 'kind': kind, 'number': number, 'step': step})
+        return number
+
+    def write_proof(self, model: Model, task_id=None) -> int:
+        """
+        Writes the important steps of a solved model (see Solver.iter_proof), as 'proof' records.
+
+        Args:
+            model: the solved model
+            task_id: the id of the task, copied to the records
+
+        Returns:
+            number of the written steps, 0 if the consequence is not derived
+        """
+        return self.write_steps(Solver.iter_proof(model), task_id, 'proof')
+
+    def write_closure(self, model: Model, task_id=None) -> int:
+        """
+        Writes all steps of a model (see Model.iter_steps_string), as 'closure' records.
+
+        Args:
+            model: the model, for example after a Solver.run without the closure
+            task_id: the id of the task, copied to the records
+
+        Returns:
+            number of the written steps
+        """
+        return self.write_steps(model.iter_steps_string(), task_id, 'closure')
+
+    def flush(self) -> None:
+        """
+        Flushes the output.
+        """
+        self.__file.flush()
+        self.__unflushed = 0
@@ -0,0 +1,321 @@
+from Model.formula import Formula
+from Model.Utils.formula_parser import FormulaParser
+
+
+class SatSolver:
+    """
+    Small CDCL SAT solver for deciding logical consequence. The formulas are converted to clauses with Tseitin
+    encoding, then the solver searches for an interpretation with unit propagation (two watched literals), conflict
+    analysis (first unique implication point), clause learning and non-chronological backjumping.
+
+    The variables of the clauses are positive integers, a literal is a variable (true) or its negative (false).
+
+    Attributes:
+        __clauses: (list of int lists) clauses of the problem and the learnt clauses
+        __watches: (dict) literal -> indexes of the clauses that watch the literal
+        __values: (dict) variable -> its value (True or False), unassigned variables are missing
+        __levels: (dict) variable -> decision level of its assignment
+        __reasons: (dict) variable -> index of the clause that implied its value, None for decisions
+        __trail: (int list) assigned literals in the order of the assignments
+        __trail_limits: (int list) length of the trail before each decision
+        __activity: (dict) variable -> activity score of the variable, for choosing the next decision
+        __phases: (dict) variable -> last value of the variable, decisions use it again
+        __increment: (float) activity added to the variables of a conflict, grows after every conflict
+        __propagated: (int) number of the trail's literals, that are already propagated
+        __number_of_variables: (int) the greatest variable in the clauses
+        __unsatisfiable: (bool) True if a contradiction was found at the root level
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for SatSolver
+        """
+        self.__clauses = []
+        self.__watches = {}
+        self.__values = {}
+        self.__levels = {}
+        self.__reasons = {}
+        self.__trail = []
+        self.__trail_limits = []
+        self.__activity = {}
+        self.__phases = {}
+        self.__increment = 1.0
+        self.__propagated = 0
+        self.__number_of_variables = 0
+        self.__unsatisfiable = False
+
+    @staticmethod
+    def find_counter_model(formula_set: list, consequence_formula: str) -> dict | None:
+        """
+        Decides whether the consequence formula follows from the formula set, by searching for an interpretation
+        where all formulas of the formula set are true and the consequence formula is false.
+
+        Raises:
+            ValueError: if one of the formulas is invalid
+
+        Args:
+            formula_set: list of logical formulas
+            consequence_formula: logical formula
+        Returns:
+            None if the consequence follows from the formula set, otherwise a counter model: dictionary of the
+            variables and their values
+        """
+        premises = [FormulaParser.parse(formula)[0] for formula in formula_set]
+        consequence = FormulaParser.parse(consequence_formula)[0]
+        return SatSolver.find_counter_model_of_formulas(premises, consequence)
+
+    @staticmethod
+    def find_counter_model_of_formulas(premises: list, consequence: Formula) -> dict | None:
+        """
+        Same as find_counter_model, but with parsed formulas.
+
+        Args:
+            premises: list of Formula
+            consequence: Formula
+        Returns:
+            None if the consequence follows from the premises, otherwise a counter model: dictionary of the
+            variables and their values
+        """
+        solver = SatSolver()
+        literals = {}
+        for premise in premises:
+            solver.add_clause([solver.__encode(premise, literals)])
+        solver.add_clause([-solver.__encode(consequence, literals)])
+        if not solver.solve():
+            return None
+
+        counter_model = {}
+        for formula in premises + [consequence]:
+            for variable in formula.variables:
+                counter_model[variable] = solver.value(literals[id(Formula.variable(variable))])
+        return dict(sorted(counter_model.items()))
+
+    def __encode(self, formula: Formula, literals: dict) -> int:
+        """
+        Tseitin encoding: adds clauses that make a new variable equivalent to every subformula.
+
+        Args:
+            formula: formula to be encoded
+            literals: id of the encoded subformulas -> their literal, the function extends it
+        Returns:
+            the literal equivalent to the formula
+        """
+        for subformula in formula.subformulas():
+            if id(subformula) in literals:
+                continue
+            if subformula.connective == '~':
+                literals[id(subformula)] = -literals[id(subformula.left)]
+                continue
+            self.__number_of_variables += 1
+            literal = self.__number_of_variables
+            literals[id(subformula)] = literal
+            if subformula.connective == '':
+                continue
+            left = literals[id(subformula.left)]
+            right = literals[id(subformula.right)]
+            if subformula.connective == '&':
+                self.add_clause([-literal, left])
+                self.add_clause([-literal, right])
+                self.add_clause([literal, -left, -right])
+            elif subformula.connective == '|':
+                self.add_clause([-literal, left, right])
+                self.add_clause([literal, -left])
+                self.add_clause([literal, -right])
+            elif subformula.connective == '>>':
+                self.add_clause([-literal, -left, right])
+                self.add_clause([literal, left])
+                self.add_clause([literal, -right])
+        return literals[id(formula)]
+
+    def add_clause(self, clause: list) -> None:
+        """
+        Adds a clause to the problem. Must be called before solving.
+
+        Args:
+            clause: list of literals, the clause is true if one of its literals is true
+        """
+        clause = list(dict.fromkeys(clause))
+        for literal in clause:
+            self.__number_of_variables = max(self.__number_of_variables, abs(literal))
+        if any(-literal in clause for literal in clause):
+            return
+        if not clause:
+            self.__unsatisfiable = True
+        elif len(clause) == 1:
+            value = self.value(clause[0])
+            if value is None:
+                self.__assign(clause[0], None)
+            elif not value:
+                self.__unsatisfiable = True
+        else:
+            self.__add_watched_clause(clause)
+
+    def value(self, literal: int) -> bool | None:
+        """
+        Args:
+            literal: a literal
+        Returns:
+            the value of the literal, or None if its variable is unassigned
+        """
+        value = self.__values.get(abs(literal))
+        if value is None:
+            return None
+        return value if literal > 0 else not value
+
+    def solve(self) -> bool:
+        """
+        Searches for an interpretation that satisfies all clauses. After a successful search, the value function
+        gives the values of the interpretation.
+
+        Returns:
+            True if the clauses are satisfiable
+            False otherwise
+        """
+        if self.__unsatisfiable:
+            return False
+        while True:
+            conflict = self.__propagate()
+            if conflict is not None:
+                if not self.__trail_limits:
+                    self.__unsatisfiable = True
+                    return False
+                learnt, level = self.__analyze(conflict)
+                self.__backjump(level)
+                if len(learnt) == 1:
+                    self.__assign(learnt[0], None)
+                else:
+                    self.__assign(learnt[0], self.__add_watched_clause(learnt))
+                self.__increment *= 1.05
+                continue
+
+            variable = self.__choose_variable()
+            if variable is None:
+                return True
+            self.__trail_limits.append(len(self.__trail))
+            self.__assign(variable if self.__phases.get(variable, False) else -variable, None)
+
+    def __add_watched_clause(self, clause: list) -> int:
+        """
+        Stores the clause, and watches its first two literals.
+
+        Returns:
+            index of the clause
+        """
+        index = len(self.__clauses)
+        self.__clauses.append(clause)
+        self.__watches.setdefault(clause[0], []).append(index)
+        self.__watches.setdefault(clause[1], []).append(index)
+        return index
+
+    def __assign(self, literal: int, reason: int | None) -> None:
+        variable = abs(literal)
+        self.__values[variable] = literal > 0
+        self.__phases[variable] = literal > 0
+        self.__levels[variable] = len(self.__trail_limits)
+        self.__reasons[variable] = reason
+        self.__trail.append(literal)
+
+    def __propagate(self) -> int | None:
+        """
+        Unit propagation: assigns the last literal of the clauses, that have only one unassigned literal and all
+        the others are false.
+
+        Returns:
+            index of a clause that became false (conflict), or None
+        """
+        while self.__propagated < len(self.__trail):
+            false_literal = -self.__trail[self.__propagated]
+            self.__propagated += 1
+            watching = self.__watches.get(false_literal, [])
+            self.__watches[false_literal] = []
+            for position, index in enumerate(watching):
+                clause = self.__clauses[index]
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+                if self.value(clause[0]) is True:
+                    self.__watches[false_literal].append(index)
+                    continue
+                for other in range(2, len(clause)):
+                    if self.value(clause[other]) is not False:
+                        clause[1], clause[other] = clause[other], clause[1]
+                        self.__watches.setdefault(clause[1], []).append(index)
+                        break
+                else:
+                    self.__watches[false_literal].append(index)
+                    if self.value(clause[0]) is False:
+                        self.__watches[false_literal].extend(watching[position + 1:])
+                        return index
+                    self.__assign(clause[0], index)
+        return None
+
+    def __analyze(self, conflict: int) -> (list, int):
+        """
+        Learns a clause from the conflict: resolves the conflicting clause with the reasons of the literals
+        assigned on the current level, until only one literal of the current level remains.
+
+        Returns:
+            Tuple of the learnt clause (its first literal is the one of the current level) and the level to jump back
+        """
+        current_level = len(self.__trail_limits)
+        learnt = [0]
+        seen = set()
+        counter = 0
+        literal = None
+        position = len(self.__trail) - 1
+        clause = self.__clauses[conflict]
+        while True:
+            for other in clause:
+                if other == literal:
+                    continue
+                variable = abs(other)
+                if variable in seen or self.__levels[variable] == 0:
+                    continue
+                seen.add(variable)
+                self.__activity[variable] = self.__activity.get(variable, 0.0) + self.__increment
+                if self.__levels[variable] == current_level:
+                    counter += 1
+                else:
+                    learnt.append(other)
+            while abs(self.__trail[position]) not in seen:
+                position -= 1
+            literal = self.__trail[position]
+            position -= 1
+            counter -= 1
+            if counter == 0:
+                break
+            clause = self.__clauses[self.__reasons[abs(literal)]]
+        learnt[0] = -literal
+
+        level = 0
+        for position in range(1, len(learnt)):
+            if self.__levels[abs(learnt[position])] > level:
+                level = self.__levels[abs(learnt[position])]
+                learnt[1], learnt[position] = learnt[position], learnt[1]
+        return learnt, level
+
+    def __backjump(self, level: int) -> None:
+        """
+        Undoes the assignments of the levels above the given level.
+        """
+        start = self.__trail_limits[level]
+        for literal in self.__trail[start:]:
+            variable = abs(literal)
+            del self.__values[variable]
+            del self.__reasons[variable]
+            del self.__levels[variable]
+        del self.__trail[start:]
+        del self.__trail_limits[level:]
+        self.__propagated = start
+
+    def __choose_variable(self) -> int | None:
+        """
+        Returns:
+            the unassigned variable with the greatest activity, or None if all variables are assigned
+        """
+        chosen = None
+        best = -1.0
+        for variable in range(1, self.__number_of_variables + 1):
+            if variable not in self.__values and self.__activity.get(variable, 0.0) > best:
+                chosen = variable
+                best = self.__activity.get(variable, 0.0)
+        return chosen
@@ -1,9 +1,22 @@
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 from Model.model import Model
+from Model.backward_chainer import BackwardChainer
+from Model.axiom_instantiator import AxiomInstantiator
+from Model.formula import Formula
+from Model.solver_budget import SolverBudget
+from Model.solver_result import SolverResult
+from Model.solver_status import SolverStatus
+from Model.solver_statistics import SolverStatistics
+from Model.budget_exhausted_exception import BudgetExhaustedException
+from Persistence.proof_cache import ProofCache
 from Model.Rules.rule import Rule
 from Model.actions import Actions
 from Model.Utils.utils import Utils
 from Model.step import Step
-from Model.formula_in_steps_exception import FormulaInStepsException
+from Model.add_step_status import AddStepStatus
 
 
 class Solver:
@@ -11,108 +24,298 @@ class Solver:
     The clas represents a possible was to solve tasks. Tries to solve the given Model object's task.
     """
     @staticmethod
-    def solve(model_param: Model) -> tuple:
+    def solve(model_param: Model,
+              backward: bool = False,
+              statistics: SolverStatistics = None,
+              budget: SolverBudget = None,
+              workers: int = 1,
+              cache: ProofCache = None) -> tuple:
         """
-        Tries to solve a Model object's task (consequence).
-        Try to use all hyp, then use continuously the syntax rules and substitute different formulas into all axioms.
-        If the task is solved, then the function calls the get_proving_theory recursive function that filters the
-        actually important steps. This will be returned.
+        Tries to solve a Model object's task (consequence), with the run function.
 
         model_param: Model, that contains the task
+        backward: if True, the backward search is tried first
+        statistics: if given, the statistics of the solving are collected in it
+        budget: if given, the solving stops when one of its limits is exceeded
+        workers: number of the processes substituting into the axioms, None means the number of CPUs
+        cache: if given, the proof is searched in it first, and the new proofs are stored in it
 
         Returns:
             A tuple, that contains a true and the important steps if solving was successful.
             Otherwise, the tuple will contain a false value and an empty list.
         """
-        model = model_param
+        result = Solver.run(model_param, backward, statistics, budget, workers, cache, closure=False)
+        if result.status == SolverStatus.PROVED:
+            return True, result.proof
+        if result.status in (SolverStatus.INVALID, SolverStatus.UNPROVABLE):
+            return False, []
+        return False, ''
+
+    @staticmethod
+    def run(model_param: Model,
+            backward: bool = False,
+            statistics: SolverStatistics = None,
+            budget: SolverBudget = None,
+            workers: int = 1,
+            cache: ProofCache = None,
+            closure: bool = True) -> SolverResult:
+        """
+        Tries to solve a Model object's task (consequence).
+        Try to use all hyp, then saturate the steps with the syntax rules, substitute different formulas into all
+        axioms, and saturate again, combining only the new axiom steps with the steps before them.
+        The axiom instances are filtered by relevance first (see use_axioms); the filter can drop instances that are
+        only needed as intermediate lemmas, so the rejected instances are kept. If the consequence is not derived,
+        the rejected instances are added, and the steps are saturated again, so no proof of the unfiltered instances
+        is lost, and no instance is substituted twice.
+        In backward mode, a goal-directed search (BackwardChainer) starts from the consequence after the hyp steps,
+        and the forward search only runs if the backward search could not prove the consequence.
+        If the task is solved, then the function calls the get_proving_theory function that filters the actually
+        important steps.
+        If a limit of the budget is exceeded, the search stops, and the steps derived so far are returned.
+        If a cache is given and the task is found in it, the cached proof is returned without searching.
+        The rule usages, the axiom instances, the exceptions and the time of the phases are counted in the
+        statistics, and the statistics are logged on the DEBUG level of the 'Model.solver' logger.
+        Without the closure, the strings of the derived steps are not collected into the result, they can be
+        streamed from the model after the run (see Model.iter_steps_string and ProofWriter).
+
+        Args:
+            model_param: Model, that contains the task
+            backward: if True, the backward search is tried first
+            statistics: if given, the statistics of the solving are collected in it
+            budget: if given, the solving stops when one of its limits is exceeded
+            workers: number of the processes substituting into the axioms, None means the number of CPUs
+            cache: if given, the proof is searched in it first, and the new proofs are stored in it
+            closure: if False, the derived steps are only counted in the result
+
+        Returns:
+            SolverResult with the status, the proof or the derived steps, and the statistics
+        """
+        if statistics is None:
+            statistics = SolverStatistics()
+        with statistics.phase('total'):
+            result = Solver.__run(model_param, backward, statistics, budget, workers, cache, closure)
+        statistics.log()
+        return result
 
+    @staticmethod
+    def __run(model: Model,
+              backward: bool,
+              statistics: SolverStatistics,
+              budget: SolverBudget,
+              workers: int,
+              cache: ProofCache,
+              closure: bool) -> SolverResult:
+        """
+        The body of the run function, the phases of the solving are timed in the statistics.
+
+        Returns:
+            SolverResult with the status, the proof or the derived steps, and the statistics
+        """
         if not isinstance(model, Model):
-            return False, []
+            return SolverResult(SolverStatus.INVALID, statistics=statistics)
 
-        if not model.task_is_provable():
-            return False, []
+        with statistics.phase('provability'):
+            provable = model.task_is_provable()
+        if not provable:
+            return SolverResult(SolverStatus.UNPROVABLE, statistics=statistics)
 
         if model.consequence_formula == '':
-            return False, []
+            return SolverResult(SolverStatus.INVALID, statistics=statistics)
+
+        if model.consequence_formula in model.formula_set:
+            proof = Solver.__hypothesis_proof(model)
+            return SolverResult(SolverStatus.PROVED, proof=proof, steps=proof if closure else None,
+                                number_of_steps=len(proof), statistics=statistics)
+
+        formula_set = list(model.formula_set)
+        if cache is not None:
+            with statistics.phase('cache'):
+                proof = cache.get(formula_set, model.consequence_formula)
+            if proof is not None:
+                return SolverResult(SolverStatus.PROVED, proof=proof, steps=proof, statistics=statistics, cached=True)
+
+        if budget is not None:
+            budget.start()
+
+        with statistics.phase('hypotheses'):
+            if model.formula_set_contains_tautology():
+                model.delete_tautologies()
+
+            variables = []
+            for formula in model.formula_set:
+                statistics.count_step(Actions.HYP, model.try_add_step(formula, Actions.HYP)[0])
+                variables.append(formula)
+                variables.append('~' + formula)
+                vars_in_formula = Utils.get_formula_variables(formula)
+                statistics.validation_calls += 1
+                for var in vars_in_formula:
+                    variables.append(var)
+                    variables.append('~' + var)
+                if Rule.is_negation(formula):
+                    statistics.validation_calls += 1
+                    if Utils.is_valid_formula(formula[1:]):
+                        variables.append(formula[1:])
+            variables.append(model.consequence_formula)
+            variables.append('~' + model.consequence_formula)
+
+            variables = sorted(list(set(variables)))
+
+        executor = None
+        if workers is None or workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            proved = False
+            if backward:
+                with statistics.phase('backward'):
+                    proved = BackwardChainer.prove(model, budget=budget, statistics=statistics)
+            if not proved:
+                with statistics.phase('syntax_rules'):
+                    Solver.use_syntax_rules(model, budget=budget, statistics=statistics)
+                first_axiom_step = len(model.steps)
+                rejected = []
+                with statistics.phase('axioms'):
+                    Solver.use_axioms(model, variables, statistics=statistics, budget=budget, workers=workers,
+                                      executor=executor, rejected=rejected)
+                with statistics.phase('syntax_rules'):
+                    Solver.use_syntax_rules(model, first_axiom_step, budget=budget, statistics=statistics)
+                if rejected and not model.end:
+                    first_axiom_step = len(model.steps)
+                    with statistics.phase('axioms'):
+                        Solver.use_rejected_axioms(model, rejected, statistics=statistics, budget=budget)
+                    with statistics.phase('syntax_rules'):
+                        Solver.use_syntax_rules(model, first_axiom_step, budget=budget, statistics=statistics)
+        except BudgetExhaustedException as exception:
+            statistics.count_exception(exception)
+            return SolverResult(SolverStatus.BUDGET_EXHAUSTED, steps=Solver.__closure(model, closure),
+                                number_of_steps=len(model.steps), statistics=statistics,
+                                exhausted_budget=exception.reason)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
 
-        if not model.steps:
-            model.steps = []
+        if model.end:
+            with statistics.phase('proof_extraction'):
+                proof = Solver.__filter_proving_theory(model)
+            if cache is not None:
+                with statistics.phase('cache'):
+                    cache.put(formula_set, model.consequence_formula, proof)
+            return SolverResult(SolverStatus.PROVED, proof=proof, steps=Solver.__closure(model, closure),
+                                number_of_steps=len(model.steps), statistics=statistics)
+        return SolverResult(SolverStatus.NOT_PROVED, steps=Solver.__closure(model, closure),
+                            number_of_steps=len(model.steps), statistics=statistics)
 
-        if model.formula_set_contains_tautology():
-            model.delete_tautologies()
+    @staticmethod
+    def __closure(model: Model, closure: bool) -> list:
+        """
+        Returns:
+            The strings of all steps of the model, None if the closure is not requested
+        """
+        return model.get_steps_string() if closure else None
 
-        variables = []
-        for formula in model.formula_set:
-            model.add_step(formula, Actions.HYP)
-            variables.append(formula)
-            variables.append('~' + formula)
-            vars_in_formula = Utils.get_formula_variables(formula)
-            for var in vars_in_formula:
-                variables.append(var)
-                variables.append('~' + var)
-            if Rule.is_negation(formula):
-                if Utils.is_valid_formula(formula[1:]):
-                    variables.append(formula[1:])
-        variables.append(model.consequence_formula)
-        variables.append('~' + model.consequence_formula)
+    @staticmethod
+    def __filter_proving_theory(model: Model) -> list:
+        """
+        Filters the steps, that the last step of the model is derived from. The filtered steps are renumbered, so
+        the proof is self-contained.
 
-        variables = sorted(list(set(variables)))
+        Args:
+            model: The model that contains the steps list
 
-        if not Solver.use_syntax_rules(model):
-            return False, ''
+        Returns:
+            The strings of the important steps, in order
+        """
+        if len(model.steps) == 0:
+            return Solver.__hypothesis_proof(model)
+        indexes = Solver.get_proving_theory(model, model.steps[len(model.steps) - 1])
+        return model.get_steps_string(indexes)
 
-        if not Solver.use_axioms(model, variables):
-            return False, ''
+    @staticmethod
+    def __hypothesis_proof(model: Model) -> list:
+        """
+        The proof of a task, whose consequence formula is one of the hypotheses. The model ends before the hyp steps
+        are added, so the proof is not in the steps.
 
-        if not Solver.use_syntax_rules(model):
-            return False, ''
+        Args:
+            model: The model that contains the task
 
-        indexes = sorted(
-            list(set(Solver.get_proving_theory(model, model.steps[len(model.steps) - 1]) + [len(model.steps) - 1])))
-        steps_strings = model.get_steps_string()
-        filtered_steps = []
+        Returns:
+            The string of the hyp step of the consequence formula in a list, empty list if the consequence formula is
+            not a hypothesis
+        """
+        if model.consequence_formula not in model.formula_set:
+            return []
+        return ['1. ' + Utils.formula_re_formatter(model.consequence_formula) + ' [HYP]']
 
-        for idx in indexes:
-            filtered_steps.append(steps_strings[idx])
+    @staticmethod
+    def iter_proof(model: Model):
+        """
+        Generates the important steps of a solved model one by one, like the proof of the run function, without
+        building the list of them.
 
-        if model.end:
-            return True, filtered_steps
-        else:
-            return False, ''
+        Args:
+            model: The model that contains the steps list
+
+        Returns:
+            generator of the strings of the important steps, in order, nothing if the consequence is not derived
+        """
+        if not model.end:
+            return
+        if len(model.steps) == 0:
+            yield from Solver.__hypothesis_proof(model)
+            return
+        yield from model.iter_steps_string(Solver.get_proving_theory(model, model.steps[len(model.steps) - 1]))
 
     @staticmethod
     def get_proving_theory(model: Model, step: Step) -> list:
         """
-        Recursive function that filters the important steps from the steps list.
+        Filters the important steps from the steps list: the step and the steps it is derived from. The steps are
+        walked iteratively, and every step is visited once, even if more steps are derived from it.
 
         Args:
             model: The model that contains the steps list
             step: the actual step, of which parents are searched
 
         Returns:
-            A list that contains the indexes of the important steps
+            A sorted list that contains the indexes of the important steps. The parents of a step are before the
+            step, so the order is topological.
         """
         if not isinstance(model, Model):
             return []
         if not isinstance(step, Step):
             return []
-        if step.action == Actions.AXIOM:
-            return [step.step_id]
-        elif step.action == Actions.HYP:
-            return [step.step_id]
-        else:
-            first_param = model.steps[step.step_id].rule_implication
-            second_param = model.steps[step.step_id].rule_detached
-            return ([step.step_id] + Solver.get_proving_theory(model, model.steps[first_param]) +
-                    Solver.get_proving_theory(model, model.steps[second_param]))
+        visited = {step.step_id}
+        stack = [step]
+        while stack:
+            current = stack.pop()
+            if current.action == Actions.AXIOM or current.action == Actions.HYP:
+                continue
+            for parent in (current.rule_implication, current.rule_detached):
+                if parent not in visited:
+                    visited.add(parent)
+                    stack.append(model.steps[parent])
+        return sorted(visited)
 
     @staticmethod
-    def use_syntax_rules(model: Model) -> bool:
+    def use_syntax_rules(model: Model,
+                         first_new_step: int = 0,
+                         budget: SolverBudget = None,
+                         statistics: SolverStatistics = None) -> bool:
         """
-        Tries to use all syntax rule to all steps in step list form the model
+        Saturates the steps list of the model with the syntax rules, driven by an agenda of steps, that are not
+        combined yet. A step taken from the agenda is only combined with the steps before it, so every pair of steps
+        is tried exactly once. The partners of a step are looked up in the member indexes of the steps (StepStore),
+        only the pairs that fit a syntax rule are tried. Every newly derived step is put on the agenda, so the
+        saturation goes on until a fixpoint is reached (the agenda is empty), or the consequence formula is derived.
 
         Args:
-            model: Contains the steps, and the models.add_steps is used
+            model: Contains the steps, and the model's try_add_step is used
+            first_new_step: index of the first step, that is not combined with the steps before it yet. The steps
+                before this index are considered saturated.
+            budget: if given, it is checked before every syntax rule usage
+            statistics: if given, the attempts and the successes of the syntax rules are counted in it
+
+        Raises:
+            BudgetExhaustedException: if a limit of the budget is exceeded
 
         Returns:
             True if the syntax rule usages were successful.
@@ -120,100 +323,255 @@ class Solver:
         """
         if not isinstance(model, Model):
             return False
-        for rule_1, _ in enumerate(model.steps):
-            for rule_2, _ in enumerate(model.steps):
-                try:
-                    model.add_step('', Actions.MP, implication_formula_number=rule_1, formula_to_be_detached_number=rule_2)
-                    if model.end:
-                        break
-                    model.add_step('', Actions.MT, implication_formula_number=rule_1, formula_to_be_detached_number=rule_2)
-                    if model.end:
-                        break
-                    model.add_step('', Actions.MTP, implication_formula_number=rule_1, formula_to_be_detached_number=rule_2)
-                    if model.end:
-                        break
-                    model.add_step('', Actions.MPT, implication_formula_number=rule_1, formula_to_be_detached_number=rule_2)
-                    if model.end:
-                        break
-                    model.add_step('', Actions.CS, implication_formula_number=rule_1, formula_to_be_detached_number=rule_2)
-                    if model.end:
-                        break
-                except FormulaInStepsException:
-                    continue
-            if model.end:
-                break
+        if not isinstance(first_new_step, int) or first_new_step < 0:
+            return False
+        if statistics is None:
+            statistics = SolverStatistics()
+
+        agenda = deque(range(first_new_step, len(model.steps)))
+        while agenda and not model.end:
+            new_step = agenda.popleft()
+            for action, first, second in model.steps.partners(new_step, new_step + 1):
+                if budget is not None:
+                    budget.check(len(model.steps))
+                Solver.__try_syntax_rule(model, action, first, second, agenda, statistics)
+                if model.end:
+                    return True
         return True
 
     @staticmethod
-    def use_axioms(model: Model, variables: list) -> bool:
+    def __try_syntax_rule(model: Model,
+                          action: Actions,
+                          first: int,
+                          second: int,
+                          agenda: deque,
+                          statistics: SolverStatistics) -> None:
+        """
+        Tries to add a new step to the model with the given syntax rule. If the addition was successful, the new
+        step is put on the agenda.
+
+        Args:
+            model: Contains the steps, and the model's try_add_step is used
+            action: the syntax rule
+            first: index of the first param of the syntax rule, in steps
+            second: index of the second param of the syntax rule, in steps
+            agenda: steps, that are not combined with the steps before them yet
+            statistics: the attempt and the success of the syntax rule are counted in it
+        """
+        status, index = model.try_add_step('', action, first, second)
+        statistics.count_step(action, status)
+        if status == AddStepStatus.ADDED:
+            agenda.append(index)
+
+    @staticmethod
+    def use_axioms(model: Model,
+                   variables: list,
+                   relevant_only: bool = True,
+                   statistics: SolverStatistics = None,
+                   budget: SolverBudget = None,
+                   workers: int = 1,
+                   executor: ProcessPoolExecutor = None,
+                   rejected: list = None) -> bool:
         """
-        Tries to substitute variables into the axioms.
+        Tries to substitute variables into the axioms: every combination of the variables is substituted into
+        every base axiom. With the relevance filter, an instance is only added to the steps, if it can be used:
+        its antecedent is in the steps (MP), the negation of its consequent is in the steps (MT), or its consequent
+        is a subformula (or a negated subformula) of the consequence formula.
 
         Args:
-            model: Contains the steps, and the models.add_steps is used.
+            model: Contains the steps, and the model's try_add_step is used.
             variables: thees variables are substituted into the axioms.
+            relevant_only: if True, the instances that can't be used are not added to the steps
+            statistics: if given, the number of the generated, pruned, duplicate and added instances are counted in
+                it
+            budget: if given, it is checked before every instance
+            workers: number of the processes substituting into the axioms, 1 means no parallel processes, None
+                means the number of CPUs
+            executor: the process pool of the parallel substitution, if it is not given, a process pool is created
+                for this call
+            rejected: if given, the instances rejected by the relevance filter are appended to it, as (index of the
+                axiom, instance) tuples, in the order of the substitutions (see use_rejected_axioms)
+
+        Raises:
+            BudgetExhaustedException: if a limit of the budget is exceeded
 
         Returns:
             True if the substitutions were successful.
             False otherwise.
         """
-        for axiom in model.base_axioms:
-            number_of_vars = len(Utils.get_formula_variables(axiom))
-
-            if number_of_vars == 1:
-                for var in variables:
-                    try:
-                        model.add_step(axiom, Actions.AXIOM, data=[var])
-                    except FormulaInStepsException:
-                        pass
-
-            if number_of_vars == 2:
-                for var_1 in variables:
-                    for var_2 in variables:
-                        try:
-                            model.add_step(axiom, Actions.AXIOM, data=[var_1, var_2])
-                            model.add_step(axiom, Actions.AXIOM, data=[var_2, var_1])
-                            model.add_step(axiom, Actions.AXIOM, data=[var_1, var_1])
-                            model.add_step(axiom, Actions.AXIOM, data=[var_2, var_2])
-                        except FormulaInStepsException:
-                            pass
-
-            if number_of_vars == 3:
-                for var_1 in variables:
-                    for var_2 in variables:
-                        for var_3 in variables:
-                            try:
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_2, var_3])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_3, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_1, var_3])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_3, var_1])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_1, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_2, var_1])
-
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_1, var_1])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_2, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_3, var_3])
-
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_1, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_1, var_3])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_2, var_1])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_3, var_1])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_1, var_1])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_1, var_1])
-
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_2, var_1])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_2, var_3])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_1, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_3, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_2, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_2, var_2])
-
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_3, var_1])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_3, var_2])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_1, var_3])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_3, var_2, var_3])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_1, var_3, var_3])
-                                model.add_step(axiom, Actions.AXIOM, data=[var_2, var_3, var_3])
-                            except FormulaInStepsException:
-                                pass
+        if statistics is None:
+            statistics = SolverStatistics()
+
+        substitutions = []
+        for variable in variables:
+            try:
+                substitutions.append(Formula.parse(variable))
+            except ValueError:
+                pass
+
+        steps = {step.formula_tree for step in model.steps}
+        goals = set()
+        for subformula in Formula.parse(model.consequence_formula).subformulas():
+            goals.add(subformula)
+            goals.add(Formula.negation(subformula))
+
+        if workers is None or workers > 1:
+            if executor is not None:
+                return Solver.__use_axioms_parallel(model, substitutions, steps, goals, relevant_only, statistics,
+                                                    budget, executor, rejected)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return Solver.__use_axioms_parallel(model, substitutions, steps, goals, relevant_only, statistics,
+                                                    budget, executor, rejected)
+
+        for axiom_index, axiom in enumerate(model.base_axioms):
+            schema = Formula.parse(axiom)
+            for data in itertools.product(substitutions, repeat=len(schema.variables)):
+                if model.end:
+                    return True
+                if budget is not None:
+                    budget.check(len(model.steps))
+                statistics.axiom_instances += 1
+                instance = schema.substitute(dict(zip(schema.variables, data)))
+                if relevant_only and not Solver.__is_relevant(instance, steps, goals):
+                    statistics.axiom_instances_pruned += 1
+                    if rejected is not None:
+                        rejected.append((axiom_index, instance))
+                    continue
+                status, _ = model.try_add_step(axiom, Actions.AXIOM, data=[str(formula) for formula in data])
+                Solver.__count_axiom_step(status, instance, steps, statistics)
+        return True
+
+    @staticmethod
+    def __use_axioms_parallel(model: Model,
+                              substitutions: list,
+                              steps: set,
+                              goals: set,
+                              relevant_only: bool,
+                              statistics: SolverStatistics,
+                              budget: SolverBudget,
+                              executor: ProcessPoolExecutor,
+                              rejected: list) -> bool:
+        """
+        Parallel version of use_axioms. The axiom instances are split into shards by the axiom and the substitution
+        of its first variable, and the shards are instantiated by a process pool (AxiomInstantiator). The results
+        are merged in the order of the shards, so the steps and the statistics are the same as the steps and the
+        statistics of the sequential version. The workers only return the substitutions of the kept instances, the
+        instances are built again structurally, and added without substituting into the axioms' strings. The shards
+        of an axiom are sent in one chunk, with one copy of the context (see AxiomInstantiator).
+
+        Args:
+            model: Contains the steps, and the model's try_add_axiom_instance is used.
+            substitutions: the parsed formulas to be substituted into the axioms
+            steps: formulas of the steps
+            goals: subformulas of the consequence formula, and their negations
+            relevant_only: if True, the instances that can't be used are not added to the steps
+            statistics: the number of the generated, pruned, duplicate and added instances are counted in it
+            budget: if given, it is checked before every instance
+            executor: the process pool
+            rejected: if not None, the instances rejected by the relevance filter are appended to it
+
+        Raises:
+            BudgetExhaustedException: if a limit of the budget is exceeded
+
+        Returns:
+            True if the substitutions were successful.
+        """
+        schemas = [Formula.parse(axiom) for axiom in model.base_axioms]
+        context = (schemas, substitutions, frozenset(steps), frozenset(goals), relevant_only, rejected is not None)
+        shards = [(axiom_index, first_index, context)
+                  for axiom_index in range(len(schemas))
+                  for first_index in range(len(substitutions))]
+        results = executor.map(AxiomInstantiator.instantiate, shards, chunksize=max(1, len(substitutions)))
+        for (axiom_index, _, _), (instances, generated, pruned) in zip(shards, results):
+            schema = schemas[axiom_index]
+            statistics.axiom_instances += generated
+            statistics.axiom_instances_pruned += pruned
+            for indexes, relevant in instances:
+                if model.end:
+                    return True
+                if budget is not None:
+                    budget.check(len(model.steps))
+                instance = schema.substitute({variable: substitutions[index]
+                                              for variable, index in zip(schema.variables, indexes)})
+                if relevant_only and not (relevant and Solver.__is_relevant(instance, steps, goals)):
+                    statistics.axiom_instances_pruned += 1
+                    if rejected is not None:
+                        rejected.append((axiom_index, instance))
+                    continue
+                status, _ = model.try_add_axiom_instance(axiom_index, instance)
+                Solver.__count_axiom_step(status, instance, steps, statistics)
+        return True
+
+    @staticmethod
+    def use_rejected_axioms(model: Model,
+                            rejected: list,
+                            statistics: SolverStatistics = None,
+                            budget: SolverBudget = None) -> bool:
+        """
+        Adds the axiom instances, that the relevance filter of use_axioms rejected, to the steps, in the order of
+        the substitutions. The instances are not substituted again, they are added with the model's
+        try_add_axiom_instance.
+
+        Args:
+            model: Contains the steps
+            rejected: the rejected instances, (index of the axiom, instance) tuples (see use_axioms)
+            statistics: if given, the duplicate and added instances are counted in it
+            budget: if given, it is checked before every instance
+
+        Raises:
+            BudgetExhaustedException: if a limit of the budget is exceeded
+
+        Returns:
+            True if the instances were added.
+        """
+        if statistics is None:
+            statistics = SolverStatistics()
+
+        steps = {step.formula_tree for step in model.steps}
+        for axiom_index, instance in rejected:
+            if model.end:
+                return True
+            if budget is not None:
+                budget.check(len(model.steps))
+            status, _ = model.try_add_axiom_instance(axiom_index, instance)
+            Solver.__count_axiom_step(status, instance, steps, statistics)
         return True
+
+    @staticmethod
+    def __count_axiom_step(status: AddStepStatus, instance: Formula, steps: set, statistics: SolverStatistics) -> None:
+        """
+        Counts the usage of an axiom instance in the statistics, and puts the added instance into the formulas of the
+        steps.
+
+        Args:
+            status: the status of adding the instance to the steps
+            instance: the axiom instance
+            steps: formulas of the steps
+            statistics: the usage is counted in it
+        """
+        statistics.count_step(Actions.AXIOM, status)
+        if status == AddStepStatus.DUPLICATE:
+            statistics.axiom_duplicates += 1
+        elif status == AddStepStatus.ADDED:
+            statistics.axiom_steps += 1
+            steps.add(instance)
+
+    @staticmethod
+    def __is_relevant(instance: Formula, steps: set, goals: set) -> bool:
+        """
+        Decides whether an axiom instance can be used in the proof.
+
+        Args:
+            instance: the axiom instance
+            steps: formulas of the steps, including the instances added before
+            goals: subformulas of the consequence formula, and their negations
+
+        Returns:
+            True if the antecedent or the negated consequent of the instance is in the steps, or its consequent is
+            in the goals
+            False otherwise
+        """
+        if not instance.is_implication():
+            return instance in goals
+        return (instance.left in steps or Formula.negation(instance.right) in steps or
+                instance.right in goals)
@@ -0,0 +1,126 @@
+import os
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from Model.budget_exhausted_exception import BudgetExhaustedException
+
+
+class SolverBudget:
+    """
+    Limits of a Solver run: a wall-clock time limit, a maximum number of steps and a maximum resident memory. The
+    Solver calls check regularly, which raises BudgetExhaustedException when a limit is exceeded. None means no
+    limit. The run can be cancelled from another thread with cancel, and the progress of the run can be reported
+    to a callback.
+
+    Attributes:
+        time_limit: (float) seconds the run may take
+        max_steps: (int) maximum number of steps in the model
+        max_memory: (int) maximum resident memory of the process, in bytes
+        progress: (callable) called with the number of steps and the elapsed seconds in every PROGRESS_INTERVAL
+                  check, or None
+        __started: (float) time.monotonic() value, when the run started
+        __deadline: (float) time.monotonic() value, when the time limit runs out
+        __checks: (int) number of checks since start, the memory is only measured in every MEMORY_CHECK_INTERVAL
+        __cancelled: (bool) True if the run was cancelled
+    """
+
+    MEMORY_CHECK_INTERVAL = 256
+    PROGRESS_INTERVAL = 256
+
+    def __init__(self,
+                 time_limit: float = None,
+                 max_steps: int = None,
+                 max_memory: int = None,
+                 progress=None) -> None:
+        """
+        Constructor for SolverBudget.
+
+        Raises:
+            ValueError: if one of the limits is negative
+
+        Args:
+            time_limit: seconds the run may take
+            max_steps: maximum number of steps in the model
+            max_memory: maximum resident memory of the process, in bytes
+            progress: called with the number of steps and the elapsed seconds regularly
+        """
+        for limit in (time_limit, max_steps, max_memory):
+            if limit is not None and limit < 0:
+                raise ValueError
+        self.time_limit = time_limit
+        self.max_steps = max_steps
+        self.max_memory = max_memory
+        self.progress = progress
+        self.__started = time.monotonic()
+        self.__deadline = None
+        self.__checks = 0
+        self.__cancelled = False
+
+    def start(self) -> None:
+        """
+        Starts the time limit, the Solver calls it at the beginning of a run.
+        """
+        self.__checks = 0
+        self.__started = time.monotonic()
+        self.__deadline = None if self.time_limit is None else self.__started + self.time_limit
+
+    def cancel(self) -> None:
+        """
+        Cancels the run, the next check raises BudgetExhaustedException. Can be called from another thread.
+        """
+        self.__cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Returns:
+            True if the run was cancelled
+        """
+        return self.__cancelled
+
+    def check(self, number_of_steps: int) -> None:
+        """
+        Checks the limits.
+
+        Raises:
+            BudgetExhaustedException: if one of the limits is exceeded, or the run was cancelled
+
+        Args:
+            number_of_steps: current number of steps in the model
+        """
+        if self.__cancelled:
+            raise BudgetExhaustedException('cancelled')
+        if self.max_steps is not None and number_of_steps > self.max_steps:
+            raise BudgetExhaustedException('steps')
+        if self.__deadline is not None and time.monotonic() > self.__deadline:
+            raise BudgetExhaustedException('time')
+        self.__checks += 1
+        if self.progress is not None and self.__checks % SolverBudget.PROGRESS_INTERVAL == 1:
+            self.progress(number_of_steps, time.monotonic() - self.__started)
+        if self.max_memory is not None and self.__checks % SolverBudget.MEMORY_CHECK_INTERVAL == 1:
+            memory = SolverBudget.resident_memory()
+            if memory is not None and memory > self.max_memory:
+                raise BudgetExhaustedException('memory')
+
+    @staticmethod
+    def resident_memory() -> int | None:
+        """
+        Measures the resident memory of the process. Uses /proc/self/statm if possible, otherwise the peak resident
+        memory from the resource module.
+
+        Returns:
+            the resident memory in bytes, or None if it can't be measured
+        """
+        try:
+            with open('/proc/self/statm') as file:
+                return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError, AttributeError):
+            pass
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == 'Darwin' else peak * 1024
@@ -0,0 +1,70 @@
+from Model.solver_status import SolverStatus
+from Model.solver_statistics import SolverStatistics
+
+
+class SolverResult:
+    """
+    Structured result of a Solver run.
+
+    Attributes:
+        status: (SolverStatus) how the run ended
+        proof: (str list) the important steps of the proof, empty if the consequence is not derived
+        steps: (str list) all steps derived during the run, the partial closure if the run was stopped, empty if the
+               closure was not requested (see Solver.run)
+        number_of_steps: (int) number of the steps derived during the run
+        statistics: (SolverStatistics) statistics of the run
+        exhausted_budget: (str) the budget that ran out ('time', 'steps' or 'memory'), 'cancelled' if the run was
+                          cancelled, otherwise ''
+        cached: (bool) True if the proof was found in the proof cache
+    """
+
+    def __init__(self,
+                 status: SolverStatus,
+                 proof: list = None,
+                 steps: list = None,
+                 number_of_steps: int = None,
+                 statistics: SolverStatistics = None,
+                 exhausted_budget: str = '',
+                 cached: bool = False) -> None:
+        """
+        Constructor for SolverResult.
+
+        Args:
+            status: how the run ended
+            proof: the important steps of the proof
+            steps: all steps derived during the run
+            number_of_steps: number of the steps derived during the run, the default is the length of the steps
+            statistics: statistics of the run
+            exhausted_budget: the budget that ran out
+            cached: True if the proof was found in the proof cache
+        """
+        self.status = status
+        self.proof = proof if proof is not None else []
+        self.steps = steps if steps is not None else []
+        self.number_of_steps = number_of_steps if number_of_steps is not None else len(self.steps)
+        self.statistics = statistics if statistics is not None else SolverStatistics()
+        self.exhausted_budget = exhausted_budget
+        self.cached = cached
+
+    @property
+    def proved(self) -> bool:
+        """
+        Returns:
+            True if the consequence formula is derived
+        """
+        return self.status == SolverStatus.PROVED
+
+    def to_dict(self) -> dict:
+        """
+        Returns:
+            dictionary of the result, that can be written to JSON
+        """
+        return {
+            'status': self.status.name,
+            'proof': self.proof,
+            'steps': self.steps,
+            'number_of_steps': self.number_of_steps,
+            'statistics': self.statistics.to_dict(),
+            'exhausted_budget': self.exhausted_budget,
+            'cached': self.cached,
+        }
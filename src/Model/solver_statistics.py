@@ -0,0 +1,114 @@
+import time
+import logging
+from contextlib import contextmanager
+
+from Model.actions import Actions
+from Model.add_step_status import AddStepStatus
+
+
+class SolverStatistics:
+    """
+    Collects statistics about one run of the Solver. Pass an instance to Solver.solve (or to the Solver's phases),
+    and the counters will be filled during the solving. The counting is cheap (integer additions and one clock
+    reading per phase), so it is always on; Solver.run also logs the statistics on the DEBUG level of the
+    'Model.solver' logger.
+
+    Attributes:
+        axiom_instances: (int) number of the axiom instances generated by use_axioms
+        axiom_instances_pruned: (int) number of the axiom instances dropped by the relevance filter
+        axiom_steps: (int) number of the axiom instances added to the steps
+        axiom_duplicates: (int) number of the axiom instances rejected, because they were already in the steps
+        rule_attempts: (dict) name of the action -> number of the steps tried to be added with it
+        rule_successes: (dict) name of the action -> number of the steps added with it
+        duplicate_steps: (int) number of the steps rejected, because their formula was already in the steps
+        validation_calls: (int) number of the formulas validated: the steps given to Model.try_add_step, and the
+            formulas checked by the Solver
+        exceptions: (dict) name of the exception class -> number of the exceptions raised during the solving
+        phase_times: (dict) name of the phase -> seconds spent in the phase
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for SolverStatistics, all counters start from zero.
+        """
+        self.axiom_instances = 0
+        self.axiom_instances_pruned = 0
+        self.axiom_steps = 0
+        self.axiom_duplicates = 0
+        self.rule_attempts = {}
+        self.rule_successes = {}
+        self.duplicate_steps = 0
+        self.validation_calls = 0
+        self.exceptions = {}
+        self.phase_times = {}
+
+    def count_step(self, action: Actions, status: AddStepStatus) -> None:
+        """
+        Counts an attempt to add a step with the action, and its result. Every attempt validates a formula.
+
+        Args:
+            action: the action of the step
+            status: the result of Model.try_add_step
+        """
+        self.rule_attempts[action.name] = self.rule_attempts.get(action.name, 0) + 1
+        if status == AddStepStatus.ADDED:
+            self.rule_successes[action.name] = self.rule_successes.get(action.name, 0) + 1
+        elif status == AddStepStatus.DUPLICATE:
+            self.duplicate_steps += 1
+        self.validation_calls += 1
+
+    def count_exception(self, exception: Exception) -> None:
+        """
+        Counts an exception raised during the solving.
+
+        Args:
+            exception: the raised exception
+        """
+        name = type(exception).__name__
+        self.exceptions[name] = self.exceptions.get(name, 0) + 1
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Measures the wall time of a phase, the time of the same phase is summed, if it runs more than once. The time
+        is added even if the phase is stopped by an exception.
+
+        Args:
+            name: name of the phase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - start
+
+    def log(self, logger: logging.Logger = None, level: int = logging.DEBUG) -> None:
+        """
+        Logs the statistics in one line. Nothing is formatted if the level is not enabled for the logger.
+
+        Args:
+            logger: the logger, the default is the 'Model.solver' logger
+            level: the level of the record
+        """
+        if logger is None:
+            logger = logging.getLogger('Model.solver')
+        if logger.isEnabledFor(level):
+            logger.log(level, 'Solver statistics: %s', self.to_dict())
+
+    def to_dict(self) -> dict:
+        """
+        Returns:
+            dictionary of the counters' names and values
+        """
+        return {
+            'axiom_instances': self.axiom_instances,
+            'axiom_instances_pruned': self.axiom_instances_pruned,
+            'axiom_steps': self.axiom_steps,
+            'axiom_duplicates': self.axiom_duplicates,
+            'rule_attempts': dict(self.rule_attempts),
+            'rule_successes': dict(self.rule_successes),
+            'duplicate_steps': self.duplicate_steps,
+            'validation_calls': self.validation_calls,
+            'exceptions': dict(self.exceptions),
+            'phase_times': {name: round(seconds, 6) for name, seconds in self.phase_times.items()},
+        }
@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class SolverStatus(Enum):
+    """
+    Enum for the result of a Solver run.
+    PROVED: the consequence formula is derived
+    NOT_PROVED: the search ended without deriving the consequence formula
+    UNPROVABLE: the consequence formula does not follow from the formula set
+    INVALID: the task is invalid (no model, or empty consequence formula)
+    BUDGET_EXHAUSTED: the search was stopped, because a budget ran out
+    """
+    PROVED = 0
+    NOT_PROVED = 1
+    UNPROVABLE = 2
+    INVALID = 3
+    BUDGET_EXHAUSTED = 4
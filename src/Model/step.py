@@ -1,5 +1,6 @@
 from Model.actions import Actions
 from Model.Utils.utils import Utils
+from Model.formula import Formula
 
 
 class Step:
@@ -63,3 +64,17 @@ class Step:
         else:
             self.rule_implication = rule_implication
             self.rule_detached = rule_detached
+
+    @property
+    def formula_tree(self) -> Formula:
+        """
+        The structural representation of the step's formula. Parsing is cached, so the shared Formula object is
+        looked up after the first parse.
+
+        Raises:
+            ValueError: if the formula is empty or invalid
+
+        Returns:
+            the Formula of the step's formula
+        """
+        return Formula.parse(self.formula)
@@ -0,0 +1,291 @@
+from bisect import bisect_left
+from itertools import islice
+
+from Model.step import Step
+from Model.actions import Actions
+from Model.formula import Formula
+
+
+class StepStore:
+    """
+    Stores the steps of a proving method in order, and keeps a hash index of the steps' formulas, so searching for a
+    formula in the steps takes constant time. Behaves like the list of steps: it can be indexed, iterated, appended
+    and its length can be asked.
+
+    The steps are also indexed by the members of their main connective, so the partners of a step for the syntax
+    rules (MP, MT, MTP, MPT, CS) are found with dictionary lookups, instead of trying every other step.
+
+    A store can be forked in constant time: the steps and the indexes of the store are sealed into a parent store,
+    that is never changed again, and both the store and the fork are layered over it. A layered store only keeps the
+    steps appended after the fork, the first steps (below the base) are read from the parent, so the branches of a
+    search share the memory of their common steps. Deleting steps below the base only lowers the base. The
+    positions in the indexes are always absolute positions of the steps.
+
+    Attributes:
+        __parent: (StepStore) sealed store of the first steps, or None
+        __base: (int) number of the steps read from the parent
+        __depth: (int) number of the parents above the store
+        __steps: (Step list) list of steps in the proving method, after the base
+        __formula_index: (dict) formula of a step -> index of the first step with that formula in the steps
+        __members: (dict) name of a member index -> dict of Formula -> indexes of the steps with the member. The
+            member indexes are 'antecedent' and 'consequent' (implications), 'first_member' (disjunctions) and
+            'negated_body' (negations).
+    """
+
+    MAX_DEPTH = 32
+    MEMBER_INDEXES = ('antecedent', 'consequent', 'first_member', 'negated_body')
+
+    def __init__(self, steps: list = None) -> None:
+        """
+        Constructor for StepStore.
+
+        Args:
+            steps: steps that will be appended to the store, in order
+        """
+        self.__parent = None
+        self.__base = 0
+        self.__depth = 0
+        self.__steps = []
+        self.__formula_index = {}
+        self.__members = {name: {} for name in StepStore.MEMBER_INDEXES}
+        if steps:
+            for step in steps:
+                self.append(step)
+
+    def append(self, step: Step) -> None:
+        """
+        Appends the step to the end of the steps, and indexes its formula and the members of its formula.
+
+        Args:
+            step: step to be appended
+        """
+        position = self.__base + len(self.__steps)
+        if isinstance(step, Step):
+            if self.__parent is None or self.index_of(step.formula) == -1:
+                self.__formula_index.setdefault(step.formula, position)
+            for name, member in self.__member_keys(step):
+                self.__members[name].setdefault(member, []).append(position)
+        self.__steps.append(step)
+
+    def truncate(self, index: int) -> None:
+        """
+        Deletes the steps from the given index to the end of the steps, and removes their formulas from the index.
+        If the index is below the base, the own steps are dropped and the base is lowered, the parent is not
+        changed.
+
+        Args:
+            index: index of the first step to be deleted
+        """
+        index = max(index, 0)
+        if index <= self.__base:
+            self.__steps = []
+            self.__formula_index = {}
+            self.__members = {name: {} for name in StepStore.MEMBER_INDEXES}
+            self.__base = min(index, self.__base)
+            if self.__base == 0:
+                self.__parent = None
+                self.__depth = 0
+            return
+        for step in self.__steps[index - self.__base:]:
+            if not isinstance(step, Step):
+                continue
+            if self.__formula_index.get(step.formula, -1) >= index:
+                del self.__formula_index[step.formula]
+            for name, member in self.__member_keys(step):
+                positions = self.__members[name].get(member, [])
+                while positions and positions[-1] >= index:
+                    positions.pop()
+                if not positions:
+                    self.__members[name].pop(member, None)
+        del self.__steps[index - self.__base:]
+
+    def fork(self) -> 'StepStore':
+        """
+        Forks the store in constant time. The steps of the store are sealed into a shared parent, the store and the
+        fork only keep the steps appended after the fork, so changing one of them does not change the other.
+        If the chain of the parents is longer than MAX_DEPTH, the steps are copied into a new parent, so the
+        lookups stay fast.
+
+        Returns:
+            the new store with the same steps
+        """
+        if self.__steps or self.__depth >= StepStore.MAX_DEPTH:
+            self.__seal()
+        fork = StepStore()
+        fork.__parent = self.__parent
+        fork.__base = self.__base
+        fork.__depth = self.__depth
+        return fork
+
+    def __seal(self) -> None:
+        """
+        Moves the steps and the indexes of the store into a new parent store, that is not changed later. If the
+        chain of the parents is too long, the parent is a flat copy of the steps.
+        """
+        if self.__depth >= StepStore.MAX_DEPTH:
+            parent = StepStore(list(self))
+        else:
+            parent = StepStore()
+            parent.__parent = self.__parent
+            parent.__base = self.__base
+            parent.__depth = self.__depth
+            parent.__steps = self.__steps
+            parent.__formula_index = self.__formula_index
+            parent.__members = self.__members
+        self.__parent = parent
+        self.__base = len(parent)
+        self.__depth = parent.__depth + 1
+        self.__steps = []
+        self.__formula_index = {}
+        self.__members = {name: {} for name in StepStore.MEMBER_INDEXES}
+
+    def index_of(self, formula: str) -> int:
+        """
+        Searches for the formula in the steps.
+
+        Args:
+            formula: reformatted logical formula
+        Returns:
+            index of the first step with the given formula, or -1 if no step contains the formula
+        """
+        if self.__parent is not None:
+            index = self.__parent.index_of(formula)
+            if 0 <= index < self.__base:
+                return index
+        return self.__formula_index.get(formula, -1)
+
+    def contains_formula(self, formula: str) -> bool:
+        """
+        Decides whether a step contains the formula or not.
+
+        Args:
+            formula: reformatted logical formula
+        Returns:
+            True if one of the steps contains the formula
+            False otherwise
+        """
+        if formula in self.__formula_index:
+            return True
+        return self.__parent is not None and 0 <= self.__parent.index_of(formula) < self.__base
+
+    def partners(self, index: int, limit: int = None) -> list:
+        """
+        Collects the usages of the syntax rules, where the step at the given index is one of the params and the
+        other param is an earlier step than the limit. The rules are not applied, the returned params are
+        guaranteed to fit.
+
+        Args:
+            index: index of the step
+            limit: only the steps before this index are partners, the default is all steps
+        Returns:
+            list of (action, first param's index, second param's index) tuples, in the order of the partners'
+            indexes, for one partner the order of the actions is MP, MT, MTP, MPT, CS
+        """
+        if limit is None:
+            limit = len(self)
+        if not 0 <= index < len(self):
+            return []
+        try:
+            formula = self[index].formula_tree
+        except (AttributeError, ValueError):
+            return []
+
+        usages = []
+        if formula.is_implication():
+            usages.append((Actions.MP, index, self.index_of(str(formula.left))))
+            usages += [(Actions.MT, index, other) for other in self.__positions('negated_body', formula.right)]
+            if formula.left.is_negation() and formula.right.is_negation():
+                usages.append((Actions.MPT, index, self.index_of(str(formula.right.left))))
+            usages += [(Actions.CS, index, other) for other in self.__positions('antecedent', formula.right)]
+            usages += [(Actions.CS, other, index) for other in self.__positions('consequent', formula.left)]
+        elif formula.is_disjunction():
+            usages += [(Actions.MTP, index, other) for other in self.__positions('negated_body', formula.left)]
+
+        usages += [(Actions.MP, other, index) for other in self.__positions('antecedent', formula)]
+        if formula.is_negation():
+            usages += [(Actions.MT, other, index) for other in self.__positions('consequent', formula.left)]
+            usages += [(Actions.MTP, other, index) for other in self.__positions('first_member', formula.left)]
+        usages += [(Actions.MPT, other, index) for other in self.__positions('consequent', Formula.negation(formula))
+                   if self[other].formula_tree.left.is_negation()]
+
+        order = [Actions.MP, Actions.MT, Actions.MTP, Actions.MPT, Actions.CS]
+        usages = [usage for usage in usages
+                  if 0 <= usage[1] < limit and 0 <= usage[2] < limit and usage[1] != usage[2]]
+        usages.sort(key=lambda usage: (usage[2] if usage[1] == index else usage[1], order.index(usage[0])))
+        return usages
+
+    def __positions(self, name: str, member: Formula) -> list:
+        """
+        Returns:
+            sorted indexes of the steps, that have the member in the given member index, including the steps of
+            the parents below the base
+        """
+        own = self.__members[name].get(member, [])
+        if self.__parent is None:
+            return own
+        inherited = self.__parent.__positions(name, member)
+        if inherited and inherited[-1] >= self.__base:
+            inherited = inherited[:bisect_left(inherited, self.__base)]
+        return inherited + own if own else inherited
+
+    @staticmethod
+    def __member_keys(step: Step) -> list:
+        """
+        Returns:
+            list of (member index name, member) tuples, the step has to be indexed with
+        """
+        try:
+            formula = step.formula_tree
+        except ValueError:
+            return []
+        if formula.is_implication():
+            return [('antecedent', formula.left), ('consequent', formula.right)]
+        if formula.is_disjunction():
+            return [('first_member', formula.left)]
+        if formula.is_negation():
+            return [('negated_body', formula.left)]
+        return []
+
+    def __len__(self) -> int:
+        return self.__base + len(self.__steps)
+
+    def __getitem__(self, index: int | slice) -> Step | list:
+        if self.__parent is None:
+            return self.__steps[index]
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError('step index out of range')
+        if index < self.__base:
+            return self.__parent[index]
+        return self.__steps[index - self.__base]
+
+    def __iter__(self):
+        if self.__parent is not None:
+            yield from islice(self.__parent, self.__base)
+        yield from self.__steps
+
+    def __delitem__(self, index: int | slice) -> None:
+        """
+        Deletes steps. Deleting the end of the steps keeps the index, otherwise the index is rebuilt.
+
+        Args:
+            index: index or slice of the steps to be deleted
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if stop == len(self) and step == 1:
+                self.truncate(start)
+                return
+        steps = list(self)
+        del steps[index]
+        self.__parent = None
+        self.__base = 0
+        self.__depth = 0
+        self.__steps = []
+        self.__formula_index = {}
+        self.__members = {name: {} for name in StepStore.MEMBER_INDEXES}
+        for step in steps:
+            self.append(step)
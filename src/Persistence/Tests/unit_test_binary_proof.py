@@ -0,0 +1,91 @@
+import io
+import json
+import unittest
+
+from Persistence.binary_proof import BinaryProof
+
+
+class UnitTestBinaryProof(unittest.TestCase):
+    """
+    Unit test for Persistence.BinaryProof class.
+    """
+
+    def setUp(self) -> None:
+        self.data = {
+            'formula_set': ['(A >> B)', 'A'],
+            'consequence_formula': 'B',
+            'end': True,
+            'number_of_steps': 5,
+            'steps': [
+                [0, '(A >> B)', 'Actions.HYP', '', 0, 0],
+                [1, 'A', 'Actions.HYP', '', 0, 0],
+                [2, '(A >> (B >> A))', 'Actions.AXIOM', '[AXIOM: 1. A=A B=B]', 0, 0],
+                [3, '(B >> A)', 'Actions.MP', '', 2, 1],
+                [4, 'B', 'Actions.MP', '', 0, 1]
+            ],
+            'task_name': '{(A >> B), A} |- B',
+            'added_axioms': ['(A >> (~A >> B))'],
+            'content_hash': '0' * 64
+        }
+
+    @staticmethod
+    def __write(data: dict) -> bytes:
+        file = io.BytesIO()
+        BinaryProof.write(data, file)
+        return file.getvalue()
+
+    def test_write_read(self) -> None:
+        content = UnitTestBinaryProof.__write(self.data)
+        self.assertTrue(content.startswith(BinaryProof.MAGIC))
+        self.assertEqual(BinaryProof.read(io.BytesIO(content)), self.data)
+
+        del self.data['content_hash']
+        self.data['end'] = False
+        self.data['formula_set'] = []
+        self.data['steps'] = []
+        self.assertEqual(BinaryProof.read(io.BytesIO(UnitTestBinaryProof.__write(self.data))), self.data)
+
+    def test_formula_table(self) -> None:
+        formulas = ['((A & ~B) >> (C | ~(A & ~B)))', '~~(A & ~B)', '(A  >>  B)', 'A >> B']
+        self.data['steps'] = [[index, formula, 'Actions.HYP', '', 0, 0] for index, formula in enumerate(formulas)]
+        self.data['formula_set'] = formulas
+        content = UnitTestBinaryProof.__write(self.data)
+        self.assertEqual(BinaryProof.read(io.BytesIO(content)), self.data)
+        number_of_formulas = BinaryProof.HEADER.unpack(content[:BinaryProof.HEADER.size])[5]
+        # A, B, ~B, (A & ~B), C, ~(A & ~B), (C | ~(A & ~B)), the first formula, ~~(A & ~B), the two raw strings,
+        # and ~A, (~A >> B), (A >> (~A >> B)) of the added axiom
+        self.assertEqual(number_of_formulas, 14)
+
+        steps = [[index, '((A >> B) >> (A >> B))', 'Actions.AXIOM', '', 0, 0] for index in range(1000)]
+        self.data['steps'] = steps
+        self.assertLess(len(UnitTestBinaryProof.__write(self.data)) * 2, len(json.dumps(steps)))
+
+    def test_read_steps(self) -> None:
+        steps = BinaryProof.read_steps(io.BytesIO(UnitTestBinaryProof.__write(self.data)))
+        data = next(steps)
+        self.assertNotIn('steps', data)
+        self.assertEqual(data['task_name'], '{(A >> B), A} |- B')
+        self.assertEqual(next(steps), [0, '(A >> B)', 'Actions.HYP', '', 0, 0])
+        self.assertEqual(list(steps), self.data['steps'][1:])
+
+    def test_invalid(self) -> None:
+        content = UnitTestBinaryProof.__write(self.data)
+        self.assertRaises(ValueError, BinaryProof.read, io.BytesIO(content[:-1]))
+        self.assertRaises(ValueError, BinaryProof.read, io.BytesIO(content[:10]))
+        self.assertRaises(ValueError, BinaryProof.read, io.BytesIO(b'{"steps": []}' + content))
+        self.assertRaises(ValueError, BinaryProof.read, io.BytesIO(b''))
+
+        invalid = [dict(self.data, steps=[[0, 'A', 'Actions.RULE', '', 0, 0]]),
+                   dict(self.data, steps=[[0, 'A', 'HYP', '', 0, 0]]),
+                   dict(self.data, steps=[[-1, 'A', 'Actions.HYP', '', 0, 0]]),
+                   dict(self.data, steps=[[0, 'A', 'Actions.HYP', '']]),
+                   dict(self.data, task_name=None)]
+        for data in invalid:
+            self.assertRaises(ValueError, BinaryProof.write, data, io.BytesIO())
+        data = dict(self.data)
+        del data['added_axioms']
+        self.assertRaises(ValueError, BinaryProof.write, data, io.BytesIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import os
 import json
+import tempfile
+from unittest import mock
 
 from Persistence.data_access import DataAccess
 
@@ -8,16 +10,28 @@ from Persistence.data_access import DataAccess
 class UnitTestUtils(unittest.TestCase):
     """
     Unit test for Persistence.Utils.utils.py
-    Testing helper functions.
+    Testing helper functions. The files are written to a temporary persistence directory.
     """
 
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        os.mkdir(os.path.join(self.directory.name, 'Saves'))
+        os.mkdir(os.path.join(self.directory.name, 'Windows'))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def __data_access(self, binary: bool = False) -> DataAccess:
+        return DataAccess(binary=binary, persistence_path=self.directory.name)
+
     def test_windows_cleaner(self) -> None:
         """
         Unit tests for Persistence.Utils.utils.windows_cleaner function
         """
-        persistence_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        persistence_path = os.path.join(persistence_path, 'Windows')
-        data_access = DataAccess()
+        data_access = self.__data_access()
+        persistence_path = data_access._DataAccess__get_windows_persistence_path()
+        with open(os.path.join(persistence_path, 'loading_window.json'), 'w') as f:
+            f.write('{}')
         data_access.windows_cleaner()
         self.assertTrue(os.path.exists(persistence_path))
         self.assertTrue(len(os.listdir(persistence_path)) == 0)
@@ -26,10 +40,9 @@ class UnitTestUtils(unittest.TestCase):
         """
         Unit tests for Persistence.Utils.utils.save_new_proving_method_config_window function
         """
-        data_access = DataAccess()
+        data_access = self.__data_access()
         data_access.save_new_proving_method_config_window(['(A >> B)', 'A'], 'B')
-        persistence_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        persistence_path = os.path.join(persistence_path, 'Windows')
+        persistence_path = data_access._DataAccess__get_windows_persistence_path()
         persistence_path = os.path.join(persistence_path, 'new_proving_method_config_window.json')
         self.assertTrue(os.path.exists(persistence_path))
         with open(persistence_path, 'r') as json_file:
@@ -43,7 +56,7 @@ class UnitTestUtils(unittest.TestCase):
         """
         Unit tests for Persistence.Utils.utils.load_new_proving_method_config_function function
         """
-        data_access = DataAccess()
+        data_access = self.__data_access()
         persistence = data_access._DataAccess__get_windows_persistence_path()
         file_path = os.path.join(persistence, 'new_proving_method_config_window.json')
         data = {
@@ -55,7 +68,7 @@ class UnitTestUtils(unittest.TestCase):
         with open(file_path, 'w') as json_file:
             json.dump(data, json_file, indent=2)
         self.assertTrue(os.path.exists(file_path))
-        data_access = DataAccess()
+        data_access = self.__data_access()
         self.assertTrue(data_access.load_new_proving_method_config_window() == (['(A >> B)', 'A'], 'B'))
 
     def test_save_model(self) -> None:
@@ -63,7 +76,7 @@ class UnitTestUtils(unittest.TestCase):
         Unit tests for Persistence.Utils.utils.save_model function
         """
         from datetime import datetime
-        data_access = DataAccess()
+        data_access = self.__data_access()
         data = {
             'formula_set': ['A', 'B'],
             'consequence_formula': 'C',
@@ -83,6 +96,8 @@ class UnitTestUtils(unittest.TestCase):
             read_data = json.load(f)
             f.close()
         self.assertEqual(data, read_data)
+        with open(data_access._DataAccess__get_manifest_path()) as f:
+            self.assertEqual(json.load(f)['saves'][file]['task_name'], '{A, B} |- C')
 
     def test_load_model(self) -> None:
         """
@@ -97,16 +112,85 @@ class UnitTestUtils(unittest.TestCase):
             'task_name': '{A, B} |- C',
             "added_axioms": []
         }
-        data_access = DataAccess()
+        data_access = self.__data_access()
         persistence = data_access._DataAccess__get_saves_persistence_path()
         path = os.path.join(persistence, 'test.json')
         with open(path, 'w') as f:
             json.dump(data, f)
             f.close()
-        data_access = DataAccess()
+        data_access = self.__data_access()
         read_data = data_access.load_model(path)
         self.assertEqual(data, read_data)
 
+    def test_model_list(self) -> None:
+        """
+        Unit tests for Persistence.Utils.utils.model_list and delete_model functions, and the manifest of the saves
+        """
+        data_access = self.__data_access()
+        persistence = data_access._DataAccess__get_saves_persistence_path()
+        manifest_path = data_access._DataAccess__get_manifest_path()
+        path = os.path.join(persistence, 'manifest_test.json')
+        with open(path, 'w') as f:
+            json.dump({'task_name': '{A} |- A', 'number_of_steps': 1}, f)
+
+        saves = data_access.model_list()
+        self.assertIn((path, '{A} |- A - manifest_test'), saves)
+        self.assertEqual(len(saves), len([file for file in os.listdir(persistence) if file.endswith('.json')]))
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest['saves']['manifest_test.json']['number_of_steps'], 1)
+        self.assertEqual(manifest['saves']['manifest_test.json']['size'], os.path.getsize(path))
+
+        with mock.patch.object(DataAccess, 'load_model', side_effect=AssertionError):
+            self.assertEqual(data_access.model_list(), saves)
+
+        with open(path, 'w') as f:
+            json.dump({'task_name': '{B} |- B', 'number_of_steps': 12}, f)
+        self.assertIn((path, '{B} |- B - manifest_test'), data_access.model_list())
+
+        with open(manifest_path, 'w') as f:
+            f.write('{')
+        self.assertIn((path, '{B} |- B - manifest_test'), data_access.model_list())
+
+        data_access.delete_model(path)
+        self.assertFalse(os.path.exists(path))
+        self.assertNotIn(path, [save[0] for save in data_access.model_list()])
+        with open(manifest_path) as f:
+            self.assertNotIn('manifest_test.json', json.load(f)['saves'])
+        self.assertRaises(OSError, data_access.delete_model, path)
+
+    def test_binary_save(self) -> None:
+        """
+        Unit tests for Persistence.Utils.utils.save_model, load_model and export_json functions, with binary saves
+        """
+        from Model.model import Model
+        from Model.actions import Actions
+        data_access = self.__data_access(binary=True)
+        model = Model(['(A >> B)', 'A'], 'B', data_access=data_access)
+        self.assertTrue(model.add_step('(A >> B)', Actions.HYP))
+        self.assertTrue(model.add_step('A', Actions.HYP))
+        self.assertTrue(model.add_step('B', Actions.MP, 0, 1))
+        self.assertTrue(model.save_model())
+        path, name = data_access.model_list()[0]
+        self.assertTrue(path.endswith(DataAccess.BINARY_EXTENSION))
+        self.assertEqual(name, '{(A >> B), A} |- B - ' + os.path.basename(path)[:-6])
+
+        loaded = Model(file_path=path, data_access=data_access)
+        self.assertEqual(loaded.get_steps_string(), model.get_steps_string())
+        self.assertIsNone(loaded.verified())
+
+        json_path = data_access.export_json(path)
+        self.assertEqual(json_path, os.path.join(self.directory.name, 'Exports', os.path.basename(path)[:-6] + '.json'))
+        with open(json_path) as f:
+            self.assertEqual(json.load(f), data_access.load_model(path))
+        self.assertRaises(OSError, data_access.export_json, path)
+        self.assertEqual(data_access.model_list(), [(path, name)])
+        self.assertIsNone(Model(file_path=json_path, data_access=data_access).verified())
+
+        with open(path, 'r+b') as f:
+            f.truncate(20)
+        self.assertRaises(OSError, data_access.load_model, path)
+        self.assertEqual(data_access.model_list(), [])
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from Model.model import Model
+from Model.solver import Solver
+from Persistence.proof_cache import ProofCache
+
+
+class UnitTestProofCache(unittest.TestCase):
+    """
+    Unit test for Persistence.ProofCache class.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ProofCache(os.path.join(self.directory.name, 'proof_cache.sqlite3'))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_normalize(self) -> None:
+        task, renaming = ProofCache.normalize(['K', '(K >> C)', 'K'], 'C')
+        self.assertEqual(task, '[["(B >> A)", "B"], "A"]')
+        self.assertEqual(renaming, {'C': 'A', 'K': 'B'})
+        self.assertEqual(ProofCache.normalize(['(B >> A)', 'B'], 'A')[0], task)
+        self.assertEqual(ProofCache.normalize(['(D>>F)', 'D'], 'F')[0], task)
+        self.assertNotEqual(ProofCache.normalize(['(B >> A)', 'A'], 'B')[0], task)
+        self.assertRaises(ValueError, ProofCache.normalize, ['(A >>'], 'A')
+        self.assertRaises(ValueError, ProofCache.normalize, 'A', 'A')
+
+    def test_get_put(self) -> None:
+        proof = ['1. (A >> B) [HYP]', '2. (A >> (B >> A)) [AXIOM: 1. A=A B=B]', '3. A [HYP]', '4. B [MP(1,3)]']
+        self.assertIsNone(self.cache.get(['(A >> B)', 'A'], 'B'))
+        self.assertTrue(self.cache.put(['(A >> B)', 'A'], 'B', proof))
+        self.assertEqual(self.cache.get(['(A >> B)', 'A'], 'B'), proof)
+        self.assertEqual(self.cache.get(['C', '(C >> D)'], 'D'),
+                         ['1. (C >> D) [HYP]', '2. (C >> (D >> C)) [AXIOM: 1. A=C B=D]', '3. C [HYP]',
+                          '4. D [MP(1,3)]'])
+        self.assertIsNone(self.cache.get(['C', '(C >> ~D)'], '~D'))
+        self.assertFalse(self.cache.put(['(A >> B)', 'A'], 'B', ['invalid step']))
+        self.assertIsNone(self.cache.get(['(A >>'], 'B'))
+
+    def test_solver(self) -> None:
+        result = Solver.run(Model(['A', 'B'], '(A & B)'), cache=self.cache)
+        self.assertTrue(result.proved)
+        self.assertFalse(result.cached)
+
+        result = Solver.run(Model(['C', 'D'], '(C & D)'), cache=self.cache)
+        self.assertTrue(result.proved)
+        self.assertTrue(result.cached)
+        self.assertEqual(result.proof[len(result.proof) - 1], '5. (C & D) [MP(4,2)]')
+        self.assertEqual(Solver.solve(Model(['D', 'C'], '(D & C)'), cache=self.cache)[0], True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import json
+import tempfile
+import unittest
+
+from Model.model import Model
+from Model.actions import Actions
+from Persistence.sqlite_data_access import SqliteDataAccess
+
+
+class UnitTestSqliteDataAccess(unittest.TestCase):
+    """
+    Unit test for Persistence.SqliteDataAccess class.
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.data_access = SqliteDataAccess(os.path.join(self.directory.name, 'saves.sqlite3'))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    @staticmethod
+    def __data(task_name: str, end: bool, number_of_steps: int) -> dict:
+        return {
+            'formula_set': ['A', 'B'],
+            'consequence_formula': 'C',
+            'end': end,
+            'number_of_steps': number_of_steps,
+            'steps': [[0, 'A', 'Actions.HYP', "", 0, 0]],
+            'task_name': task_name,
+            'added_axioms': []
+        }
+
+    def test_save_load_delete(self) -> None:
+        data = UnitTestSqliteDataAccess.__data('{A, B} |- C', False, 1)
+        self.data_access.save_model(data)
+        self.data_access.save_model(data)
+        saves = self.data_access.model_list()
+        self.assertEqual(len(saves), 2)
+        self.assertNotEqual(saves[0][0], saves[1][0])
+        self.assertTrue(saves[0][0].startswith(SqliteDataAccess.PATH_PREFIX))
+        self.assertTrue(saves[0][1].startswith('{A, B} |- C - '))
+        self.assertEqual(self.data_access.load_model(saves[0][0]), data)
+
+        self.data_access.delete_model(saves[0][0])
+        self.assertEqual(self.data_access.model_list(), saves[1:])
+        self.assertRaises(OSError, self.data_access.load_model, saves[0][0])
+        self.assertRaises(OSError, self.data_access.delete_model, saves[0][0])
+        self.assertRaises(OSError, self.data_access.load_model, 'sqlite:x')
+        self.assertRaises(OSError, self.data_access.load_model, os.path.join(self.directory.name, 'save.json'))
+        self.assertRaises(OSError, self.data_access.save_model, {'task_name': 'A'})
+
+    def test_connection_error(self) -> None:
+        directory = os.path.join(self.directory.name, 'database')
+        os.mkdir(directory)
+        data_access = SqliteDataAccess(os.path.join(directory, 'saves.sqlite3'))
+        os.remove(os.path.join(directory, 'saves.sqlite3'))
+        os.rmdir(directory)
+        self.assertRaises(OSError, data_access.save_model, UnitTestSqliteDataAccess.__data('{A} |- A', True, 1))
+        self.assertRaises(OSError, data_access.load_model, 'sqlite:1')
+        self.assertRaises(OSError, data_access.delete_model, 'sqlite:1')
+        self.assertRaises(OSError, data_access.model_list)
+        self.assertRaises(OSError, data_access.import_json_saves, self.directory.name)
+
+    def test_model_list(self) -> None:
+        self.data_access.save_model(UnitTestSqliteDataAccess.__data('{A} |- A', True, 1))
+        self.data_access.save_model(UnitTestSqliteDataAccess.__data('{A, B} |- C', False, 5))
+        self.data_access.save_model(UnitTestSqliteDataAccess.__data('{(A >> B), A} |- B', True, 4))
+
+        def names(**kwargs) -> list:
+            return [save[1].split(' - ')[0] for save in self.data_access.model_list(**kwargs)]
+
+        self.assertEqual(names(), ['{A} |- A', '{A, B} |- C', '{(A >> B), A} |- B'])
+        self.assertEqual(names(task_name='A, B'), ['{A, B} |- C'])
+        self.assertEqual(names(end=True), ['{A} |- A', '{(A >> B), A} |- B'])
+        self.assertEqual(names(end=False), ['{A, B} |- C'])
+        self.assertEqual(names(min_steps=4), ['{A, B} |- C', '{(A >> B), A} |- B'])
+        self.assertEqual(names(max_steps=4), ['{A} |- A', '{(A >> B), A} |- B'])
+        self.assertEqual(names(end=True, min_steps=2), ['{(A >> B), A} |- B'])
+        self.assertEqual(names(limit=1, offset=1), ['{A, B} |- C'])
+        self.assertEqual(names(task_name='D'), [])
+
+    def test_import_json_saves(self) -> None:
+        saves = os.path.join(self.directory.name, 'Saves')
+        os.mkdir(saves)
+        with open(os.path.join(saves, '2024-01-01_10-00.json'), 'w') as f:
+            json.dump(UnitTestSqliteDataAccess.__data('{A, B} |- C', False, 1), f)
+        with open(os.path.join(saves, '2024-01-02_10-00.json'), 'w') as f:
+            json.dump(UnitTestSqliteDataAccess.__data('{A} |- A', True, 1), f)
+        with open(os.path.join(saves, 'invalid.json'), 'w') as f:
+            f.write('{')
+
+        self.assertEqual(self.data_access.import_json_saves(saves), 2)
+        self.assertEqual([save[1] for save in self.data_access.model_list()],
+                         ['{A, B} |- C - 2024-01-01_10-00', '{A} |- A - 2024-01-02_10-00'])
+        self.assertEqual(self.data_access.import_json_saves(saves), 0)
+        self.assertEqual(len(self.data_access.model_list()), 2)
+        self.assertEqual(self.data_access.load_model(self.data_access.model_list(end=True)[0][0]),
+                         UnitTestSqliteDataAccess.__data('{A} |- A', True, 1))
+        self.assertRaises(OSError, self.data_access.import_json_saves, os.path.join(saves, 'missing'))
+
+    def test_model(self) -> None:
+        model = Model(['(A >> B)', 'A'], 'B', data_access=self.data_access)
+        self.assertTrue(model.add_step('(A >> B)', Actions.HYP))
+        self.assertTrue(model.add_step('A', Actions.HYP))
+        self.assertTrue(model.add_step('B', Actions.MP, 0, 1))
+        self.assertTrue(model.save_model())
+        path = self.data_access.model_list()[0][0]
+        loaded = Model(file_path=path, data_access=self.data_access)
+        self.assertEqual(loaded.get_steps_string(), model.get_steps_string())
+        self.assertTrue(loaded.end)
+
+
+if __name__ == "__main__":
+    unittest.main()
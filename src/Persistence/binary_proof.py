@@ -0,0 +1,222 @@
+import struct
+
+from Model.actions import Actions
+from Model.Utils.formula_parser import FormulaParser
+
+
+class BinaryProof:
+    """
+    Compact binary format of the saves. The save dictionaries (see Model.save_model) are written as:
+        header: magic, version, flags (end, content hash), number of steps, and the number of the strings, formulas,
+                hypotheses, added axioms and step records
+        string table: the distinct strings (variable names, task name, axiom details, content hash), every string
+                      is stored once, as a length and the UTF-8 bytes
+        formula table: the distinct formulas and subformulas, as fixed width records of a kind and two ids. A
+                       variable refers to its name in the string table, a negation and a binary formula refer to
+                       their members in the formula table, so every subformula is stored once. Formulas that are not
+                       reformatted formulas are stored as raw strings.
+        the consequence formula, the task name, the content hash, the hypotheses and the added axioms as ids
+        step records: fixed width records of the step id, the action code (value of Actions), the formula id, the
+                      axiom details id and the two parent step ids
+    The tables are before the steps, so the steps can be read one by one (see read_steps).
+    """
+
+    MAGIC = b'PTPB'
+    VERSION = 1
+    END_FLAG = 1
+    CONTENT_HASH_FLAG = 2
+    NO_ID = 0xFFFFFFFF
+
+    VARIABLE = 0
+    NEGATION = 1
+    RAW = 2
+    CONNECTIVES = {'>>': 3, '&': 4, '|': 5}
+
+    HEADER = struct.Struct('<4sHBIIIIII')
+    LENGTH = struct.Struct('<I')
+    FORMULA = struct.Struct('<BII')
+    STEP = struct.Struct('<IBIIII')
+
+    @staticmethod
+    def write(data: dict, file) -> None:
+        """
+        Writes the data of a save in the binary format.
+
+        Raises:
+            ValueError: if the data is not a valid save
+            OSError: if the file can't be written
+
+        Args:
+            data: dictionary contains all data of a model
+            file: binary file opened for writing
+        """
+        strings = {}
+        formulas = {}
+        string_records = []
+        formula_records = []
+
+        def string_id(string: str) -> int:
+            if not isinstance(string, str):
+                raise ValueError
+            index = strings.get(string)
+            if index is None:
+                index = strings[string] = len(string_records)
+                encoded = string.encode('utf-8')
+                string_records.append(BinaryProof.LENGTH.pack(len(encoded)) + encoded)
+            return index
+
+        def formula_id(string: str) -> int:
+            index = formulas.get(string)
+            if index is not None:
+                return index
+            try:
+                formula, bracketed = FormulaParser.parse(string)
+            except ValueError:
+                formula, bracketed = None, False
+            if not bracketed or str(formula) != string:
+                record = BinaryProof.FORMULA.pack(BinaryProof.RAW, string_id(string), 0)
+            else:
+                for subformula in formula.subformulas():
+                    if str(subformula) in formulas:
+                        continue
+                    if subformula.connective == '':
+                        record = BinaryProof.FORMULA.pack(BinaryProof.VARIABLE, string_id(subformula.name), 0)
+                    elif subformula.connective == '~':
+                        record = BinaryProof.FORMULA.pack(BinaryProof.NEGATION, formulas[str(subformula.left)], 0)
+                    else:
+                        record = BinaryProof.FORMULA.pack(BinaryProof.CONNECTIVES[subformula.connective],
+                                                          formulas[str(subformula.left)],
+                                                          formulas[str(subformula.right)])
+                    formulas[str(subformula)] = len(formula_records)
+                    formula_records.append(record)
+                return formulas[string]
+            index = formulas[string] = len(formula_records)
+            formula_records.append(record)
+            return index
+
+        try:
+            steps = []
+            for step in data['steps']:
+                step_id, formula, action, details, implication, detached = step
+                if not isinstance(action, str) or not action.startswith('Actions.'):
+                    raise ValueError
+                steps.append(BinaryProof.STEP.pack(step_id, Actions[action[len('Actions.'):]].value,
+                                                   formula_id(formula), string_id(details), implication, detached))
+            ids = [formula_id(data['consequence_formula']), string_id(data['task_name'])]
+            flags = BinaryProof.END_FLAG if data['end'] else 0
+            if data.get('content_hash') is not None:
+                ids.append(string_id(data['content_hash']))
+                flags |= BinaryProof.CONTENT_HASH_FLAG
+            ids += [formula_id(formula) for formula in data['formula_set']]
+            ids += [formula_id(formula) for formula in data['added_axioms']]
+            header = BinaryProof.HEADER.pack(BinaryProof.MAGIC, BinaryProof.VERSION, flags, data['number_of_steps'],
+                                             len(string_records), len(formula_records), len(data['formula_set']),
+                                             len(data['added_axioms']), len(steps))
+        except (KeyError, TypeError, struct.error):
+            raise ValueError
+
+        file.write(header)
+        file.write(b''.join(string_records))
+        file.write(b''.join(formula_records))
+        file.write(struct.pack('<%dI' % len(ids), *ids))
+        file.write(b''.join(steps))
+
+    @staticmethod
+    def read(file) -> dict:
+        """
+        Reads a save written by write.
+
+        Raises:
+            ValueError: if the file is not a valid binary save
+
+        Args:
+            file: binary file opened for reading
+
+        Returns:
+            Dictionary that contains all data for a model
+        """
+        steps = BinaryProof.read_steps(file)
+        data = next(steps)
+        data['steps'] = list(steps)
+        return data
+
+    @staticmethod
+    def read_steps(file):
+        """
+        Reads a save written by write, step by step. The first item is the data of the save without the steps, then
+        the steps come in their order, as lists like in the JSON saves.
+
+        Raises:
+            ValueError: if the file is not a valid binary save
+
+        Args:
+            file: binary file opened for reading
+
+        Returns:
+            generator of the data of the save and the steps
+        """
+        magic, version, flags, number_of_steps, number_of_strings, number_of_formulas, number_of_hypotheses, \
+            number_of_axioms, number_of_records = BinaryProof.HEADER.unpack(BinaryProof.__read(file,
+                                                                                                BinaryProof.HEADER.size))
+        if magic != BinaryProof.MAGIC or version != BinaryProof.VERSION:
+            raise ValueError
+
+        strings = []
+        for _ in range(number_of_strings):
+            length = BinaryProof.LENGTH.unpack(BinaryProof.__read(file, BinaryProof.LENGTH.size))[0]
+            try:
+                strings.append(BinaryProof.__read(file, length).decode('utf-8'))
+            except UnicodeDecodeError:
+                raise ValueError
+
+        binary_connectives = {code: connective for connective, code in BinaryProof.CONNECTIVES.items()}
+        formulas = []
+        try:
+            for kind, first, second in BinaryProof.FORMULA.iter_unpack(
+                    BinaryProof.__read(file, BinaryProof.FORMULA.size * number_of_formulas)):
+                if kind == BinaryProof.VARIABLE or kind == BinaryProof.RAW:
+                    formulas.append(strings[first])
+                elif kind == BinaryProof.NEGATION:
+                    formulas.append('~' + formulas[first])
+                else:
+                    formulas.append('(' + formulas[first] + ' ' + binary_connectives[kind] + ' ' +
+                                    formulas[second] + ')')
+
+            has_hash = bool(flags & BinaryProof.CONTENT_HASH_FLAG)
+            number_of_ids = 2 + has_hash + number_of_hypotheses + number_of_axioms
+            ids = struct.unpack('<%dI' % number_of_ids, BinaryProof.__read(file, 4 * number_of_ids))
+            data = {
+                'formula_set': [formulas[index] for index in ids[2 + has_hash:2 + has_hash + number_of_hypotheses]],
+                'consequence_formula': formulas[ids[0]],
+                'end': bool(flags & BinaryProof.END_FLAG),
+                'number_of_steps': number_of_steps,
+                'task_name': strings[ids[1]],
+                'added_axioms': [formulas[index] for index in ids[2 + has_hash + number_of_hypotheses:]]
+            }
+            if has_hash:
+                data['content_hash'] = strings[ids[2]]
+        except (IndexError, KeyError):
+            raise ValueError
+        yield data
+
+        for _ in range(number_of_records):
+            step_id, action, formula, details, implication, detached = BinaryProof.STEP.unpack(
+                BinaryProof.__read(file, BinaryProof.STEP.size))
+            try:
+                yield [step_id, formulas[formula], str(Actions(action)), strings[details], implication, detached]
+            except (IndexError, ValueError):
+                raise ValueError
+
+    @staticmethod
+    def __read(file, size: int) -> bytes:
+        """
+        Raises:
+            ValueError: if the file ends before size bytes
+
+        Returns:
+            the next size bytes of the file
+        """
+        content = file.read(size)
+        if len(content) != size:
+            raise ValueError
+        return content
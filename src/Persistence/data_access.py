@@ -2,16 +2,41 @@ import os
 import shutil
 import json
 
+from Persistence.binary_proof import BinaryProof
+
 
 class DataAccess:
     """
     Handles all file operations. Saving or loading windows, model's data. Handles the database.
+
+    The saves are listed from a manifest (Persistence\\saves_manifest.json), that contains the task name, the
+    timestamp, the number of steps, the size and the modification time of every save. The manifest is updated when a
+    model is saved or deleted, and an entry is only read again from its save, if the size or the modification time of
+    the save changed, so listing the saves does not parse every save.
+
+    The saves are JSON files by default. With the binary option the saves are written in the compact format of
+    BinaryProof (.proof files), that can be exported to JSON. Both formats are listed and loaded.
     
     Attributes:
         __persistence_path: (str) contains the full path to Persistence directory
+        __binary: (bool) the new saves are written in the binary format
     """
-    def __init__(self) -> None:
-        self.__persistence_path = os.path.dirname(os.path.abspath(__file__))
+
+    MANIFEST_VERSION = 1
+    BINARY_EXTENSION = '.proof'
+    KEY_SIZE = 32
+
+    def __init__(self, binary: bool = False, persistence_path: str = None) -> None:
+        """
+        Args:
+            binary: if True, the models are saved in the binary format of BinaryProof instead of JSON
+            persistence_path: the directory of the Saves and Windows directories and the manifest, the default is
+                the Persistence directory
+        """
+        if persistence_path is None:
+            persistence_path = os.path.dirname(os.path.abspath(__file__))
+        self.__persistence_path = persistence_path
+        self.__binary = binary
 
     def __get_windows_persistence_path(self) -> str:
         """
@@ -45,6 +70,43 @@ class DataAccess:
         except Exception:
             raise OSError
 
+    def __get_exports_persistence_path(self) -> str:
+        """
+        Returns
+            \\Persistence\\Exports\\ dir full path, the exported saves are written there, outside the saves
+        """
+        return os.path.join(self.__persistence_path, 'Exports')
+
+    def __get_manifest_path(self) -> str:
+        """
+        Returns
+            \\Persistence\\saves_manifest.json full path
+        """
+        return os.path.join(self.__persistence_path, 'saves_manifest.json')
+
+    def content_key(self) -> bytes:
+        """
+        Reads the local key of the content hashes of the saves (Persistence\\content_key). The key is a random
+        secret, created at the first use. The saves of other computers (with other keys) are not trusted.
+
+        Raises:
+            OSError if the key can't be read or created
+
+        Returns:
+            the key, KEY_SIZE random bytes
+        """
+        path = os.path.join(self.__persistence_path, 'content_key')
+        try:
+            with open(path, 'xb') as f:
+                f.write(os.urandom(DataAccess.KEY_SIZE))
+        except FileExistsError:
+            pass
+        with open(path, 'rb') as f:
+            key = f.read()
+        if len(key) != DataAccess.KEY_SIZE:
+            raise OSError
+        return key
+
     def windows_cleaner(self) -> None:
         """
         Delete all files in Persistence\\Windows directory.
@@ -187,8 +249,8 @@ class DataAccess:
 
     def save_model(self, data: dict) -> None:
         """
-        Function saves all data of a model to a json file. Name of the json file contains the current datetime.
-        File saved in Persistence\\Saves\\ folder.
+        Function saves all data of a model to a json file (or a binary .proof file, see the binary option). Name of
+        the file contains the current datetime. File saved in Persistence\\Saves\\ folder.
 
         Raises:
             OSError
@@ -203,7 +265,7 @@ class DataAccess:
             raise OSError
 
         now = datetime.now()
-        file = now.strftime("%Y-%m-%d_%H-%M") + '.json'
+        file = now.strftime("%Y-%m-%d_%H-%M") + (DataAccess.BINARY_EXTENSION if self.__binary else '.json')
 
         path = os.path.join(persistence, file)
 
@@ -211,27 +273,84 @@ class DataAccess:
             raise OSError
 
         try:
-            with open(path, 'w') as f:
-                json.dump(data, f)
-                f.close()
+            if self.__binary:
+                with open(path, 'wb') as f:
+                    BinaryProof.write(data, f)
+            else:
+                with open(path, 'w') as f:
+                    json.dump(data, f)
+                    f.close()
         except Exception:
+            if self.__binary and os.path.exists(path):
+                os.remove(path)
             raise OSError
 
+        manifest = self.__read_manifest()
+        manifest[file] = self.__manifest_entry(file, data, os.stat(path))
+        self.__write_manifest(manifest)
+
+    def delete_model(self, path: str) -> None:
+        """
+        Deletes a save, and removes it from the manifest of the saves.
+
+        Raises:
+            OSError
+
+        Args:
+            path: path to the json file of the save
+        """
+        os.remove(path)
+        manifest = self.__read_manifest()
+        if manifest.pop(os.path.basename(path), None) is not None:
+            self.__write_manifest(manifest)
+
+    def export_json(self, path: str, json_path: str = None) -> str:
+        """
+        Exports a save (for example a binary .proof save) to a json file. The default path is outside
+        Persistence\\Saves, so the exported file is not listed as another save.
+
+        Raises:
+            OSError if the save can't be read, or the json file exists or can't be written
+
+        Args:
+            path: path to the save
+            json_path: path of the json file, the default is Persistence\\Exports\\<name of the save>.json
+
+        Returns:
+            the path of the json file
+        """
+        if json_path is None:
+            exports = self.__get_exports_persistence_path()
+            os.makedirs(exports, exist_ok=True)
+            json_path = os.path.join(exports, os.path.splitext(os.path.basename(path))[0] + '.json')
+        if os.path.exists(json_path):
+            raise OSError
+        data = self.load_model(path)
+        try:
+            with open(json_path, 'w') as f:
+                json.dump(data, f)
+        except (TypeError, ValueError):
+            raise OSError
+        return json_path
+
     @staticmethod
     def load_model(path: str) -> dict:
         """
-        Read all data from the given file to a dictionary.
+        Read all data from the given file to a dictionary. The .proof files are read in the binary format.
 
         Raises:
             OSError
 
         Args:
-            path: path to the json file, that contains all data
+            path: path to the json (or .proof) file, that contains all data
 
         Returns:
             Dictionary that contains all data for a model
         """
         try:
+            if path.endswith(DataAccess.BINARY_EXTENSION):
+                with open(path, 'rb') as f:
+                    return BinaryProof.read(f)
             with open(path) as f:
                 data = json.load(f)
                 f.close()
@@ -245,29 +364,102 @@ class DataAccess:
         """
         Run through tha saves directory in Persistence. THe directory contains every save of model.
         Function lists all saves, and gives full path to the saves.
+        The saves are listed from the manifest, only the new and the changed saves (whose size or modification time
+        differs from the manifest) are read. The manifest is written back if it changed.
 
         Raises:
             OSError
 
         Returns:
             list of tuple. a tuple contains the file path and a string that represents the datetime and the task
-            (formula_set, consequence_formula concat).
+            (formula_set, consequence_formula concat). The saves are in the order of their names (datetime).
         """
         try:
             persistence = self.__get_saves_persistence_path()
+            entries = sorted(os.scandir(persistence), key=lambda entry: entry.name)
         except Exception:
             raise OSError
 
+        manifest = self.__read_manifest()
+        changed = False
+        saves = {}
         paths_names = []
-        try:
-            for file in os.listdir(persistence):
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            save = manifest.get(entry.name)
+            if save is None or save.get('mtime') != stat.st_mtime_ns or save.get('size') != stat.st_size:
                 try:
-                    full_path = os.path.join(persistence, file)
-                    data = self.load_model(full_path)
-                    generated_file_name = data['task_name'] + ' - ' + file[:-5]
-                    paths_names.append((full_path, generated_file_name))
+                    data = self.load_model(entry.path)
                 except OSError:
-                    continue
-        except:
-            raise OSError
+                    data = {}
+                save = self.__manifest_entry(entry.name, data if isinstance(data, dict) else {}, stat)
+                changed = True
+            saves[entry.name] = save
+            if save['task_name'] is not None:
+                paths_names.append((entry.path, save['task_name'] + ' - ' + save['timestamp']))
+
+        if changed or saves.keys() != manifest.keys():
+            self.__write_manifest(saves)
         return paths_names
+
+    @staticmethod
+    def __manifest_entry(file: str, data: dict, stat: os.stat_result) -> dict:
+        """
+        Creates the manifest entry of a save.
+
+        Args:
+            file: name of the save's file
+            data: the data of the save, empty if it could not be read
+            stat: the status of the save's file
+
+        Returns:
+            dictionary of the task name (None if the save is not valid), the timestamp, the number of steps, the
+            size and the modification time of the save
+        """
+        task_name = data.get('task_name')
+        return {
+            'task_name': task_name if isinstance(task_name, str) else None,
+            'timestamp': os.path.splitext(file)[0],
+            'number_of_steps': data.get('number_of_steps', 0),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+        }
+
+    def __read_manifest(self) -> dict:
+        """
+        Reads the manifest of the saves. A missing, unreadable or outdated manifest is read as empty, so it is built
+        again from the saves.
+
+        Returns:
+            dictionary of the saves' file names and manifest entries
+        """
+        try:
+            with open(self.__get_manifest_path()) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get('version') != DataAccess.MANIFEST_VERSION:
+            return {}
+        saves = manifest.get('saves')
+        return saves if isinstance(saves, dict) else {}
+
+    def __write_manifest(self, saves: dict) -> None:
+        """
+        Writes the manifest of the saves. The manifest is written to a temporary file first, then it replaces the
+        old manifest, so a reader never sees a half written manifest. If the manifest can't be written, the saves
+        are read again next time.
+
+        Args:
+            saves: dictionary of the saves' file names and manifest entries
+        """
+        path = self.__get_manifest_path()
+        temporary_path = path + '.tmp'
+        try:
+            with open(temporary_path, 'w') as f:
+                json.dump({'version': DataAccess.MANIFEST_VERSION, 'saves': saves}, f)
+            os.replace(temporary_path, path)
+        except OSError:
+            pass
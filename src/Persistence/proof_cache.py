@@ -0,0 +1,167 @@
+import os
+import re
+import json
+import sqlite3
+
+from Model.formula import Formula
+from Model.Utils.formula_parser import FormulaParser
+
+
+class ProofCache:
+    """
+    On-disk cache of the proofs found by the Solver, in an SQLite database. The key of a proof is the normalized
+    task: the formulas are re-formatted, the variables are renamed in the order of their first occurrence (in the
+    consequence formula, then in the hypotheses ordered by their structure), the hypotheses are deduplicated and
+    sorted. So the same task with other variable names (or other order of the hypotheses) usually gets the same key.
+    The proofs are stored with the renamed variables, and renamed back to the variables of the task, when found.
+
+    Attributes:
+        __file_path: (str) path of the database file
+    """
+
+    VARIABLES = 'ABCDFGHJKLMWRTZU'
+
+    def __init__(self, file_path: str = None) -> None:
+        """
+        Constructor for ProofCache, creates the database if it does not exist.
+
+        Raises:
+            OSError if the database can't be created
+
+        Args:
+            file_path: path of the database file, the default is Persistence/proof_cache.sqlite3
+        """
+        if file_path is None:
+            file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'proof_cache.sqlite3')
+        self.__file_path = file_path
+        try:
+            with self.__connect() as connection:
+                connection.execute('CREATE TABLE IF NOT EXISTS proofs (task TEXT PRIMARY KEY, proof TEXT NOT NULL)')
+            connection.close()
+        except sqlite3.Error:
+            raise OSError
+
+    def get(self, formula_set: list, consequence_formula: str) -> list | None:
+        """
+        Searches for the proof of the task.
+
+        Args:
+            formula_set: hypotheses of the task
+            consequence_formula: consequence formula of the task
+        Returns:
+            the steps of the proof with the variables of the task, or None if the task is not in the cache (or it
+            is invalid)
+        """
+        try:
+            task, renaming = ProofCache.normalize(formula_set, consequence_formula)
+        except ValueError:
+            return None
+        connection = self.__connect()
+        try:
+            row = connection.execute('SELECT proof FROM proofs WHERE task = ?', (task,)).fetchone()
+        except sqlite3.Error:
+            return None
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        inverse = {new: Formula.variable(old) for old, new in renaming.items()}
+        return [ProofCache.__rename_step(step, inverse) for step in json.loads(row[0])]
+
+    def put(self, formula_set: list, consequence_formula: str, proof: list) -> bool:
+        """
+        Stores the proof of the task.
+
+        Args:
+            formula_set: hypotheses of the task
+            consequence_formula: consequence formula of the task
+            proof: steps of the proof (strings of Model.get_steps_string)
+        Returns:
+            True if the proof was stored
+            False otherwise
+        """
+        try:
+            task, renaming = ProofCache.normalize(formula_set, consequence_formula)
+            binding = {old: Formula.variable(new) for old, new in renaming.items()}
+            proof = [ProofCache.__rename_step(step, binding) for step in proof]
+        except ValueError:
+            return False
+        connection = self.__connect()
+        try:
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO proofs (task, proof) VALUES (?, ?)',
+                                   (task, json.dumps(proof)))
+        except sqlite3.Error:
+            return False
+        finally:
+            connection.close()
+        return True
+
+    @staticmethod
+    def normalize(formula_set: list, consequence_formula: str) -> (str, dict):
+        """
+        Normalizes the task.
+
+        Raises:
+            ValueError: if one of the formulas is invalid, or the task has too many variables
+
+        Args:
+            formula_set: hypotheses of the task
+            consequence_formula: consequence formula of the task
+        Returns:
+            Tuple of the normalized task as a string, and the renaming: variable of the task -> its new name
+        """
+        if not isinstance(formula_set, list) or not isinstance(consequence_formula, str):
+            raise ValueError
+        consequence = FormulaParser.parse(consequence_formula)[0]
+        hypotheses = {FormulaParser.parse(formula)[0] for formula in formula_set}
+        hypotheses = sorted(hypotheses, key=lambda formula: (re.sub('[A-Z]', '_', str(formula)), str(formula)))
+
+        renaming = {}
+        for formula in [consequence] + hypotheses:
+            for variable in re.findall('[A-Z]', str(formula)):
+                if variable not in renaming:
+                    if len(renaming) == len(ProofCache.VARIABLES):
+                        raise ValueError
+                    renaming[variable] = ProofCache.VARIABLES[len(renaming)]
+
+        binding = {old: Formula.variable(new) for old, new in renaming.items()}
+        task = [sorted(str(formula.substitute(binding)) for formula in hypotheses),
+                str(consequence.substitute(binding))]
+        return json.dumps(task), renaming
+
+    @staticmethod
+    def __rename_step(step: str, binding: dict) -> str:
+        """
+        Renames the variables of a step's string, in the formula and in the substitutions of an axiom. The
+        variables of the axiom itself are kept.
+
+        Raises:
+            ValueError: if the step's string is invalid
+
+        Args:
+            step: string of the step, like '2. (A >> B) [AXIOM: 1. A=A B=(A >> B)]'
+            binding: variable -> the variable formula it is renamed to
+        Returns:
+            the string of the step with the new variables
+        """
+        match = re.fullmatch(r'(\d+\. )(.+) \[(.+)\]', step)
+        if match is None:
+            raise ValueError
+        number, formula, details = match.groups()
+        formula = str(FormulaParser.parse(formula)[0].substitute(binding))
+        if details.startswith('AXIOM:'):
+            parts = re.split(r' ([A-Z])=', details)
+            for index in range(2, len(parts), 2):
+                parts[index] = str(FormulaParser.parse(parts[index])[0].substitute(binding))
+            details = parts[0] + ''.join(' ' + parts[index] + '=' + parts[index + 1]
+                                         for index in range(1, len(parts), 2))
+        return number + formula + ' [' + details + ']'
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Returns:
+            new connection to the database, every operation uses its own connection, so the cache can be shared by
+            processes
+        """
+        return sqlite3.connect(self.__file_path, timeout=30)
@@ -0,0 +1,282 @@
+import os
+import json
+import sqlite3
+from datetime import datetime
+
+from Persistence.data_access import DataAccess
+
+
+class SqliteDataAccess(DataAccess):
+    """
+    Stores the saves of the models in an SQLite database, instead of the JSON files of Persistence\\Saves. The task
+    name, the timestamp, the end status and the number of steps of a save are indexed columns of the saves table, the
+    data of the saves is in a separate table, so the saves can be listed and filtered without reading the saved
+    data. A save is identified by its id, the path of a save is 'sqlite:<id>', that can be used like the path of a
+    JSON save. The windows are handled like in DataAccess.
+
+    Attributes:
+        __file_path: (str) path of the database file
+    """
+
+    PATH_PREFIX = 'sqlite:'
+
+    def __init__(self, file_path: str = None) -> None:
+        """
+        Constructor for SqliteDataAccess, creates the database if it does not exist.
+
+        Raises:
+            OSError if the database can't be created
+
+        Args:
+            file_path: path of the database file, the default is Persistence/saves.sqlite3
+        """
+        super(SqliteDataAccess, self).__init__()
+        if file_path is None:
+            file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saves.sqlite3')
+        self.__file_path = file_path
+        connection = None
+        try:
+            connection = self.__connect()
+            with connection:
+                connection.execute('CREATE TABLE IF NOT EXISTS saves ('
+                                   'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                                   'task_name TEXT NOT NULL, '
+                                   'timestamp TEXT NOT NULL, '
+                                   'end_status INTEGER NOT NULL, '
+                                   'number_of_steps INTEGER NOT NULL, '
+                                   'source TEXT UNIQUE)')
+                connection.execute('CREATE TABLE IF NOT EXISTS save_data ('
+                                   'id INTEGER PRIMARY KEY REFERENCES saves (id), '
+                                   'data TEXT NOT NULL)')
+                for column in ('task_name', 'timestamp', 'end_status', 'number_of_steps'):
+                    connection.execute('CREATE INDEX IF NOT EXISTS saves_' + column + ' ON saves (' + column + ')')
+        except sqlite3.Error:
+            raise OSError
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def save_model(self, data: dict) -> None:
+        """
+        Saves all data of a model to the database. The timestamp of the save contains the current datetime, the
+        saves made in the same minute don't collide.
+
+        Raises:
+            OSError
+
+        Args:
+            data: dictionary contains all data of the model, that calls this function
+        """
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        connection = None
+        try:
+            connection = self.__connect()
+            with connection:
+                SqliteDataAccess.__insert(connection, data, timestamp)
+        except (sqlite3.Error, KeyError, TypeError, ValueError):
+            raise OSError
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def load_model(self, path: str) -> dict:
+        """
+        Read all data of the save to a dictionary.
+
+        Raises:
+            OSError
+
+        Args:
+            path: path of the save, 'sqlite:<id>'
+
+        Returns:
+            Dictionary that contains all data for a model
+        """
+        save_id = SqliteDataAccess.__save_id(path)
+        connection = None
+        try:
+            connection = self.__connect()
+            row = connection.execute('SELECT data FROM save_data WHERE id = ?', (save_id,)).fetchone()
+            if row is None:
+                raise OSError
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            raise OSError
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def delete_model(self, path: str) -> None:
+        """
+        Deletes a save.
+
+        Raises:
+            OSError if the save does not exist
+
+        Args:
+            path: path of the save, 'sqlite:<id>'
+        """
+        save_id = SqliteDataAccess.__save_id(path)
+        connection = None
+        try:
+            connection = self.__connect()
+            with connection:
+                if connection.execute('DELETE FROM saves WHERE id = ?', (save_id,)).rowcount == 0:
+                    raise OSError
+                connection.execute('DELETE FROM save_data WHERE id = ?', (save_id,))
+        except sqlite3.Error:
+            raise OSError
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def model_list(self,
+                   task_name: str = None,
+                   end: bool = None,
+                   min_steps: int = None,
+                   max_steps: int = None,
+                   limit: int = None,
+                   offset: int = 0) -> list:
+        """
+        Lists the saves, only the indexed columns are read. The saves can be filtered by the indexed columns.
+
+        Raises:
+            OSError
+
+        Args:
+            task_name: if given, only the saves whose task name contains it are listed
+            end: if given, only the saves with this end status are listed
+            min_steps: if given, only the saves with at least this number of steps are listed
+            max_steps: if given, only the saves with at most this number of steps are listed
+            limit: if given, at most this number of saves are listed
+            offset: number of the saves skipped from the beginning of the list
+
+        Returns:
+            list of tuple. a tuple contains the path of the save and a string that represents the task
+            (formula_set, consequence_formula concat) and the datetime. The saves are in the order of their
+            timestamps.
+        """
+        conditions = []
+        params = []
+        if task_name is not None:
+            conditions.append('instr(task_name, ?) > 0')
+            params.append(task_name)
+        if end is not None:
+            conditions.append('end_status = ?')
+            params.append(int(end))
+        if min_steps is not None:
+            conditions.append('number_of_steps >= ?')
+            params.append(min_steps)
+        if max_steps is not None:
+            conditions.append('number_of_steps <= ?')
+            params.append(max_steps)
+        query = 'SELECT id, task_name, timestamp FROM saves'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY timestamp, id LIMIT ? OFFSET ?'
+        params += [-1 if limit is None else limit, offset]
+
+        connection = None
+        try:
+            connection = self.__connect()
+            rows = connection.execute(query, params).fetchall()
+        except sqlite3.Error:
+            raise OSError
+        finally:
+            if connection is not None:
+                connection.close()
+        return [(SqliteDataAccess.PATH_PREFIX + str(save_id), name + ' - ' + timestamp)
+                for save_id, name, timestamp in rows]
+
+    def import_json_saves(self, directory: str = None) -> int:
+        """
+        Imports the JSON saves of a directory into the database, in one transaction. The file names are
+        remembered, so importing the same directory again does not duplicate the saves. The files, that are not
+        valid saves, are skipped. The JSON files are not deleted.
+
+        Raises:
+            OSError if the directory can't be read, or the database can't be written
+
+        Args:
+            directory: the directory of the JSON saves, the default is Persistence\\Saves
+
+        Returns:
+            number of the imported saves
+        """
+        if directory is None:
+            directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Saves')
+        try:
+            files = sorted(file for file in os.listdir(directory) if file.endswith('.json'))
+        except OSError:
+            raise OSError
+
+        imported = 0
+        connection = None
+        try:
+            connection = self.__connect()
+            with connection:
+                for file in files:
+                    try:
+                        data = DataAccess.load_model(os.path.join(directory, file))
+                        if SqliteDataAccess.__insert(connection, data, file[:-5], source=file):
+                            imported += 1
+                    except (OSError, KeyError, TypeError, ValueError):
+                        continue
+        except sqlite3.Error:
+            raise OSError
+        finally:
+            if connection is not None:
+                connection.close()
+        return imported
+
+    @staticmethod
+    def __insert(connection: sqlite3.Connection, data: dict, timestamp: str, source: str = None) -> bool:
+        """
+        Inserts a save into the database, the transaction is handled by the caller.
+
+        Raises:
+            KeyError, TypeError, ValueError: if the data is not a valid save
+
+        Args:
+            connection: connection to the database
+            data: dictionary contains all data of the model
+            timestamp: timestamp of the save
+            source: name of the imported JSON file, None for the new saves
+
+        Returns:
+            True if the save was inserted, False if the source was already imported
+        """
+        if not isinstance(data['task_name'], str):
+            raise ValueError
+        cursor = connection.execute('INSERT OR IGNORE INTO saves '
+                                    '(task_name, timestamp, end_status, number_of_steps, source) '
+                                    'VALUES (?, ?, ?, ?, ?)',
+                                    (data['task_name'], timestamp, int(bool(data['end'])),
+                                     int(data['number_of_steps']), source))
+        if cursor.rowcount != 1:
+            return False
+        connection.execute('INSERT INTO save_data (id, data) VALUES (?, ?)', (cursor.lastrowid, json.dumps(data)))
+        return True
+
+    @staticmethod
+    def __save_id(path: str) -> int:
+        """
+        Raises:
+            OSError if the path is not the path of a save in the database
+
+        Returns:
+            the id of the save
+        """
+        if not isinstance(path, str) or not path.startswith(SqliteDataAccess.PATH_PREFIX):
+            raise OSError
+        try:
+            return int(path[len(SqliteDataAccess.PATH_PREFIX):])
+        except ValueError:
+            raise OSError
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Returns:
+            new connection to the database, every operation uses its own connection
+        """
+        return sqlite3.connect(self.__file_path, timeout=30)
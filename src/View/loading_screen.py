@@ -1,5 +1,3 @@
-import os
-
 from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import QDialog
 from PyQt5.QtCore import Qt
@@ -117,8 +115,15 @@ class LoadingScreen(QDialog):
             msg_box.exec_()
 
     def __delete_save(self, path: str) -> None:
+        """
+        Deletes the save, and lists the saves again.
+
+        Args:
+            path: full path to a saved file in the Persistence.Saves
+        """
+        from Persistence.data_access import DataAccess
         try:
-            os.remove(path)
+            DataAccess().delete_model(path)
         except OSError:
             msg_box = QtWidgets.QMessageBox()
             msg_box.setWindowTitle('Warning')
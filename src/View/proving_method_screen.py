@@ -9,11 +9,14 @@ from Model.model import Model
 from Model.actions import Actions
 from Model.task_is_not_provable_exception import TaskIsNotProvableException
 from Model.formula_in_steps_exception import FormulaInStepsException
+from Model.solver_result import SolverResult
+from Model.solver_status import SolverStatus
 
 from View.welcome_screen import WelcomeScreen
 from View.hyp_dialog import HypDialog
 from View.axiom_dialog import AxiomDialog
 from View.help_dialog import HelpDialog
+from View.solver_worker import SolverWorker
 
 
 class ProvingMethodScreen(QDialog):
@@ -27,7 +30,9 @@ class ProvingMethodScreen(QDialog):
         MTP - use the modus tollendo ponens detaching rule to the two steps given by user
         MPT - use the modus ponendo tollens detaching rule to the two steps given by user
         CS - use the conditional syllogism rule to the two steps given by user
-        HINT - gives hint for using syntax rule if possible
+        HINT - gives hint for using syntax rule if possible, the hint is searched in the background, meanwhile the
+            buttons changing the steps are disabled
+        SOLVE - solves the task in the background and shows the proof, while solving the button cancels it
         ADD AXIOM - user can add an axiom, it is only added if the formula is a real axiom
         USE ADDED AXIOM - use added axiom, if the user added at all
         DELETE LINES - delete steps if the user want to
@@ -45,9 +50,13 @@ class ProvingMethodScreen(QDialog):
         __outer_layout (QGridLayout): grid layout that contains tha axioms, actions, additions, proving_method layouts
             and the save, home buttons
         __model (Model): handles proving method logic
+        __worker (SolverWorker): the running background solving or hint search, or None
+        __progress_label (QLabel): shows the progress of the background solving
 
     """
 
+    SOLVE_TIME_LIMIT = 60
+
     def __init__(self, widget: QtWidgets.QWidget) -> None:
         """
         Initialize the ProvingMethodScreen using the window_xmls\\proving_method_screen.ui xml file.
@@ -85,6 +94,8 @@ class ProvingMethodScreen(QDialog):
         self.__mpt_action_button = QtWidgets.QPushButton('MPT')
         self.__cs_action_button = QtWidgets.QPushButton('CS')
         self.__hint_button = QtWidgets.QPushButton('HINT')
+        self.__solve_button = QtWidgets.QPushButton('SOLVE')
+        self.__progress_label = QtWidgets.QLabel('')
         self.__add_axiom_button = QtWidgets.QPushButton('ADD AXIOM')
         self.__use_added_axiom_button = QtWidgets.QPushButton('USE ADDED AXIOM')
         self.__delete_lines_button = QtWidgets.QPushButton('DELETE LINES')
@@ -92,6 +103,7 @@ class ProvingMethodScreen(QDialog):
         self.__prev_button = QtWidgets.QPushButton('PREV')
         self.__current_proving_method_layout = 0
         self.__model = None
+        self.__worker = None
 
     def init_model_with_new_config(self) -> None:
         """
@@ -185,8 +197,9 @@ class ProvingMethodScreen(QDialog):
 
     def __go_to_welcome(self) -> None:
         """
-        Initializes a WelcomeScreen and gives the focus the that new screen.
+        Initializes a WelcomeScreen and gives the focus the that new screen. The background run is cancelled.
         """
+        self.__stop_worker()
         welcome_screen = WelcomeScreen(self.__widget)
         self.__widget.addWidget(welcome_screen)
         self.__widget.setCurrentIndex(self.__widget.currentIndex() + 1)
@@ -276,6 +289,10 @@ class ProvingMethodScreen(QDialog):
         self.__hint_button.clicked.connect(self.__hint_action)
         self.__hint_button.setFont(QtGui.QFont("MS Shell Dlg 2", weight=QtGui.QFont.Bold))
 
+        self.__additions_layout.addWidget(self.__solve_button)
+        self.__solve_button.clicked.connect(self.__solve_action)
+        self.__solve_button.setFont(QtGui.QFont("MS Shell Dlg 2", weight=QtGui.QFont.Bold))
+
         self.__additions_layout.addWidget(self.__add_axiom_button)
         self.__add_axiom_button.clicked.connect(self.__add_axiom_button_action)
         self.__add_axiom_button.setFont(QtGui.QFont("MS Shell Dlg 2", weight=QtGui.QFont.Bold))
@@ -301,6 +318,10 @@ class ProvingMethodScreen(QDialog):
         self.__axiom_layout.addLayout(self.__actions_2_layout)
         self.__axiom_layout.addLayout(self.__additions_layout)
 
+        self.__progress_label.setFont(QtGui.QFont("MS Shell Dlg 2", 10))
+        self.__progress_label.setStyleSheet('color:white')
+        self.__axiom_layout.addWidget(self.__progress_label)
+
     def __set_proving_method_layout(self) -> None:
         """
         Deletes all labels int the proving_method layout. Then sets new labels, that represents the
@@ -589,13 +610,24 @@ class ProvingMethodScreen(QDialog):
 
     def __hint_action(self) -> None:
         """
-        Tries to give hint to the user. Calls the model's get_hint function, if it returns a tuple, that
-        first element is True, then raises a message box with the remaining data of the return value contains
-        hint to modus ponens. Otherwise, if the model can't give any hint, then it raises a message box that tells,
-        there is no option for using the modus ponens rule.
+        Tries to give hint to the user. Starts a SolverWorker, that searches for the hint in the background, the
+        __show_hint function shows its result. If a background run is going on, the button does nothing.
+        """
+        if self.__worker is not None:
+            return
+        self.__start_worker(SolverWorker.HINT)
+        self.__worker.hint_found.connect(self.__show_hint)
+
+    def __show_hint(self, current_hint: tuple) -> None:
+        """
+        If the hint's first element is True, then raises a message box with the remaining data of the hint, that
+        contains the formulas of a syntax rule usage. Otherwise, if the model can't give any hint, then it raises a
+        message box that tells, there is no option for using a syntax rule.
+
+        Args:
+            current_hint: tuple of the success flag, and the two formulas of the rule usage
         """
         from View.Utils.utils import text_formatter
-        current_hint = list(self.__model.get_hint())
         if current_hint[0]:
             message_box = QtWidgets.QMessageBox()
             message_box.setWindowTitle('Hint!')
@@ -608,6 +640,125 @@ class ProvingMethodScreen(QDialog):
             message_box.setText("Can't execute rule!")
             message_box.exec_()
 
+    def __solve_action(self) -> None:
+        """
+        Starts solving the task in the background with a SolverWorker, the __show_solution function shows its
+        result. If the solving is already going on, the button cancels it. While a hint is searched, the button is
+        disabled, and it does nothing.
+        """
+        if self.__worker is not None:
+            if self.__worker.mode == SolverWorker.SOLVE:
+                self.__worker.cancel()
+            return
+        self.__start_worker(SolverWorker.SOLVE, ProvingMethodScreen.SOLVE_TIME_LIMIT)
+        self.__worker.solved.connect(self.__show_solution)
+        self.__solve_button.setText('CANCEL')
+
+    def __show_solution(self, result: SolverResult) -> None:
+        """
+        Shows the proof of the task in a message box, or tells the user, that the task couldn't be proved.
+
+        Args:
+            result: result of the Solver
+        """
+        from View.Utils.utils import text_formatter
+        message_box = QtWidgets.QMessageBox()
+        if result.proved:
+            message_box.setWindowTitle('Solution')
+            message_box.setText('\n'.join(text_formatter(step) for step in result.proof))
+        else:
+            message_box.setWindowTitle('Warning!')
+            if result.status == SolverStatus.BUDGET_EXHAUSTED:
+                message_box.setText("Can't prove the task in " + str(ProvingMethodScreen.SOLVE_TIME_LIMIT) +
+                                    ' seconds!')
+            else:
+                message_box.setText("Can't prove the task!")
+        message_box.exec_()
+
+    def __start_worker(self, mode: str, time_limit: float = None) -> None:
+        """
+        Starts a SolverWorker with the current model, and connects its progress and end signals. The hint button is
+        disabled while the worker runs, and for a hint search (that uses the model) the buttons changing the model
+        and the solve button are disabled too. The worker is deleted after its thread has finished.
+
+        Args:
+            mode: SolverWorker.SOLVE or SolverWorker.HINT
+            time_limit: seconds the run may take, None means no limit
+        """
+        worker = SolverWorker(mode, self.__model, time_limit)
+        worker.progress.connect(self.__show_progress)
+        worker.failed.connect(self.__show_worker_error)
+        worker.finished.connect(lambda: self.__on_worker_finished(worker))
+        worker.finished.connect(worker.deleteLater)
+        self.__worker = worker
+        self.__hint_button.setEnabled(False)
+        if mode == SolverWorker.HINT:
+            self.__set_model_buttons_enabled(False)
+        self.__progress_label.setText('Searching...')
+        worker.start()
+
+    def __show_progress(self, number_of_steps: int, elapsed: float) -> None:
+        """
+        Shows the progress of the background run.
+
+        Args:
+            number_of_steps: number of the steps generated so far
+            elapsed: seconds since the run started
+        """
+        self.__progress_label.setText('Searching... ' + str(number_of_steps) + ' steps, ' +
+                                      str(round(elapsed, 1)) + ' s')
+
+    def __show_worker_error(self, message: str) -> None:
+        """
+        Raises a message box, if the background run stopped with an error.
+
+        Args:
+            message: the error message
+        """
+        message_box = QtWidgets.QMessageBox()
+        message_box.setWindowTitle('Warning!')
+        message_box.setText('Something went wrong: ' + message)
+        message_box.exec_()
+
+    def __on_worker_finished(self, worker: SolverWorker) -> None:
+        """
+        Waits for the end of the worker's thread, then resets the buttons and the progress label after the
+        background run. If the worker was already stopped (see __stop_worker), only waits for it.
+
+        Args:
+            worker: the finished worker
+        """
+        worker.wait()
+        if worker is not self.__worker:
+            return
+        self.__worker = None
+        self.__hint_button.setEnabled(True)
+        self.__set_model_buttons_enabled(True)
+        self.__solve_button.setText('SOLVE')
+        self.__progress_label.setText('')
+
+    def __set_model_buttons_enabled(self, enabled: bool) -> None:
+        """
+        Enables or disables the buttons, that change or save the model, and the solve button.
+
+        Args:
+            enabled: True enables, False disables the buttons
+        """
+        for button in (self.__hyp_action_button, self.__axiom_action_button, self.__mp_action_button,
+                       self.__mt_action_button, self.__mtp_action_button, self.__mpt_action_button,
+                       self.__cs_action_button, self.__add_axiom_button, self.__use_added_axiom_button,
+                       self.__delete_lines_button, self.__save_button, self.__solve_button):
+            button.setEnabled(enabled)
+
+    def __stop_worker(self) -> None:
+        """
+        Cancels the background run, and waits for its end.
+        """
+        if self.__worker is not None:
+            self.__worker.cancel()
+            self.__worker.wait()
+            self.__worker = None
+
     def __add_axiom_button_action(self) -> None:
         """
         Gives an opportunity to the user, to add an axiom. Shows a QInputDialog where the user can type a formula, and
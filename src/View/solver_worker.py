@@ -0,0 +1,103 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from Model.model import Model
+from Model.solver import Solver
+from Model.solver_budget import SolverBudget
+from Model.budget_exhausted_exception import BudgetExhaustedException
+
+
+class SolverWorker(QThread):
+    """
+    Runs the Solver or the hint search in the background, so the screen stays responsive. The solving uses its own
+    copy of the task. The hint search uses the model of the screen, so the model's hint frontier is kept between
+    the hints; the screen must not change the model until the worker has finished. The results are posted back
+    with signals, that are delivered in the GUI thread.
+
+    Signals:
+        progress(int, float): number of the steps and the elapsed seconds, emitted regularly
+        solved(object): the SolverResult of the solving
+        hint_found(object): (success_flag, implication, detached) tuple, like Model.get_hint
+        cancelled(): the run was cancelled
+        failed(str): the run stopped with an error
+
+    Attributes:
+        __mode: (str) SOLVE or HINT
+        __formula_set: (str list) formula set of the task
+        __consequence_formula: (str) consequence formula of the task
+        __model: (Model) the model of the screen, used by the hint search
+        __budget: (SolverBudget) limits of the run, it is also used for cancelling the run and reporting the progress
+    """
+
+    SOLVE = 'solve'
+    HINT = 'hint'
+
+    progress = pyqtSignal(int, float)
+    solved = pyqtSignal(object)
+    hint_found = pyqtSignal(object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, mode: str, model: Model, time_limit: float = None) -> None:
+        """
+        Constructor for SolverWorker, copies the task of the model for the solving.
+
+        Args:
+            mode: SOLVE for solving the task, HINT for searching a hint
+            model: the model of the screen
+            time_limit: seconds the run may take, None means no limit
+        """
+        super(SolverWorker, self).__init__()
+        self.__mode = mode
+        self.__formula_set = list(model.formula_set)
+        self.__consequence_formula = model.consequence_formula
+        self.__model = model
+        self.__budget = SolverBudget(time_limit=time_limit, progress=self.progress.emit)
+
+    @property
+    def mode(self) -> str:
+        """
+        Returns:
+            SOLVE or HINT
+        """
+        return self.__mode
+
+    def cancel(self) -> None:
+        """
+        Cancels the run, the worker stops at the next check of its budget.
+        """
+        self.__budget.cancel()
+
+    def run(self) -> None:
+        """
+        The body of the thread, runs the solving or the hint search, and emits the result.
+        """
+        try:
+            if self.__mode == SolverWorker.SOLVE:
+                self.__solve()
+            else:
+                self.__hint()
+        except BudgetExhaustedException as exception:
+            if exception.reason == 'cancelled':
+                self.cancelled.emit()
+            else:
+                self.failed.emit(str(exception))
+        except Exception as exception:
+            self.failed.emit(str(exception))
+
+    def __solve(self) -> None:
+        """
+        Solves the task with a new model, then emits the result.
+        """
+        model = Model(self.__formula_set, self.__consequence_formula)
+        result = Solver.run(model, backward=True, budget=self.__budget)
+        if self.__budget.cancelled:
+            self.cancelled.emit()
+        else:
+            self.solved.emit(result)
+
+    def __hint(self) -> None:
+        """
+        Searches for a hint with the model's hint frontier (see Model.get_hint), then emits the hint.
+        """
+        self.__budget.start()
+        self.hint_found.emit(self.__model.get_hint(self.__budget))